@@ -104,6 +104,8 @@ class ActivityPanel(QtWidgets.QGroupBox):
 
 class MainWindow(QtWidgets.QMainWindow):
     """Main application window with sidebar navigation."""
+
+    log_event_received = QtCore.Signal(dict)
     
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
@@ -173,7 +175,10 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self._update_environment()
 
-        register_listener(self.on_log_event)
+        # Kanban audit summaries may be logged from a background thread;
+        # the queued signal delivers them to the UI thread.
+        self.log_event_received.connect(self.on_log_event)
+        register_listener(self.log_event_received.emit)
         log_event("ui", "Operator console launched (new layout)", details={"profile": get_active_profile_name()})
 
         # Set default section to Kanban
@@ -5,11 +5,16 @@ from __future__ import annotations
 __version__ = "1.1.0"
 
 __all__ = [
+    "archive",
     "auth",
     "database",
+    "dependency_graph",
+    "local_replica",
     "manager",
     "models",
+    "reference_cache",
     "security",
+    "synthetic_data",
 ]
 
 
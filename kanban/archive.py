@@ -0,0 +1,263 @@
+"""Hot/cold split for tasks: move finished tasks to the archive tables and read across both."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, case, delete, func, insert, literal, or_, select, union_all
+from sqlalchemy.orm import Session, aliased
+
+from kanban.audit_logger import SNAPSHOT_VERSION, AuditLogger
+from kanban.database import DatabaseManager
+from kanban.models import (
+    KanbanActivityLog,
+    KanbanActivityLogArchive,
+    KanbanAttachment,
+    KanbanAttachmentArchive,
+    KanbanColumn,
+    KanbanComment,
+    KanbanCommentArchive,
+    KanbanTask,
+    KanbanTaskArchive,
+)
+
+# Alias of the hot + archive UNION ALL; search vectors over it must use this name
+ALL_TASKS = "all_tasks"
+
+
+@dataclass
+class ArchivePolicy:
+    """How long tasks stay in the hot table once they are finished."""
+
+    # Tasks in the Done column, counted from completed_at
+    completed_days: int = 90
+    # status = 'archived', counted from the last update
+    archived_days: int = 30
+    # Soft-deleted tasks, counted from deleted_at
+    deleted_days: int = 30
+    batch_size: int = 500
+
+    @classmethod
+    def from_config(cls, db_manager: DatabaseManager) -> "ArchivePolicy":
+        """Policy from the ``archive`` section of the database config (defaults otherwise)."""
+        archive_config = (getattr(db_manager, "config", None) or {}).get("archive", {})
+        return cls(**{key: int(value) for key, value in archive_config.items() if key in cls.__dataclass_fields__})
+
+
+def archive_reason():
+    """Why a hot task is due: deleted, archived or completed (checked in that order)."""
+    return case(
+        (KanbanTask.is_deleted == True, "deleted"),  # noqa: E712
+        (KanbanTask.status == "archived", "archived"),
+        else_="completed",
+    )
+
+
+def due_condition(policy: ArchivePolicy, now: datetime):
+    """WHERE clause for hot tasks the policy moves to the archive (needs a join to kanban_columns)."""
+    live = KanbanTask.is_deleted == False  # noqa: E712
+    return or_(
+        and_(KanbanTask.is_deleted == True, KanbanTask.deleted_at < now - timedelta(days=policy.deleted_days)),  # noqa: E712
+        and_(live, KanbanTask.status == "archived", KanbanTask.updated_at < now - timedelta(days=policy.archived_days)),
+        and_(
+            live,
+            KanbanColumn.name == "Done",
+            KanbanTask.completed_at < now - timedelta(days=policy.completed_days),
+        ),
+    )
+
+
+def count_due_tasks(session: Session, policy: ArchivePolicy) -> Dict[str, int]:
+    """Number of hot tasks the policy would archive, per reason."""
+    now = session.query(func.localtimestamp()).scalar()
+    reason = archive_reason()
+    rows = (
+        session.query(reason, func.count(KanbanTask.id))
+        .join(KanbanColumn, KanbanColumn.id == KanbanTask.column_id)
+        .filter(due_condition(policy, now))
+        .group_by(reason)
+        .all()
+    )
+    return {reason: int(count) for reason, count in rows}
+
+
+def archive_batch(session: Session, policy: ArchivePolicy) -> int:
+    """
+    Move one batch of due tasks and everything hanging off them to the archive tables.
+
+    Rows are copied by column name (INSERT ... SELECT) and then deleted from
+    the hot tables; comments, attachments and dependencies go with the task
+    through ON DELETE CASCADE. Due tasks are locked with SKIP LOCKED so rows
+    being edited right now wait for the next run. The caller commits.
+
+    Args:
+        session: Open session (one transaction per batch)
+        policy: Archive policy
+
+    Returns:
+        Number of tasks archived (0 once nothing is due)
+    """
+    now = session.query(func.localtimestamp()).scalar()
+    task_ids: List[int] = [
+        task_id
+        for (task_id,) in session.query(KanbanTask.id)
+        .join(KanbanColumn, KanbanColumn.id == KanbanTask.column_id)
+        .filter(due_condition(policy, now))
+        .order_by(KanbanTask.id)
+        .limit(policy.batch_size)
+        .with_for_update(of=KanbanTask, skip_locked=True)
+    ]
+    if not task_ids:
+        return 0
+
+    def copy_rows(hot, archive, task_id_column, *extra):
+        names = [column.name for column in hot.__table__.columns]
+        extra_names = [value.key for value in extra]
+        session.execute(
+            insert(archive).from_select(
+                names + extra_names,
+                select(*hot.__table__.columns, *extra).where(task_id_column.in_(task_ids)),
+            )
+        )
+
+    archived_at = literal(now).label("archived_at")
+    copy_rows(KanbanTask, KanbanTaskArchive, KanbanTask.id, archived_at, archive_reason().label("archive_reason"))
+    copy_rows(KanbanComment, KanbanCommentArchive, KanbanComment.task_id, archived_at)
+    copy_rows(KanbanAttachment, KanbanAttachmentArchive, KanbanAttachment.task_id, archived_at)
+    copy_rows(KanbanActivityLog, KanbanActivityLogArchive, KanbanActivityLog.task_id, archived_at)
+
+    # Activity first: its task_id would otherwise be set to NULL by the task delete
+    session.execute(delete(KanbanActivityLog).where(KanbanActivityLog.task_id.in_(task_ids)))
+    session.execute(delete(KanbanTask).where(KanbanTask.id.in_(task_ids)))
+    return len(task_ids)
+
+
+def archive_due_tasks(
+    db_manager: DatabaseManager, policy: Optional[ArchivePolicy] = None, max_batches: Optional[int] = None
+) -> int:
+    """
+    Archive every due task in batches of ``policy.batch_size``, one transaction per batch.
+
+    Args:
+        db_manager: Database manager instance
+        policy: Archive policy (default: ArchivePolicy.from_config)
+        max_batches: Stop after this many batches (None = until nothing is due)
+
+    Returns:
+        Total number of tasks archived
+    """
+    policy = policy or ArchivePolicy.from_config(db_manager)
+    total = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        session = db_manager.get_session()
+        try:
+            moved = archive_batch(session, policy)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+        if not moved:
+            break
+        total += moved
+        batches += 1
+        print(f"[Archive] Archived {moved} tasks (batch {batches}, {total} total)")
+    return total
+
+
+def rebase_task_snapshots(db_manager: DatabaseManager, cutoff: datetime, batch_size: int = 500) -> int:
+    """
+    Turn each task's first snapshot from ``cutoff`` on into a full checkpoint.
+
+    Dropping the activity-log partitions before ``cutoff`` would otherwise
+    take the checkpoints the later deltas build on with it, and
+    KanbanManager.get_task_state_at would return None for those tasks.
+    Each first delta is replaced by a checkpoint of the state it describes
+    (same seq), so the kept history replays on its own. Run it before
+    detaching the old partitions.
+
+    Args:
+        db_manager: Database manager instance
+        cutoff: First timestamp that stays online
+        batch_size: Rows rewritten per transaction
+
+    Returns:
+        Number of snapshots rewritten
+    """
+    has_snapshot = func.jsonb_typeof(KanbanActivityLog.task_snapshot) == "object"
+    session = db_manager.get_session()
+    try:
+        first_snapshots = (
+            session.query(KanbanActivityLog.id, KanbanActivityLog.task_id, KanbanActivityLog.task_snapshot)
+            .filter(KanbanActivityLog.created_at >= cutoff, KanbanActivityLog.task_id.isnot(None), has_snapshot)
+            .distinct(KanbanActivityLog.task_id)
+            .order_by(KanbanActivityLog.task_id, KanbanActivityLog.id)
+            .all()
+        )
+    finally:
+        session.close()
+    deltas = [(activity_id, task_id, snapshot) for activity_id, task_id, snapshot in first_snapshots
+              if snapshot.get("kind") == "delta"]
+
+    rewritten = 0
+    for start in range(0, len(deltas), batch_size):
+        session = db_manager.get_session()
+        try:
+            for activity_id, task_id, snapshot in deltas[start:start + batch_size]:
+                task_rows = session.query(KanbanActivityLog).filter(
+                    KanbanActivityLog.task_id == task_id, KanbanActivityLog.id <= activity_id, has_snapshot
+                )
+                # Pre-delta snapshots have no "kind" and are full states
+                checkpoint_id = task_rows.filter(
+                    func.coalesce(KanbanActivityLog.task_snapshot["kind"].as_string(), "checkpoint") == "checkpoint"
+                ).with_entities(func.max(KanbanActivityLog.id)).scalar()
+                if checkpoint_id is None:
+                    continue
+                state = AuditLogger.replay_snapshots([
+                    row_snapshot
+                    for (row_snapshot,) in task_rows.filter(KanbanActivityLog.id >= checkpoint_id)
+                    .with_entities(KanbanActivityLog.task_snapshot)
+                    .order_by(KanbanActivityLog.id)
+                ])
+                session.query(KanbanActivityLog).filter(
+                    KanbanActivityLog.id == activity_id, KanbanActivityLog.created_at >= cutoff
+                ).update(
+                    {"task_snapshot": {"v": SNAPSHOT_VERSION, "seq": snapshot.get("seq"), "kind": "checkpoint",
+                                       "state": state}},
+                    synchronize_session=False,
+                )
+                rewritten += 1
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    if rewritten:
+        print(f"[Archive] Rewrote {rewritten} snapshots as checkpoints before {cutoff:%Y-%m-%d}")
+    return rewritten
+
+
+def task_source(include_archived: bool = False):
+    """
+    Entity to query tasks from: KanbanTask, or KanbanTask mapped onto hot + archive.
+
+    With include_archived the entity is an alias of
+    ``kanban_tasks UNION ALL kanban_tasks_archive`` named ``all_tasks``.
+    PostgreSQL flattens the UNION ALL and pushes filters into both sides,
+    so each side still uses its own indexes. Rows load as (read-only)
+    KanbanTask objects either way.
+    """
+    if not include_archived:
+        return KanbanTask
+    hot = KanbanTask.__table__
+    archive = KanbanTaskArchive.__table__
+    all_tasks = union_all(
+        select(*hot.columns),
+        select(*(archive.columns[column.name] for column in hot.columns)),
+    ).subquery(ALL_TASKS)
+    return aliased(KanbanTask, all_tasks, adapt_on_names=True)
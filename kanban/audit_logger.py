@@ -3,11 +3,229 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
-from typing import Any, Dict, Optional
+import queue
+import threading
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from activity_log import log_event
 
+# session.info key for JSONL summaries waiting on the caller's commit
+_PENDING_JSONL_KEY = "kanban_audit_pending_jsonl"
+
+# task_snapshot format: every CHECKPOINT_INTERVAL-th snapshot of a task is a full
+# checkpoint, the ones in between only hold the fields that changed:
+#   {"v": 2, "seq": 21, "kind": "checkpoint", "state": {...}}
+#   {"v": 2, "seq": 22, "kind": "delta", "set": {"priority": "high"}}
+# Older rows hold a bare state dict, which is read as a checkpoint.
+SNAPSHOT_VERSION = 2
+CHECKPOINT_INTERVAL = 20
+# Latest-snapshot lookups try the partitions of this many recent days first
+SNAPSHOT_LOOKUP_DAYS = 90
+
+
+@event.listens_for(Session, "after_commit")
+def _write_pending_jsonl(session) -> None:
+    """Write JSONL summaries for audit rows that were committed with the session."""
+    pending = session.info.pop(_PENDING_JSONL_KEY, [])
+    if not pending:
+        return
+    writer = pending[0][0].writer
+    if writer is not None:
+        writer.submit([(audit_logger, row, False) for audit_logger, row in pending])
+        return
+    for audit_logger, row in pending:
+        audit_logger._log_jsonl_row(row)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_jsonl(session) -> None:
+    """Audit rows rolled back with the caller's transaction never happened."""
+    session.info.pop(_PENDING_JSONL_KEY, None)
+
+
+class AsyncAuditWriter:
+    """
+    Background writer for JSONL audit summaries and sessionless audit rows.
+
+    Audit rows of manager operations are inserted in the caller's
+    transaction (see AuditLogger.log_activities); what is left on the
+    request path after the commit is the JSONL summary (a file append plus
+    the activity_log listeners), and that is what this writer takes over.
+    Rows logged without a session (scripts, integrations) are queued too and
+    written with one multi-row INSERT per batch.
+
+    The worker flushes every ``flush_interval`` seconds or ``batch_size``
+    items, whichever comes first. ``submit`` never waits: when the bounded
+    queue is full, JSONL-only items are dropped and counted, and database
+    rows are written on the calling thread instead. ``stop()`` drains the
+    queue before returning.
+
+    Queue items are ``(audit_logger, row, write_db)``; rows with write_db
+    False were already inserted in a caller's transaction and only need
+    their JSONL summary.
+    """
+
+    def __init__(
+        self,
+        db_manager,
+        max_queue: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 0.25,
+    ):
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._stats_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.enqueued = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+        self.dropped = 0
+        self.sync_fallbacks = 0
+        self.max_queue_depth = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the worker thread (no-op if already running)."""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Flush everything still queued and stop the worker thread."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                print(f"[AuditLog] Audit writer still busy after {timeout}s, {self._queue.qsize()} rows queued")
+            self._thread = None
+        # Whatever the worker did not get to is written here
+        self._flush(self._drain(None))
+
+    def submit(self, items: List[Tuple[Any, Dict[str, Any], bool]]) -> None:
+        """
+        Queue activities for the worker without blocking (safe on the UI thread).
+
+        Items that don't fit in a full queue are dropped if they only carry
+        a JSONL summary; database rows are written on the calling thread.
+
+        Args:
+            items: (audit_logger, row, write_db) tuples
+        """
+        if not self.running:
+            self._flush(items)
+            return
+
+        overflow = []
+        dropped = 0
+        for item in items:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                if item[2]:
+                    overflow.append(item)
+                else:
+                    dropped += 1
+        with self._stats_lock:
+            self.enqueued += len(items) - len(overflow) - dropped
+            self.dropped += dropped
+            self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+            if overflow:
+                self.sync_fallbacks += 1
+        if dropped:
+            print(f"[AuditLog] Audit queue full, dropped {dropped} JSONL summaries")
+        if overflow:
+            self._flush(overflow)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, throughput and flush latency counters."""
+        with self._stats_lock:
+            return {
+                "running": self.running,
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self.max_queue_depth,
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "failed": self.failed,
+                "batches": self.batches,
+                "dropped": self.dropped,
+                "sync_fallbacks": self.sync_fallbacks,
+                "last_flush_ms": round(self.last_flush_ms, 2),
+                "avg_flush_ms": round(self._total_flush_ms / self.batches, 2) if self.batches else 0.0,
+                "max_flush_ms": round(self.max_flush_ms, 2),
+            }
+
+    def _drain(self, limit: Optional[int]) -> List[Tuple[Any, Dict[str, Any], bool]]:
+        items = []
+        while limit is None or len(items) < limit:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and not self._stop_event.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+        # Shutdown: drain what is left in batch_size chunks
+        while True:
+            batch = self._drain(self.batch_size)
+            if not batch:
+                break
+            self._flush(batch)
+
+    def _flush(self, items: List[Tuple[Any, Dict[str, Any], bool]]) -> None:
+        if not items:
+            return
+        started = time.perf_counter()
+        db_rows = [row for _, row, write_db in items if write_db]
+        ok = AuditLogger._insert_rows(self.db_manager, db_rows) if db_rows else True
+        for audit_logger, row, _ in items:
+            audit_logger._log_jsonl_row(row)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            self.batches += 1
+            if ok:
+                self.written += len(db_rows)
+            else:
+                self.failed += len(db_rows)
+            self.last_flush_ms = elapsed_ms
+            self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+            self._total_flush_ms += elapsed_ms
+
 
 class AuditLogger:
     """
@@ -24,6 +242,12 @@ class AuditLogger:
         """
         self.db_manager = db_manager
 
+    @property
+    def writer(self) -> Optional[AsyncAuditWriter]:
+        """The running background audit writer, if enabled (see DatabaseManager.start_audit_writer)."""
+        writer = getattr(self.db_manager, "audit_writer", None)
+        return writer if writer is not None and writer.running else None
+
     def log_activity(
         self,
         activity_type: str,
@@ -36,6 +260,7 @@ class AuditLogger:
         task_snapshot: Optional[Dict[str, Any]] = None,
         ip_address: Optional[str] = None,
         user_agent: Optional[str] = None,
+        session=None,
     ) -> None:
         """
         Log an activity to both PostgreSQL and JSONL.
@@ -51,54 +276,119 @@ class AuditLogger:
             task_snapshot: Optional complete task state snapshot
             ip_address: Optional user's IP address
             user_agent: Optional user agent string
+            session: Optional caller session to write the row in (see log_activities)
+        """
+        print(f"[AuditLog] log_activity called: type={activity_type}, field={field_name}, old={old_value}, new={new_value}")
+
+        self.log_activities(
+            [
+                {
+                    "activity_type": activity_type,
+                    "user_id": user_id,
+                    "task_id": task_id,
+                    "field_name": field_name,
+                    "old_value": old_value,
+                    "new_value": new_value,
+                    "comment": comment,
+                    "task_snapshot": task_snapshot,
+                    "ip_address": ip_address,
+                    "user_agent": user_agent,
+                }
+            ],
+            session=session,
+        )
+
+    def log_activities(self, activities: List[Dict[str, Any]], session=None) -> None:
+        """
+        Log several activities with one multi-row INSERT.
+
+        Args:
+            activities: Activity dicts (same keys as log_activity's arguments),
+                e.g. from the ``task_*_entry`` builders
+            session: Optional caller session. The rows join the caller's
+                transaction and are committed (or rolled back) with it; errors
+                propagate, and the JSONL summaries are only written once the
+                caller commits. Without a session the rows are written in their
+                own transaction (or handed to the background audit writer when
+                it is running) and failures are only logged.
         """
+        from sqlalchemy import insert
+
         from kanban.models import KanbanActivityLog
 
-        print(f"[AuditLog] log_activity called: type={activity_type}, field={field_name}, old={old_value}, new={new_value}")
+        if not activities:
+            return
+
+        now = datetime.now()
+        rows = [
+            {
+                "task_id": activity.get("task_id"),
+                "activity_type": activity["activity_type"],
+                "user_id": activity["user_id"],
+                "field_name": activity.get("field_name"),
+                "old_value": activity.get("old_value"),
+                "new_value": activity.get("new_value"),
+                "comment": activity.get("comment"),
+                "task_snapshot": activity.get("task_snapshot"),
+                "ip_address": activity.get("ip_address"),
+                "user_agent": activity.get("user_agent"),
+                "created_at": now,
+            }
+            for activity in activities
+        ]
+        print(f"[AuditLog] log_activities called: {len(rows)} activities")
+
+        if session is not None:
+            session.execute(insert(KanbanActivityLog), rows)
+            session.info.setdefault(_PENDING_JSONL_KEY, []).extend((self, row) for row in rows)
+            return
+
+        writer = self.writer
+        if writer is not None:
+            writer.submit([(self, row, True) for row in rows])
+            return
 
-        # Log to PostgreSQL (detailed)
-        session = self.db_manager.get_session()
+        self._insert_rows(self.db_manager, rows)
+
+        # Summaries go to JSONL even if the database write failed
+        for row in rows:
+            self._log_jsonl_row(row)
+
+    @staticmethod
+    def _insert_rows(db_manager, rows: List[Dict[str, Any]]) -> bool:
+        """Insert activity rows in their own transaction; failures are logged, not raised."""
+        from sqlalchemy import insert
+
+        from kanban.models import KanbanActivityLog
+
+        session = db_manager.get_session()
         try:
-            activity_log = KanbanActivityLog(
-                task_id=task_id,
-                activity_type=activity_type,
-                user_id=user_id,
-                field_name=field_name,
-                old_value=old_value,
-                new_value=new_value,
-                comment=comment,
-                task_snapshot=task_snapshot,
-                ip_address=ip_address,
-                user_agent=user_agent,
-            )
-            session.add(activity_log)
+            session.execute(insert(KanbanActivityLog), rows)
             session.commit()
-            print(f"[AuditLog] Activity logged to DB: id={activity_log.id}")
+            return True
         except Exception as e:
             session.rollback()
             # Log error but don't fail the operation
             log_event(
                 "kanban.audit",
-                f"Failed to log activity to database: {e}",
+                f"Failed to log {len(rows)} activities to database: {e}",
                 level="error",
-                details={
-                    "activity_type": activity_type,
-                    "task_id": task_id,
-                    "user_id": user_id,
-                },
+                details={"activity_types": sorted({row["activity_type"] for row in rows})},
             )
+            return False
         finally:
             session.close()
 
-        # Log to JSONL (summary via existing activity_log)
+    def _log_jsonl_row(self, row: Dict[str, Any]) -> None:
+        """Write the JSONL summary for one activity row."""
         self._log_to_jsonl(
-            activity_type=activity_type,
-            user_id=user_id,
-            task_id=task_id,
-            field_name=field_name,
-            old_value=old_value,
-            new_value=new_value,
-            comment=comment,
+            activity_type=row["activity_type"],
+            user_id=row["user_id"],
+            task_id=row["task_id"],
+            field_name=row["field_name"],
+            old_value=row["old_value"],
+            new_value=row["new_value"],
+            comment=row["comment"],
         )
 
     def _log_to_jsonl(
@@ -178,101 +468,340 @@ class AuditLogger:
             return f"Attachment added to {task_ref}: {comment}"
         elif activity_type == "attachment_removed":
             return f"Attachment removed from {task_ref}: {comment}"
+        elif activity_type == "dependency_added":
+            return f"{task_ref} now depends on task {new_value} ({comment})"
+        elif activity_type == "dependency_removed":
+            return f"{task_ref} no longer depends on task {old_value}"
         else:
             return f"{task_ref} - {activity_type}"
 
-    def log_task_created(self, task, user_id: int) -> None:
+    @classmethod
+    def task_created_entry(cls, task, user_id: int) -> Dict[str, Any]:
+        """Build the activity for a task creation (with the task's first checkpoint)."""
+        return {
+            "activity_type": "task_created",
+            "user_id": user_id,
+            "task_id": task.id,
+            "new_value": task.title,
+            "task_snapshot": cls._checkpoint(task, seq=1),
+        }
+
+    @staticmethod
+    def task_updated_entries(task_id: int, user_id: int, changes: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build one activity per changed field ({field_name: {'old': ..., 'new': ...}})."""
+        return [
+            {
+                "activity_type": "task_updated",
+                "user_id": user_id,
+                "task_id": task_id,
+                "field_name": field_name,
+                "old_value": str(change.get("old", "")),
+                "new_value": str(change.get("new", "")),
+            }
+            for field_name, change in changes.items()
+        ]
+
+    @staticmethod
+    def task_deleted_entry(task, user_id: int) -> Dict[str, Any]:
+        """Build the activity for a task deletion (snapshot via attach_task_snapshots)."""
+        return {
+            "activity_type": "task_deleted",
+            "user_id": user_id,
+            "task_id": task.id,
+            "old_value": task.title,
+        }
+
+    # -- Task snapshots -----------------------------------------------------
+
+    @classmethod
+    def attach_task_snapshots(
+        cls,
+        session,
+        activities: List[Dict[str, Any]],
+        changed_values: Dict[int, Dict[str, Any]],
+        checkpoint: bool = False,
+    ) -> None:
+        """
+        Add the next task_snapshot of each task to its last activity.
+
+        Args:
+            session: Caller session (sees the uncommitted change)
+            activities: Activity dicts about to be logged
+            changed_values: task_id -> {field: new value} for the change being logged
+            checkpoint: Force full checkpoints (e.g. before a hard delete)
+        """
+        last_activity = {activity["task_id"]: activity for activity in activities}
+        snapshots = cls.task_snapshots(session, changed_values, checkpoint=checkpoint)
+        for task_id, snapshot in snapshots.items():
+            if task_id in last_activity:
+                last_activity[task_id]["task_snapshot"] = snapshot
+
+    @classmethod
+    def task_snapshots(
+        cls, session, changed_values: Dict[int, Dict[str, Any]], checkpoint: bool = False
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Build the next snapshot for each task: a delta of changed_values, or a
+        full checkpoint every CHECKPOINT_INTERVAL snapshots (and for tasks
+        without any snapshot yet).
+
+        Costs one DISTINCT ON query for the previous sequence numbers, plus
+        one task query when checkpoints are due.
+        """
+        from kanban.models import KanbanTask
+
+        if not changed_values:
+            return {}
+
+        seqs = cls._latest_snapshot_seqs(session, list(changed_values))
+        next_seqs = {task_id: seqs.get(task_id, 0) + 1 for task_id in changed_values}
+        due = [
+            task_id
+            for task_id, seq in next_seqs.items()
+            if checkpoint or task_id not in seqs or seq % CHECKPOINT_INTERVAL == 0
+        ]
+        tasks = {}
+        if due:
+            tasks = {
+                task.id: task
+                for task in session.query(KanbanTask).filter(KanbanTask.id.in_(due)).populate_existing()
+            }
+
+        snapshots = {}
+        for task_id, values in changed_values.items():
+            if task_id in tasks:
+                snapshots[task_id] = cls._checkpoint(tasks[task_id], next_seqs[task_id])
+            else:
+                snapshots[task_id] = {
+                    "v": SNAPSHOT_VERSION,
+                    "seq": next_seqs[task_id],
+                    "kind": "delta",
+                    "set": {field: cls._snapshot_value(value) for field, value in values.items()},
+                }
+        return snapshots
+
+    @staticmethod
+    def replay_snapshots(snapshots: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild task state from snapshots in activity order.
+
+        Args:
+            snapshots: task_snapshot values, oldest first, starting at a checkpoint
+
+        Returns:
+            Task state dict, or None if there is no checkpoint to start from
+        """
+        state: Optional[Dict[str, Any]] = None
+        for snapshot in snapshots:
+            kind = snapshot.get("kind")
+            if kind is None:
+                state = dict(snapshot)  # Pre-delta full snapshot
+            elif kind == "checkpoint":
+                state = dict(snapshot["state"])
+            elif state is not None:
+                state.update(snapshot.get("set", {}))
+        return state
+
+    @classmethod
+    def _checkpoint(cls, task, seq: Optional[int]) -> Dict[str, Any]:
+        return {"v": SNAPSHOT_VERSION, "seq": seq, "kind": "checkpoint", "state": cls._task_to_dict(task)}
+
+    @staticmethod
+    def _latest_snapshot_seqs(session, task_ids: List[int]) -> Dict[int, int]:
+        """
+        Sequence number of each task's latest snapshot (0 for pre-delta snapshots).
+
+        Looks in the last SNAPSHOT_LOOKUP_DAYS first, so the usual case (a task
+        edited recently) only touches the newest activity-log partitions;
+        tasks without a recent snapshot fall back to a lookup over all of them.
+        """
+        from sqlalchemy import func
+
+        from kanban.models import KanbanActivityLog
+
+        def lookup(ids: List[int], since: Optional[datetime]) -> Dict[int, int]:
+            query = session.query(KanbanActivityLog.task_id, KanbanActivityLog.task_snapshot).filter(
+                KanbanActivityLog.task_id.in_(ids),
+                func.jsonb_typeof(KanbanActivityLog.task_snapshot) == "object",
+            )
+            if since is not None:
+                query = query.filter(KanbanActivityLog.created_at >= since)
+            rows = (
+                query.distinct(KanbanActivityLog.task_id)
+                .order_by(KanbanActivityLog.task_id, KanbanActivityLog.id.desc())
+                .all()
+            )
+            return {task_id: int(snapshot.get("seq") or 0) for task_id, snapshot in rows}
+
+        seqs = lookup(task_ids, datetime.now() - timedelta(days=SNAPSHOT_LOOKUP_DAYS))
+        older = [task_id for task_id in task_ids if task_id not in seqs]
+        if older:
+            seqs.update(lookup(older, None))
+        return seqs
+
+    @staticmethod
+    def _snapshot_value(value: Any) -> Any:
+        """JSON-safe form of a task field value (matches _task_to_dict)."""
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, Decimal):
+            return float(value)
+        return value
+
+    @staticmethod
+    def task_moved_entry(task_id: int, user_id: int, old_column_name: str, new_column_name: str) -> Dict[str, Any]:
+        """Build the activity for a move between columns (by column name)."""
+        return {
+            "activity_type": "task_moved",
+            "user_id": user_id,
+            "task_id": task_id,
+            "field_name": "column",
+            "old_value": old_column_name,
+            "new_value": new_column_name,
+        }
+
+    # The log_task_* / log_*_added helpers take an optional caller session:
+    # with one, the audit rows commit atomically with the change they describe.
+
+    def log_task_created(self, task, user_id: int, session=None) -> None:
         """Log task creation."""
-        self.log_activity(
-            activity_type="task_created",
-            user_id=user_id,
-            task_id=task.id,
-            new_value=task.title,
-            task_snapshot=self._task_to_dict(task),
-        )
+        self.log_activities([self.task_created_entry(task, user_id)], session=session)
 
     def log_task_updated(
-        self, task, user_id: int, changes: Dict[str, Dict[str, Any]]
+        self, task, user_id: int, changes: Dict[str, Dict[str, Any]], session=None
     ) -> None:
         """
-        Log task updates.
+        Log task updates (one row per changed field, inserted in one batch).
 
         Args:
             task: Task object
             user_id: User ID
             changes: Dictionary of changes {field_name: {'old': old_val, 'new': new_val}}
+            session: Optional caller session (required for the delta snapshot)
         """
-        for field_name, change in changes.items():
-            self.log_activity(
-                activity_type="task_updated",
-                user_id=user_id,
-                task_id=task.id,
-                field_name=field_name,
-                old_value=str(change.get("old", "")),
-                new_value=str(change.get("new", "")),
+        activities = self.task_updated_entries(task.id, user_id, changes)
+        if session is not None:
+            self.attach_task_snapshots(
+                session, activities, {task.id: {field: change.get("new") for field, change in changes.items()}}
             )
+        self.log_activities(activities, session=session)
 
-    def log_task_deleted(self, task, user_id: int) -> None:
-        """Log task deletion."""
-        self.log_activity(
-            activity_type="task_deleted",
-            user_id=user_id,
-            task_id=task.id,
-            old_value=task.title,
-            task_snapshot=self._task_to_dict(task),
-        )
+    def log_task_deleted(self, task, user_id: int, session=None, hard_delete: bool = False) -> None:
+        """
+        Log task deletion.
 
-    def log_task_moved(self, task, user_id: int, old_column_id: int, new_column_id: int) -> None:
+        Soft deletes get a delta snapshot; hard deletes always get a full
+        checkpoint, since they orphan the history (also when the task was
+        soft-deleted before).
+
+        Args:
+            task: Task object (before session.delete for hard deletes)
+            user_id: User ID
+            session: Optional caller session (required for the delta snapshot)
+            hard_delete: True if the row is about to be removed
+        """
+        activity = self.task_deleted_entry(task, user_id)
+        if session is not None and not hard_delete:
+            self.attach_task_snapshots(session, [activity], {task.id: self.deletion_values(task)})
+        elif session is not None:
+            self.attach_task_snapshots(session, [activity], {task.id: {}}, checkpoint=True)
+        else:
+            activity["task_snapshot"] = self._checkpoint(task, seq=None)
+        self.log_activities([activity], session=session)
+
+    def log_task_moved(self, task, user_id: int, old_column_id: int, new_column_id: int, session=None) -> None:
         """Log task move between columns."""
         from kanban.models import KanbanColumn
-        
+
         # Get column names instead of IDs for better readability
-        session = self.db_manager.get_session()
+        lookup_session = session or self.db_manager.get_session()
         try:
-            old_column = session.query(KanbanColumn).filter_by(id=old_column_id).first()
-            new_column = session.query(KanbanColumn).filter_by(id=new_column_id).first()
-            
-            old_column_name = old_column.name if old_column else f"Column #{old_column_id}"
-            new_column_name = new_column.name if new_column else f"Column #{new_column_id}"
-            
-            print(f"[AuditLog] Logging move: FROM '{old_column_name}' TO '{new_column_name}'")
+            column_names = dict(
+                lookup_session.query(KanbanColumn.id, KanbanColumn.name)
+                .filter(KanbanColumn.id.in_([old_column_id, new_column_id]))
+                .all()
+            )
         finally:
-            session.close()
-        
-        self.log_activity(
-            activity_type="task_moved",
-            user_id=user_id,
-            task_id=task.id,
-            field_name="column",
-            old_value=old_column_name,
-            new_value=new_column_name,
-        )
+            if session is None:
+                lookup_session.close()
+
+        old_column_name = column_names.get(old_column_id, f"Column #{old_column_id}")
+        new_column_name = column_names.get(new_column_id, f"Column #{new_column_id}")
+        print(f"[AuditLog] Logging move: FROM '{old_column_name}' TO '{new_column_name}'")
+
+        activity = self.task_moved_entry(task.id, user_id, old_column_name, new_column_name)
+        if session is not None:
+            self.attach_task_snapshots(session, [activity], {task.id: self.move_values(task)})
+        self.log_activities([activity], session=session)
+
+    @staticmethod
+    def move_values(task) -> Dict[str, Any]:
+        """Fields a move can change (column, position and status bookkeeping)."""
+        return {
+            "column_id": task.column_id,
+            "position": task.position,
+            "status": task.status,
+            "started_at": task.started_at,
+            "completed_at": task.completed_at,
+        }
 
-    def log_comment_added(self, comment, user_id: int) -> None:
+    @staticmethod
+    def deletion_values(task) -> Dict[str, Any]:
+        """Fields set by a soft delete."""
+        return {"is_deleted": task.is_deleted, "deleted_at": task.deleted_at, "deleted_by": task.deleted_by}
+
+    def log_comment_added(self, comment, user_id: int, session=None) -> None:
         """Log comment addition."""
         self.log_activity(
             activity_type="comment_added",
             user_id=user_id,
             task_id=comment.task_id,
             comment=comment.comment[:100] + "..." if len(comment.comment) > 100 else comment.comment,
+            session=session,
         )
 
-    def log_attachment_added(self, attachment, user_id: int) -> None:
+    def log_attachment_added(self, attachment, user_id: int, session=None) -> None:
         """Log attachment addition."""
         self.log_activity(
             activity_type="attachment_added",
             user_id=user_id,
             task_id=attachment.task_id,
             comment=attachment.file_name,
+            session=session,
         )
 
-    def log_attachment_removed(self, attachment, user_id: int) -> None:
+    def log_attachment_removed(self, attachment, user_id: int, session=None) -> None:
         """Log attachment removal."""
         self.log_activity(
             activity_type="attachment_removed",
             user_id=user_id,
             task_id=attachment.task_id,
             comment=attachment.file_name,
+            session=session,
+        )
+
+    def log_dependency_added(self, dependency, user_id: int, session=None) -> None:
+        """Log a new task dependency."""
+        self.log_activity(
+            activity_type="dependency_added",
+            user_id=user_id,
+            task_id=dependency.task_id,
+            field_name="depends_on_task_id",
+            new_value=str(dependency.depends_on_task_id),
+            comment=dependency.dependency_type,
+            session=session,
+        )
+
+    def log_dependency_removed(self, dependency, user_id: int, session=None) -> None:
+        """Log a removed task dependency."""
+        self.log_activity(
+            activity_type="dependency_removed",
+            user_id=user_id,
+            task_id=dependency.task_id,
+            field_name="depends_on_task_id",
+            old_value=str(dependency.depends_on_task_id),
+            comment=dependency.dependency_type,
+            session=session,
         )
 
     @staticmethod
@@ -286,6 +815,7 @@ class AuditLogger:
             "column_id": task.column_id,
             "position": float(task.position) if task.position else None,
             "assigned_to": task.assigned_to,
+            "assigned_group_id": task.assigned_group_id,
             "created_by": task.created_by,
             "priority": task.priority,
             "status": task.status,
@@ -299,6 +829,11 @@ class AuditLogger:
             "workflow_reference": task.workflow_reference,
             "created_at": task.created_at.isoformat() if task.created_at else None,
             "updated_at": task.updated_at.isoformat() if task.updated_at else None,
+            "started_at": task.started_at.isoformat() if task.started_at else None,
+            "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+            "is_deleted": task.is_deleted,
+            "deleted_at": task.deleted_at.isoformat() if task.deleted_at else None,
+            "deleted_by": task.deleted_by,
         }
 
 
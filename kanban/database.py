@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import functools
+import inspect
 import json
 import logging
+import re
+import select
 import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
@@ -17,6 +27,495 @@ from kanban.models import Base
 
 logger = logging.getLogger(__name__)
 
+# Channel used by the notify_kanban_change() trigger function
+CHANGE_CHANNEL = "kanban_changes"
+
+
+class ChangeNotificationListener:
+    """
+    Background LISTEN loop for PostgreSQL change notifications.
+
+    Runs on its own thread with a dedicated autocommit connection (outside
+    the pool) and calls ``callback(payload)`` for every NOTIFY received.
+    Reconnects automatically; ``status_callback(connected)`` reports when
+    the connection is up or lost so callers can fall back to polling.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        callback: Callable[[Dict[str, Any]], None],
+        channel: str = CHANGE_CHANNEL,
+        status_callback: Optional[Callable[[bool], None]] = None,
+        poll_interval: float = 5.0,
+        reconnect_delay: float = 10.0,
+    ):
+        self.engine = engine
+        self.callback = callback
+        self.channel = channel
+        self.status_callback = status_callback
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+        self.connected = False
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the listener thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=f"pg-listen-{self.channel}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the listener thread and close its connection."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _set_connected(self, connected: bool) -> None:
+        if connected == self.connected:
+            return
+        self.connected = connected
+        if self.status_callback:
+            try:
+                self.status_callback(connected)
+            except Exception as e:
+                logger.warning(f"Change listener status callback failed: {e}")
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            connection = None
+            try:
+                # Dedicated DBAPI connection: LISTEN needs autocommit and must not go back to the pool
+                cargs, cparams = self.engine.dialect.create_connect_args(self.engine.url)
+                connection = self.engine.dialect.connect(*cargs, **cparams)
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {self.channel}")
+                self._set_connected(True)
+                logger.info(f"Listening for database notifications on '{self.channel}'")
+
+                while not self._stop_event.is_set():
+                    readable, _, _ = select.select([connection], [], [], self.poll_interval)
+                    if not readable:
+                        continue
+                    connection.poll()
+                    while connection.notifies:
+                        notification = connection.notifies.pop(0)
+                        self._dispatch(notification.payload)
+            except Exception as e:
+                logger.warning(f"Change listener connection lost: {e}")
+            finally:
+                self._set_connected(False)
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+
+            self._stop_event.wait(self.reconnect_delay)
+
+    def _dispatch(self, raw_payload: str) -> None:
+        try:
+            payload = json.loads(raw_payload) if raw_payload else {}
+        except json.JSONDecodeError:
+            payload = {"raw": raw_payload}
+        try:
+            self.callback(payload)
+        except Exception as e:
+            logger.warning(f"Change listener callback failed: {e}")
+
+
+class ReportRefreshScheduler:
+    """
+    Background refresher for the materialized reporting views.
+
+    Calls ``refresh_kanban_reporting_views()`` once ``write_threshold`` task
+    writes have been recorded, and every ``interval`` seconds regardless (so
+    date-based buckets such as overdue stay current). The SQL function
+    serialises concurrent callers, so every client can run one of these.
+    Write-triggered refreshes run at most every ``write_min_age`` seconds;
+    one skipped for that reason is retried once the age has passed.
+    """
+
+    def __init__(self, engine: Engine, write_threshold: int = 50, interval: float = 300.0, write_min_age: float = 30.0):
+        self.engine = engine
+        self.write_threshold = write_threshold
+        self.interval = interval
+        self.write_min_age = write_min_age
+        self.pending_writes = 0
+        self.last_refresh_ok: Optional[bool] = None
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the refresh thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="report-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the refresh thread."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def record_writes(self, count: int = 1) -> None:
+        """Count task writes; wakes the thread once the threshold is reached."""
+        with self._lock:
+            self.pending_writes += count
+            if self.pending_writes >= self.write_threshold:
+                self._wake_event.set()
+
+    def refresh(self, min_age_seconds: float = 0) -> bool:
+        """
+        Refresh the reporting views now (on the calling thread).
+
+        Args:
+            min_age_seconds: Skip if the last refresh (by any client) is younger than this
+
+        Returns:
+            bool: True if this call refreshed the views (only then are the
+            pending writes it saw cleared)
+        """
+        with self._lock:
+            writes = self.pending_writes
+        try:
+            with self.engine.begin() as connection:
+                refreshed = connection.execute(
+                    text("SELECT refresh_kanban_reporting_views(make_interval(secs => :age))"),
+                    {"age": min_age_seconds},
+                ).scalar()
+        except Exception as e:
+            logger.warning(f"Reporting view refresh failed: {e}")
+            self.last_refresh_ok = False
+            return False
+        self.last_refresh_ok = True
+        if refreshed:
+            with self._lock:
+                # Writes recorded during the refresh stay pending
+                self.pending_writes = max(self.pending_writes - writes, 0)
+        return bool(refreshed)
+
+    def _run(self) -> None:
+        timeout = self.interval
+        while not self._stop_event.is_set():
+            self._wake_event.wait(timeout)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+            with self._lock:
+                write_triggered = self.pending_writes >= self.write_threshold
+            # Timed refreshes skip if another client refreshed within the interval
+            refreshed = self.refresh(min_age_seconds=self.write_min_age if write_triggered else self.interval / 2)
+            timeout = self.write_min_age if write_triggered and not refreshed else self.interval
+
+
+# Operation name used for statements issued outside any tagged operation
+UNTAGGED_OPERATION = "<untagged>"
+
+# Bound parameters, quoted strings and numbers are replaced so statements that
+# only differ in their values share a fingerprint; "?, ?, ?" lists collapse too
+_FINGERPRINT_LITERALS = re.compile(r"%\(\w+\)s|%s|\$\d+|'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_FINGERPRINT_LISTS = re.compile(r"\?(?:\s*,\s*\?)+")
+_SECRET_PARAMETER = re.compile(r"password|token|secret", re.IGNORECASE)
+
+
+def statement_fingerprint(statement: str) -> str:
+    """Normalize a SQL statement so repeated statements with different values compare equal."""
+    fingerprint = _FINGERPRINT_LITERALS.sub("?", " ".join(statement.split()))
+    return _FINGERPRINT_LISTS.sub("?", fingerprint)
+
+
+class _OperationScope:
+    """Statements issued by one call of a tagged operation."""
+
+    __slots__ = ("name", "started", "queries", "db_seconds", "fingerprints", "flagged")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.fingerprints: Counter = Counter()
+        self.flagged: set = set()
+
+
+_current_operation: ContextVar[Optional[_OperationScope]] = ContextVar("kanban_query_operation", default=None)
+_active_instrumentation: Optional[QueryInstrumentation] = None
+
+
+class QueryInstrumentation:
+    """
+    Per-statement timing and per-operation query counts for an engine.
+
+    Hooks ``before_cursor_execute``/``after_cursor_execute`` and attributes
+    each statement to the operation running on the current thread (see
+    ``operation`` and ``instrument_operations``). Statements slower than
+    ``slow_query_ms`` are kept with their parameters, and an operation call
+    that issues more than ``n_plus_one_threshold`` statements with the same
+    fingerprint is reported as a likely N+1. With ``trace_path`` every
+    statement is also appended to a JSONL trace.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        slow_query_ms: float = 200.0,
+        n_plus_one_threshold: int = 10,
+        trace_path: Optional[str] = None,
+        max_slow_queries: int = 100,
+    ):
+        self.engine = engine
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.trace_path = trace_path
+        self._lock = threading.Lock()
+        self._trace_file = None
+        self._installed = False
+        self._max_slow_queries = max_slow_queries
+        self.reset()
+
+    def start(self) -> None:
+        """Install the engine event listeners (no-op if already running)."""
+        global _active_instrumentation
+        if self._installed:
+            return
+        if self.trace_path:
+            Path(self.trace_path).parent.mkdir(parents=True, exist_ok=True)
+            self._trace_file = open(self.trace_path, "a", encoding="utf-8")
+        event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(self.engine, "after_cursor_execute", self._after_cursor_execute)
+        self._installed = True
+        _active_instrumentation = self
+
+    def stop(self) -> None:
+        """Remove the event listeners and close the trace file."""
+        global _active_instrumentation
+        if not self._installed:
+            return
+        event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(self.engine, "after_cursor_execute", self._after_cursor_execute)
+        self._installed = False
+        if _active_instrumentation is self:
+            _active_instrumentation = None
+        with self._lock:
+            if self._trace_file is not None:
+                self._trace_file.close()
+                self._trace_file = None
+
+    def reset(self) -> None:
+        """Clear all counters (e.g. between benchmark runs)."""
+        with self._lock:
+            self.statements = 0
+            self.db_seconds = 0.0
+            self._operations: Dict[str, Dict[str, Any]] = {}
+            self._slow_queries: deque = deque(maxlen=self._max_slow_queries)
+            self._n_plus_one: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    @contextmanager
+    def operation(self, name: str) -> Iterator[None]:
+        """
+        Attribute the statements issued inside the block to ``name``.
+
+        Nested operations join the outermost one, so helpers called by a
+        tagged method count towards that method.
+        """
+        if _current_operation.get() is not None:
+            yield
+            return
+        scope = _OperationScope(name)
+        token = _current_operation.set(scope)
+        try:
+            yield
+        finally:
+            _current_operation.reset(token)
+            self._finish_operation(scope)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if context is not None:
+            context._kanban_query_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = getattr(context, "_kanban_query_started", None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        elapsed_ms = elapsed * 1000
+        scope = _current_operation.get()
+        operation = scope.name if scope is not None else UNTAGGED_OPERATION
+        fingerprint = statement_fingerprint(statement)
+
+        repeated = 0
+        if scope is not None:
+            scope.queries += 1
+            scope.db_seconds += elapsed
+            scope.fingerprints[fingerprint] += 1
+            if scope.fingerprints[fingerprint] > self.n_plus_one_threshold and fingerprint not in scope.flagged:
+                scope.flagged.add(fingerprint)
+                repeated = scope.fingerprints[fingerprint]
+
+        with self._lock:
+            self.statements += 1
+            self.db_seconds += elapsed
+            if scope is None:
+                stats = self._operation_stats(UNTAGGED_OPERATION)
+                stats["queries"] += 1
+                stats["db_seconds"] += elapsed
+            if elapsed_ms >= self.slow_query_ms:
+                self._slow_queries.append({
+                    "at": datetime.now().isoformat(timespec="seconds"),
+                    "operation": operation,
+                    "duration_ms": round(elapsed_ms, 2),
+                    "statement": statement,
+                    "parameters": self._format_parameters(parameters, executemany),
+                })
+            if repeated:
+                self._record_n_plus_one(operation, fingerprint, statement)
+            if self._trace_file is not None:
+                self._trace_file.write(json.dumps({
+                    "at": datetime.now().isoformat(timespec="milliseconds"),
+                    "operation": operation,
+                    "duration_ms": round(elapsed_ms, 3),
+                    "rows": cursor.rowcount,
+                    "executemany": executemany,
+                    "fingerprint": fingerprint,
+                }) + "\n")
+
+        if elapsed_ms >= self.slow_query_ms:
+            logger.warning(f"Slow query in {operation} ({elapsed_ms:.0f} ms): {fingerprint[:200]}")
+
+    def _operation_stats(self, name: str) -> Dict[str, Any]:
+        stats = self._operations.get(name)
+        if stats is None:
+            stats = {"calls": 0, "queries": 0, "max_queries": 0, "db_seconds": 0.0, "wall_seconds": 0.0}
+            self._operations[name] = stats
+        return stats
+
+    def _finish_operation(self, scope: _OperationScope) -> None:
+        wall_seconds = time.perf_counter() - scope.started
+        with self._lock:
+            stats = self._operation_stats(scope.name)
+            stats["calls"] += 1
+            stats["queries"] += scope.queries
+            stats["max_queries"] = max(stats["max_queries"], scope.queries)
+            stats["db_seconds"] += scope.db_seconds
+            stats["wall_seconds"] += wall_seconds
+            for fingerprint in scope.flagged:
+                entry = self._n_plus_one.get((scope.name, fingerprint))
+                if entry is not None:
+                    entry["max_count"] = max(entry["max_count"], scope.fingerprints[fingerprint])
+
+    def _record_n_plus_one(self, operation: str, fingerprint: str, statement: str) -> None:
+        """Count a likely N+1 (caller holds the lock); logged once per operation and statement."""
+        entry = self._n_plus_one.get((operation, fingerprint))
+        if entry is None:
+            entry = {"operation": operation, "statement": fingerprint, "occurrences": 0, "max_count": 0}
+            self._n_plus_one[(operation, fingerprint)] = entry
+            logger.warning(
+                f"Possible N+1 in {operation}: more than {self.n_plus_one_threshold} "
+                f"similar statements: {fingerprint[:200]}"
+            )
+        entry["occurrences"] += 1
+
+    @staticmethod
+    def _format_parameters(parameters: Any, executemany: bool) -> Any:
+        """JSON-safe copy of the parameters with password/token values masked."""
+        def clean(params):
+            if isinstance(params, dict):
+                return {
+                    key: "***" if _SECRET_PARAMETER.search(str(key)) else repr(value)[:200]
+                    for key, value in params.items()
+                }
+            if isinstance(params, (list, tuple)):
+                return [repr(value)[:200] for value in params]
+            return repr(params)[:200]
+
+        if executemany:
+            rows = list(parameters or [])
+            return {"rows": len(rows), "first": clean(rows[0]) if rows else None}
+        return clean(parameters)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Counters as a JSON-serializable dict.
+
+        Returns:
+            dict with ``statements``, ``db_ms``, per-operation ``operations``
+            (calls, queries, avg/max queries per call, db and wall time),
+            recent ``slow_queries`` and ``n_plus_one`` suspects
+        """
+        with self._lock:
+            operations = {}
+            for name, stats in sorted(self._operations.items()):
+                calls = stats["calls"]
+                operations[name] = {
+                    "calls": calls,
+                    "queries": stats["queries"],
+                    "avg_queries": round(stats["queries"] / calls, 2) if calls else None,
+                    "max_queries": stats["max_queries"],
+                    "db_ms": round(stats["db_seconds"] * 1000, 2),
+                    "wall_ms": round(stats["wall_seconds"] * 1000, 2),
+                }
+            return {
+                "statements": self.statements,
+                "db_ms": round(self.db_seconds * 1000, 2),
+                "slow_query_ms": self.slow_query_ms,
+                "n_plus_one_threshold": self.n_plus_one_threshold,
+                "operations": operations,
+                "slow_queries": list(self._slow_queries),
+                "n_plus_one": [dict(entry) for entry in self._n_plus_one.values()],
+            }
+
+    def write_stats(self, path: str) -> None:
+        """Write ``stats()`` as JSON to ``path``."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.stats(), f, indent=2)
+
+
+@contextmanager
+def track_operation(name: str) -> Iterator[None]:
+    """Tag the statements issued inside the block with ``name`` (no-op without instrumentation)."""
+    instrumentation = _active_instrumentation
+    if instrumentation is None:
+        yield
+        return
+    with instrumentation.operation(name):
+        yield
+
+
+def instrument_operations(cls):
+    """
+    Class decorator: tag the statements of each public method as ``Class.method``.
+
+    Costs one global lookup per call while instrumentation is off.
+    """
+    def wrap(name: str, method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            instrumentation = _active_instrumentation
+            if instrumentation is None:
+                return method(*args, **kwargs)
+            with instrumentation.operation(name):
+                return method(*args, **kwargs)
+
+        return wrapper
+
+    for attribute, value in list(vars(cls).items()):
+        if not attribute.startswith("_") and inspect.isfunction(value):
+            setattr(cls, attribute, wrap(f"{cls.__name__}.{attribute}", value))
+    return cls
+
 
 class DatabaseManager:
     """
@@ -43,6 +542,10 @@ class DatabaseManager:
         self.config = self._load_config()
         self.engine: Optional[Engine] = None
         self.Session: Optional[scoped_session] = None
+        self._listeners: List[ChangeNotificationListener] = []
+        self._report_refresher: Optional[ReportRefreshScheduler] = None
+        self.audit_writer = None  # AsyncAuditWriter, see start_audit_writer()
+        self.query_instrumentation: Optional[QueryInstrumentation] = None
 
         self._initialize_connection()
         DatabaseManager._initialized = True
@@ -115,6 +618,9 @@ class DatabaseManager:
             """Event handler for connection checkout from pool."""
             logger.debug("Connection checked out from pool")
 
+        if db_config.get("query_instrumentation", False):
+            self.start_query_instrumentation()
+
         # Thread-safe session factory
         session_factory = sessionmaker(
             bind=self.engine,
@@ -169,8 +675,178 @@ class DatabaseManager:
         Base.metadata.drop_all(self.engine)
         logger.warning("All tables dropped")
 
+    @property
+    def live_updates_enabled(self) -> bool:
+        """Whether LISTEN/NOTIFY board updates are enabled in the config (default on)."""
+        return bool(self.config["database"].get("live_updates", True))
+
+    def start_change_listener(
+        self,
+        callback: Callable[[Dict[str, Any]], None],
+        status_callback: Optional[Callable[[bool], None]] = None,
+    ) -> Optional[ChangeNotificationListener]:
+        """
+        Start a background listener for kanban change notifications.
+
+        Args:
+            callback: Called from the listener thread with each decoded payload
+                (``{"table": ..., "op": ..., "task_id": ...}``)
+            status_callback: Optional, called with True/False on (dis)connect
+
+        Returns:
+            The running listener, or None if live updates are disabled
+        """
+        if self.engine is None:
+            raise RuntimeError("Database not initialized")
+        if not self.live_updates_enabled:
+            return None
+
+        listener = ChangeNotificationListener(self.engine, callback, status_callback=status_callback)
+        listener.start()
+        self._listeners.append(listener)
+        return listener
+
+    def stop_change_listener(self, listener: Optional[ChangeNotificationListener]) -> None:
+        """Stop a listener started with start_change_listener."""
+        if listener is None:
+            return
+        listener.stop()
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    @property
+    def reporting_views_enabled(self) -> bool:
+        """Whether reports read from the materialized reporting views (default on)."""
+        return bool(self.config["database"].get("reporting_views", True))
+
+    def start_report_refresher(self) -> Optional[ReportRefreshScheduler]:
+        """
+        Start the background refresher for the materialized reporting views.
+
+        Thresholds come from ``report_refresh_writes`` and
+        ``report_refresh_interval`` (seconds) in the database config.
+
+        Returns:
+            The running scheduler, or None if reporting views are disabled
+        """
+        if self.engine is None:
+            raise RuntimeError("Database not initialized")
+        if not self.reporting_views_enabled:
+            return None
+        if self._report_refresher is None:
+            db_config = self.config["database"]
+            self._report_refresher = ReportRefreshScheduler(
+                self.engine,
+                write_threshold=int(db_config.get("report_refresh_writes", 50)),
+                interval=float(db_config.get("report_refresh_interval", 300)),
+            )
+        self._report_refresher.start()
+        return self._report_refresher
+
+    def record_writes(self, count: int = 1) -> None:
+        """Tell the report refresher that tasks were written (no-op if not running)."""
+        if self._report_refresher is not None:
+            self._report_refresher.record_writes(count)
+
+    @property
+    def async_audit_enabled(self) -> bool:
+        """Whether audit rows are written by the background audit writer (default off)."""
+        return bool(self.config["database"].get("async_audit", False))
+
+    def start_audit_writer(self):
+        """
+        Start the background audit writer.
+
+        Queue and batch sizes come from ``audit_queue_size``,
+        ``audit_batch_size`` and ``audit_flush_ms`` in the database config.
+
+        Returns:
+            The running AsyncAuditWriter, or None if async audit is disabled
+        """
+        from kanban.audit_logger import AsyncAuditWriter
+
+        if self.engine is None:
+            raise RuntimeError("Database not initialized")
+        if not self.async_audit_enabled:
+            return None
+        if self.audit_writer is None:
+            db_config = self.config["database"]
+            self.audit_writer = AsyncAuditWriter(
+                self,
+                max_queue=int(db_config.get("audit_queue_size", 10000)),
+                batch_size=int(db_config.get("audit_batch_size", 200)),
+                flush_interval=float(db_config.get("audit_flush_ms", 250)) / 1000,
+            )
+        self.audit_writer.start()
+        return self.audit_writer
+
+    def start_query_instrumentation(self, trace_path: Optional[str] = None) -> QueryInstrumentation:
+        """
+        Start timing and counting every statement issued through the engine.
+
+        Thresholds come from ``slow_query_ms``, ``n_plus_one_threshold`` and
+        ``query_trace_path`` in the database config. Starts automatically
+        when ``query_instrumentation`` is true in the config.
+
+        Args:
+            trace_path: JSONL trace file (overrides ``query_trace_path``)
+
+        Returns:
+            The running QueryInstrumentation
+        """
+        if self.engine is None:
+            raise RuntimeError("Database not initialized")
+        if self.query_instrumentation is None:
+            db_config = self.config["database"]
+            self.query_instrumentation = QueryInstrumentation(
+                self.engine,
+                slow_query_ms=float(db_config.get("slow_query_ms", 200)),
+                n_plus_one_threshold=int(db_config.get("n_plus_one_threshold", 10)),
+                trace_path=trace_path or db_config.get("query_trace_path"),
+            )
+        self.query_instrumentation.start()
+        return self.query_instrumentation
+
+    def stop_query_instrumentation(self) -> Optional[Dict[str, Any]]:
+        """
+        Stop query instrumentation.
+
+        Returns:
+            dict: Final query stats, or None if instrumentation was not running
+        """
+        if self.query_instrumentation is None:
+            return None
+        self.query_instrumentation.stop()
+        stats = self.query_instrumentation.stats()
+        self.query_instrumentation = None
+        return stats
+
+    def get_query_stats(self) -> dict:
+        """
+        Get query instrumentation counters (see QueryInstrumentation.stats).
+
+        Returns:
+            dict: Query statistics, empty if instrumentation is not running
+        """
+        if self.query_instrumentation is None:
+            return {}
+        return self.query_instrumentation.stats()
+
     def close_all_sessions(self) -> None:
         """Close all active sessions (call on app shutdown)."""
+        for listener in list(self._listeners):
+            self.stop_change_listener(listener)
+        if self._report_refresher is not None:
+            self._report_refresher.stop()
+            self._report_refresher = None
+        if self.audit_writer is not None:
+            # Flush queued audit rows while the engine is still usable
+            self.audit_writer.stop()
+            logger.info(f"Audit writer stopped: {self.audit_writer.stats()}")
+            self.audit_writer = None
+        if self.query_instrumentation is not None:
+            stats = self.stop_query_instrumentation()
+            logger.info(f"Query instrumentation stopped: {stats['statements']} statements, {stats['db_ms']} ms")
         if self.Session:
             self.Session.remove()
         if self.engine:
@@ -0,0 +1,308 @@
+"""Task dependency graph: recursive CTE queries and a per-board-version result cache."""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import all_, and_, exists, func, select
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.orm import Session, aliased
+
+from kanban.database import DatabaseManager
+from kanban.models import KanbanColumn, KanbanDependency, KanbanSettings, KanbanTask, KanbanTaskTombstone
+
+DEPENDENCY_TYPES = ("blocks", "relates_to", "duplicate_of")
+BLOCKING_TYPE = "blocks"
+
+# kanban_settings row bumped by the bump_dependency_graph_version() trigger
+DEPENDENCY_VERSION_KEY = "dependency_graph_version"
+
+# Serializes "blocks" inserts so two concurrent edges cannot close a cycle together
+DEPENDENCY_LOCK_ID = 0x4B444550  # "KDEP"
+
+# Longest blocker chain the critical path search follows
+MAX_CHAIN_DEPTH = 50
+
+
+@dataclass
+class CriticalPath:
+    """Longest chain of open blocking tasks by estimated hours."""
+
+    # Ordered from the first task to work on to the last one it unblocks
+    task_ids: List[int] = field(default_factory=list)
+    total_hours: Decimal = Decimal("0")
+
+    @property
+    def length(self) -> int:
+        """Number of tasks on the path."""
+        return len(self.task_ids)
+
+
+def is_blocking(dependency=KanbanDependency):
+    """Condition for "blocks" edges (rows without a type default to blocks)."""
+    return func.coalesce(dependency.dependency_type, BLOCKING_TYPE) == BLOCKING_TYPE
+
+
+def is_open(task=KanbanTask, column=KanbanColumn):
+    """Condition for tasks that still block others: live and not in Done."""
+    return and_(task.is_deleted == False, column.name != "Done")  # noqa: E712
+
+
+def blocker_closure(task_id: int, name: str = "blockers"):
+    """
+    Recursive CTE of every task ``task_id`` transitively waits on.
+
+    UNION (not UNION ALL) drops rows already seen, so the walk visits each
+    task once and terminates even if the data contains a cycle.
+    """
+    closure = (
+        select(KanbanDependency.depends_on_task_id.label("task_id"))
+        .where(KanbanDependency.task_id == task_id, is_blocking())
+        .cte(name, recursive=True)
+    )
+    step = aliased(KanbanDependency)
+    return closure.union(
+        select(step.depends_on_task_id).join(closure, step.task_id == closure.c.task_id).where(is_blocking(step))
+    )
+
+
+def dependent_closure(task_id: int, name: str = "dependents"):
+    """Recursive CTE of every task that transitively waits on ``task_id``."""
+    closure = (
+        select(KanbanDependency.task_id.label("task_id"))
+        .where(KanbanDependency.depends_on_task_id == task_id, is_blocking())
+        .cte(name, recursive=True)
+    )
+    step = aliased(KanbanDependency)
+    return closure.union(
+        select(step.task_id).join(closure, step.depends_on_task_id == closure.c.task_id).where(is_blocking(step))
+    )
+
+
+def creates_cycle(session: Session, task_id: int, depends_on_task_id: int) -> bool:
+    """Whether adding ``task_id blocks-on depends_on_task_id`` would close a cycle."""
+    if task_id == depends_on_task_id:
+        return True
+    closure = blocker_closure(depends_on_task_id)
+    return bool(session.query(exists().where(closure.c.task_id == task_id)).scalar())
+
+
+def closure_tasks(session: Session, closure, open_only: bool = True) -> List[Tuple[int, str]]:
+    """(id, task_number) of the tasks in a closure CTE, ordered by task number."""
+    query = (
+        session.query(KanbanTask.id, KanbanTask.task_number)
+        .join(closure, closure.c.task_id == KanbanTask.id)
+        .join(KanbanColumn, KanbanColumn.id == KanbanTask.column_id)
+    )
+    if open_only:
+        query = query.filter(is_open())
+    else:
+        query = query.filter(KanbanTask.is_deleted == False)  # noqa: E712
+    return [(task_id, task_number) for task_id, task_number in query.order_by(KanbanTask.task_number)]
+
+
+def blocked_tasks(session: Session) -> Dict[int, List[str]]:
+    """
+    Every open task with at least one open direct blocker, in one query.
+
+    Returns:
+        Dict of blocked task id -> task numbers of its open blockers
+    """
+    blocker = aliased(KanbanTask)
+    blocker_column = aliased(KanbanColumn)
+    blocked = aliased(KanbanTask)
+    blocked_column = aliased(KanbanColumn)
+    rows = (
+        session.query(KanbanDependency.task_id, blocker.task_number)
+        .join(blocker, blocker.id == KanbanDependency.depends_on_task_id)
+        .join(blocker_column, blocker_column.id == blocker.column_id)
+        .join(blocked, blocked.id == KanbanDependency.task_id)
+        .join(blocked_column, blocked_column.id == blocked.column_id)
+        .filter(is_blocking(), is_open(blocker, blocker_column), is_open(blocked, blocked_column))
+        .order_by(KanbanDependency.task_id, blocker.task_number)
+    )
+    result: Dict[int, List[str]] = {}
+    for task_id, task_number in rows:
+        result.setdefault(task_id, []).append(task_number)
+    return result
+
+
+def critical_path(session: Session, task_id: Optional[int] = None, max_depth: int = MAX_CHAIN_DEPTH) -> CriticalPath:
+    """
+    Longest chain of open blocking tasks, weighted by ``estimated_hours``.
+
+    Walks blocker edges backwards with a recursive CTE that carries the path
+    (an id array, which also stops it from revisiting a task) and the summed
+    hours. With ``task_id`` the chain ends at that task; without it the walk
+    starts from every open task that blocks nothing open, i.e. the whole
+    board's critical path.
+
+    Args:
+        session: Open session
+        task_id: Task whose blocker chain to measure (None = whole board)
+        max_depth: Longest chain followed
+
+    Returns:
+        CriticalPath (empty when the task does not exist or nothing is open)
+    """
+    open_tasks = (
+        select(KanbanTask.id, func.coalesce(KanbanTask.estimated_hours, 0).label("hours"))
+        .join(KanbanColumn, KanbanColumn.id == KanbanTask.column_id)
+        .where(is_open())
+        .cte("open_tasks")
+    )
+
+    if task_id is not None:
+        # The target itself counts even once it is done; only its blockers must be open
+        target = (
+            select(
+                KanbanTask.id.label("task_id"),
+                array([KanbanTask.id]).label("path"),
+                func.coalesce(open_tasks.c.hours, 0).label("hours"),
+            )
+            .outerjoin(open_tasks, open_tasks.c.id == KanbanTask.id)
+            .where(KanbanTask.id == task_id, KanbanTask.is_deleted == False)  # noqa: E712
+        )
+    else:
+        dependent = aliased(KanbanDependency)
+        open_dependents = open_tasks.alias("open_dependents")
+        blocks_open = (
+            exists()
+            .where(dependent.depends_on_task_id == open_tasks.c.id, is_blocking(dependent))
+            .where(dependent.task_id.in_(select(open_dependents.c.id)))
+        )
+        target = select(
+            open_tasks.c.id.label("task_id"),
+            array([open_tasks.c.id]).label("path"),
+            open_tasks.c.hours.label("hours"),
+        ).where(~blocks_open)
+
+    chain = target.cte("chain", recursive=True)
+    step = aliased(KanbanDependency)
+    blocker = open_tasks.alias("blocker")
+    chain = chain.union_all(
+        select(
+            blocker.c.id,
+            func.array_prepend(blocker.c.id, chain.c.path),
+            chain.c.hours + blocker.c.hours,
+        )
+        .select_from(chain)
+        .join(step, and_(step.task_id == chain.c.task_id, is_blocking(step)))
+        .join(blocker, blocker.c.id == step.depends_on_task_id)
+        .where(blocker.c.id != all_(chain.c.path), func.cardinality(chain.c.path) < max_depth)
+    )
+
+    row = session.execute(
+        select(chain.c.path, chain.c.hours)
+        .order_by(chain.c.hours.desc(), func.cardinality(chain.c.path).desc())
+        .limit(1)
+    ).first()
+    if row is None:
+        return CriticalPath()
+    return CriticalPath(task_ids=list(row.path), total_hours=Decimal(row.hours))
+
+
+def board_version(session: Session) -> Tuple[Any, ...]:
+    """
+    Version of everything the graph queries read, in one statement.
+
+    Task edits move ``max(updated_at)`` (idx_tasks_updated_at), hard deletes
+    add a tombstone and dependency edits bump the dependency_graph_version
+    setting, so any change that can alter a graph result changes the tuple.
+    """
+    return tuple(
+        session.query(
+            select(func.max(KanbanTask.updated_at)).scalar_subquery(),
+            select(func.max(KanbanTaskTombstone.changed_at)).scalar_subquery(),
+            select(KanbanSettings.setting_value)
+            .where(KanbanSettings.setting_key == DEPENDENCY_VERSION_KEY)
+            .scalar_subquery(),
+        ).one()
+    )
+
+
+class DependencyGraphCache:
+    """
+    Graph query results cached per board version.
+
+    Each lookup probes ``board_version`` (one cheap indexed statement); the
+    recursive CTEs only run again once the version has moved. Results are
+    shared between callers, so callers must copy before mutating them.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._version: Optional[Tuple[Any, ...]] = None
+        self._results: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, session: Session, key: Hashable, compute: Callable[[Session], Any]) -> Any:
+        """
+        Cached result for ``key`` at the current board version.
+
+        Args:
+            session: Open session (used for the version probe and, on a miss, compute)
+            key: Hashable query key, e.g. ("blockers", task_id)
+            compute: Called with the session on a miss
+
+        Returns:
+            The cached or freshly computed result
+        """
+        version = board_version(session)
+        with self._lock:
+            if version != self._version:
+                self._version = version
+                self._results.clear()
+            elif key in self._results:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return self._results[key]
+
+        value = compute(session)
+        with self._lock:
+            self.misses += 1
+            if version == self._version:
+                self._results[key] = value
+                while len(self._results) > self.max_entries:
+                    self._results.popitem(last=False)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._version = None
+            self._results.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and the number of cached results."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._results)}
+
+
+_caches: "weakref.WeakKeyDictionary[DatabaseManager, DependencyGraphCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_dependency_cache(db_manager: DatabaseManager) -> DependencyGraphCache:
+    """
+    Get the process-wide dependency graph cache for a database manager.
+
+    Args:
+        db_manager: Database manager instance
+
+    Returns:
+        The shared DependencyGraphCache
+    """
+    with _caches_lock:
+        cache = _caches.get(db_manager)
+        if cache is None:
+            cache = DependencyGraphCache()
+            _caches[db_manager] = cache
+        return cache
@@ -0,0 +1,810 @@
+"""Offline-first local replica of the board (SQLite) with a background sync worker."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from kanban.database import DatabaseManager
+from kanban.manager import BoardChanges, BoardSnapshot, KanbanManager, TaskCard, TaskPage
+from kanban.models import KanbanColumn, KanbanGroup, KanbanUser
+
+logger = logging.getLogger(__name__)
+
+# Card columns are the TaskCard fields; a changed field list rebuilds the cache tables
+CARD_FIELDS = TaskCard._fields
+DATE_FIELDS = frozenset({"deadline"})
+DATETIME_FIELDS = frozenset({"completed_at", "updated_at"})
+DECIMAL_FIELDS = frozenset({"position"})
+
+# Reference rows stored per kind (detached model instances are rebuilt from these)
+REFERENCE_FIELDS = {
+    "column": ("id", "name", "position", "color", "wip_limit", "is_active", "description"),
+    "user": ("id", "username", "display_name", "email", "role", "avatar_color", "department", "is_active"),
+    "group": ("id", "name", "description", "color", "is_active", "member_count"),
+}
+
+# Board writes that can be queued while the database is slow or unreachable
+QUEUEABLE_OPERATIONS = ("move_task", "reorder_task")
+
+CACHE_TABLES = ("task_cards", "reference_rows", "group_members", "blocked_tasks")
+
+
+@dataclass
+class QueuedWrite:
+    """A board write waiting to be replayed against PostgreSQL."""
+
+    id: int
+    user_id: int
+    operation: str
+    task_id: int
+    arguments: Dict[str, Any]
+    # Server row version the write was made against (conflict detection)
+    base_updated_at: Optional[datetime]
+    base_column_id: Optional[int]
+    queued_at: datetime
+    attempts: int = 0
+    status: str = "pending"
+    last_error: Optional[str] = None
+
+
+@dataclass
+class ReplicaSyncResult:
+    """Outcome of one sync cycle, handed to the worker's callback."""
+
+    online: bool = True
+    full_reload: bool = False
+    columns_changed: bool = False
+    reference_changed: bool = False
+    # Tasks changed or removed on the replica this cycle
+    task_ids: Set[int] = field(default_factory=set)
+    applied: int = 0
+    conflicts: List[QueuedWrite] = field(default_factory=list)
+    failed: List[QueuedWrite] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def changed(self) -> bool:
+        """True when the board rendered from the replica needs to be redrawn."""
+        return bool(
+            self.full_reload or self.columns_changed or self.reference_changed or self.task_ids
+            or self.conflicts or self.failed
+        )
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _decode_card(row: sqlite3.Row) -> TaskCard:
+    values = {}
+    for name in CARD_FIELDS:
+        value = row[name]
+        if value is not None:
+            if name in DATE_FIELDS:
+                value = date.fromisoformat(value)
+            elif name in DATETIME_FIELDS:
+                value = datetime.fromisoformat(value)
+            elif name in DECIMAL_FIELDS:
+                value = Decimal(value)
+        values[name] = value
+    return TaskCard(**values)
+
+
+def _version_text(version: Any) -> Optional[str]:
+    return None if version is None else str(version)
+
+
+def _like_pattern(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class LocalReplica:
+    """
+    SQLite copy of the board: active columns, users, groups, live task cards,
+    blocked-card markers and a queue of board writes not yet sent to PostgreSQL.
+
+    Cards are TaskCard records (kanban.manager), so snapshots read from the
+    replica render exactly like ones from KanbanManager. The replica is a
+    cache: only the write queue holds data that PostgreSQL does not have yet.
+    One connection is shared by the UI and the sync thread behind a lock.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _create_schema(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS replica_meta (key TEXT PRIMARY KEY, value TEXT)")
+            if self._get_meta("card_fields") != ",".join(CARD_FIELDS):
+                # Card layout changed: the cache is rebuilt by the next full sync
+                for table_name in CACHE_TABLES:
+                    self._conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+                self._conn.execute("DELETE FROM replica_meta WHERE key <> 'card_fields'")
+                self._set_meta("card_fields", ",".join(CARD_FIELDS))
+
+            card_columns = ", ".join(name for name in CARD_FIELDS if name != "id")
+            self._conn.executescript(
+                f"""
+                CREATE TABLE IF NOT EXISTS task_cards (id INTEGER PRIMARY KEY, {card_columns});
+                CREATE INDEX IF NOT EXISTS idx_task_cards_column ON task_cards (column_id);
+                CREATE TABLE IF NOT EXISTS reference_rows (
+                    kind TEXT NOT NULL, id INTEGER NOT NULL, sort_order INTEGER NOT NULL, data TEXT NOT NULL,
+                    PRIMARY KEY (kind, id)
+                );
+                CREATE TABLE IF NOT EXISTS group_members (group_id INTEGER PRIMARY KEY, names TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS blocked_tasks (task_id INTEGER PRIMARY KEY, blockers TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS write_queue (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    operation TEXT NOT NULL,
+                    task_id INTEGER NOT NULL,
+                    arguments TEXT NOT NULL,
+                    base_updated_at TEXT,
+                    base_column_id INTEGER,
+                    queued_at TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    last_error TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_write_queue_pending ON write_queue (status, id);
+                """
+            )
+
+    # -----------------------------------------------------------------------
+    # Sync state
+    # -----------------------------------------------------------------------
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM replica_meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: Optional[str]) -> None:
+        self._conn.execute(
+            "INSERT INTO replica_meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    @property
+    def cursor(self) -> Optional[datetime]:
+        """Server timestamp of the last sync (the get_changes_since cursor), None before the first."""
+        with self._lock:
+            value = self._get_meta("sync_cursor")
+        return datetime.fromisoformat(value) if value else None
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the replica holds a complete board to render from."""
+        return self.cursor is not None
+
+    @property
+    def reference_version(self) -> Optional[str]:
+        """reference_data_version the stored users/columns/groups were loaded at."""
+        with self._lock:
+            return self._get_meta("reference_version")
+
+    # -----------------------------------------------------------------------
+    # Applying server data
+    # -----------------------------------------------------------------------
+
+    def replace_board(self, snapshot: BoardSnapshot, reference_version: Any = None) -> Set[int]:
+        """
+        Replace the whole replica with an unfiltered, unpaged board snapshot.
+
+        Cards with pending queued writes keep their local state.
+
+        Returns:
+            IDs of every card stored or dropped
+        """
+        with self._lock, self._conn:
+            pending = self._pending_task_ids()
+            previous = {row["id"] for row in self._conn.execute("SELECT id FROM task_cards")}
+            self._conn.execute(
+                f"DELETE FROM task_cards WHERE id NOT IN ({','.join('?' * len(pending))})" if pending
+                else "DELETE FROM task_cards",
+                tuple(pending),
+            )
+            cards = [card for tasks in snapshot.tasks_by_column.values() for card in tasks if card.id not in pending]
+            self._upsert_cards(cards)
+            self._store_reference(snapshot.columns, snapshot.users, snapshot.groups, snapshot.group_member_names)
+            self._set_meta("reference_version", _version_text(reference_version))
+            self._store_blocked(snapshot.blocked_by)
+            self._set_meta("sync_cursor", _encode(snapshot.synced_at))
+            return previous | {card.id for card in cards}
+
+    def apply_changes(self, changes: BoardChanges) -> Set[int]:
+        """
+        Apply an unfiltered BoardChanges delta and advance the cursor.
+
+        Returns:
+            IDs of the cards updated or removed (cards with pending writes are skipped)
+        """
+        with self._lock, self._conn:
+            pending = self._pending_task_ids()
+            cards = [card for card in changes.tasks if card.id not in pending]
+            removed = [task_id for task_id in changes.removed_task_ids if task_id not in pending]
+            self._upsert_cards(cards)
+            self._conn.executemany("DELETE FROM task_cards WHERE id = ?", [(task_id,) for task_id in removed])
+            self._set_meta("sync_cursor", _encode(changes.cursor))
+            return {card.id for card in cards} | set(removed)
+
+    def refresh_cards(self, task_ids: Iterable[int], cards: List[TaskCard]) -> Set[int]:
+        """
+        Overwrite cards with the server's copy (e.g. after a rejected write);
+        requested IDs missing from ``cards`` are removed.
+
+        Returns:
+            IDs of the cards updated or removed
+        """
+        with self._lock, self._conn:
+            pending = self._pending_task_ids()
+            found = {card.id for card in cards}
+            removed = [task_id for task_id in task_ids if task_id not in found and task_id not in pending]
+            self._upsert_cards([card for card in cards if card.id not in pending])
+            self._conn.executemany("DELETE FROM task_cards WHERE id = ?", [(task_id,) for task_id in removed])
+            return (found - pending) | set(removed)
+
+    def replace_reference(
+        self,
+        columns: List[KanbanColumn],
+        users: List[KanbanUser],
+        groups: List[KanbanGroup],
+        group_member_names: Dict[int, List[str]],
+        version: Any = None,
+    ) -> None:
+        """Replace the stored columns, users and groups (reference cache contents)."""
+        with self._lock, self._conn:
+            self._store_reference(columns, users, groups, group_member_names)
+            self._set_meta("reference_version", _version_text(version))
+
+    def replace_blocked(self, blocked_by: Dict[int, List[str]]) -> Set[int]:
+        """
+        Replace the blocked-card markers.
+
+        Returns:
+            IDs of the cards whose blockers changed
+        """
+        with self._lock, self._conn:
+            before = self.blocked_tasks()
+            self._store_blocked(blocked_by)
+            return {task_id for task_id in set(before) | set(blocked_by) if before.get(task_id) != blocked_by.get(task_id)}
+
+    def _upsert_cards(self, cards: Iterable[TaskCard]) -> None:
+        placeholders = ", ".join("?" * len(CARD_FIELDS))
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO task_cards ({', '.join(CARD_FIELDS)}) VALUES ({placeholders})",
+            [tuple(_encode(value) for value in card) for card in cards],
+        )
+
+    def _store_reference(self, columns, users, groups, group_member_names: Dict[int, List[str]]) -> None:
+        self._conn.execute("DELETE FROM reference_rows")
+        rows = []
+        for kind, objects in (("column", columns), ("user", users), ("group", groups)):
+            for sort_order, obj in enumerate(objects):
+                data = {name: _encode(getattr(obj, name, None)) for name in REFERENCE_FIELDS[kind]}
+                rows.append((kind, obj.id, sort_order, json.dumps(data)))
+        self._conn.executemany("INSERT INTO reference_rows (kind, id, sort_order, data) VALUES (?, ?, ?, ?)", rows)
+        self._conn.execute("DELETE FROM group_members")
+        self._conn.executemany(
+            "INSERT INTO group_members (group_id, names) VALUES (?, ?)",
+            [(group_id, json.dumps(names)) for group_id, names in group_member_names.items()],
+        )
+
+    def _store_blocked(self, blocked_by: Dict[int, List[str]]) -> None:
+        self._conn.execute("DELETE FROM blocked_tasks")
+        self._conn.executemany(
+            "INSERT INTO blocked_tasks (task_id, blockers) VALUES (?, ?)",
+            [(task_id, json.dumps(blockers)) for task_id, blockers in blocked_by.items()],
+        )
+
+    # -----------------------------------------------------------------------
+    # Reads (same shapes as KanbanManager)
+    # -----------------------------------------------------------------------
+
+    def _reference(self, kind: str) -> List[Dict[str, Any]]:
+        return [
+            json.loads(row["data"])
+            for row in self._conn.execute(
+                "SELECT data FROM reference_rows WHERE kind = ? ORDER BY sort_order", (kind,)
+            )
+        ]
+
+    def columns(self) -> List[KanbanColumn]:
+        """Active columns in board order (detached, read-only)."""
+        with self._lock:
+            return [KanbanColumn(**data) for data in self._reference("column")]
+
+    def users(self) -> List[KanbanUser]:
+        """Active users ordered by display name (detached, read-only)."""
+        with self._lock:
+            return [KanbanUser(**data) for data in self._reference("user")]
+
+    def groups(self) -> List[KanbanGroup]:
+        """Active groups ordered by name (detached, read-only, member_count preset)."""
+        with self._lock:
+            groups = []
+            for data in self._reference("group"):
+                member_count = data.pop("member_count", 0)
+                group = KanbanGroup(**data)
+                group._member_count = member_count or 0
+                groups.append(group)
+            return groups
+
+    def group_member_names(self) -> Dict[int, List[str]]:
+        """group_id -> member display names."""
+        with self._lock:
+            return {
+                row["group_id"]: json.loads(row["names"])
+                for row in self._conn.execute("SELECT group_id, names FROM group_members")
+            }
+
+    def blocked_tasks(self) -> Dict[int, List[str]]:
+        """Same result as KanbanManager.get_blocked_tasks, as of the last sync."""
+        with self._lock:
+            return {
+                row["task_id"]: json.loads(row["blockers"])
+                for row in self._conn.execute("SELECT task_id, blockers FROM blocked_tasks")
+            }
+
+    def _cards(self, filters: Dict[str, Any], extra: str = "", params: Tuple[Any, ...] = ()) -> List[TaskCard]:
+        """
+        Cards matching the board filters, in (position, id) order.
+
+        ``search`` is a case-insensitive substring match on task number, title
+        and description preview; the full-text search needs PostgreSQL.
+        """
+        conditions = []
+        values: List[Any] = []
+        for name in ("assigned_to", "assigned_group_id", "priority"):
+            if filters.get(name) is not None:
+                conditions.append(f"{name} = ?")
+                values.append(filters[name])
+        search = (filters.get("search") or "").strip()
+        if search:
+            conditions.append(
+                "(task_number LIKE ? ESCAPE '\\' OR title LIKE ? ESCAPE '\\' "
+                "OR description_preview LIKE ? ESCAPE '\\')"
+            )
+            values.extend([_like_pattern(search)] * 3)
+        if extra:
+            conditions.append(extra)
+            values.extend(params)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            cards = [_decode_card(row) for row in self._conn.execute(f"SELECT * FROM task_cards {where}", values)]
+        # NUMERIC positions do not fit a REAL exactly, so order in Python
+        cards.sort(key=lambda card: (card.position, card.id))
+        return cards
+
+    def board_snapshot(self, filters: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None) -> BoardSnapshot:
+        """
+        Board snapshot served from the replica (see KanbanManager.get_board_snapshot).
+
+        Args:
+            filters: Same filter dict as get_board_snapshot
+            page_size: If given, only the first page_size cards per column are returned
+
+        Returns:
+            BoardSnapshot; ``synced_at`` is the time of the last successful sync
+        """
+        filters = filters or {}
+        columns = self.columns()
+        tasks_by_column: Dict[int, List[TaskCard]] = {column.id: [] for column in columns}
+        for card in self._cards(filters):
+            if card.column_id in tasks_by_column:
+                tasks_by_column[card.column_id].append(card)
+
+        column_totals: Dict[int, int] = {}
+        if page_size:
+            column_totals = {column_id: len(cards) for column_id, cards in tasks_by_column.items()}
+            tasks_by_column = {column_id: cards[:page_size] for column_id, cards in tasks_by_column.items()}
+
+        return BoardSnapshot(
+            columns=columns,
+            tasks_by_column=tasks_by_column,
+            users=self.users(),
+            groups=self.groups(),
+            group_member_names=self.group_member_names(),
+            synced_at=self.cursor,
+            column_totals=column_totals,
+            blocked_by=self.blocked_tasks(),
+        )
+
+    def tasks_by_column_page(
+        self,
+        column_id: int,
+        after: Optional[Tuple[Any, int]] = None,
+        limit: Optional[int] = 20,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> TaskPage:
+        """One page of a column's cards after the ``after`` (position, id) key."""
+        cards = self._cards(filters or {}, "column_id = ?", (column_id,))
+        if after is not None:
+            after_key = (Decimal(str(after[0])), after[1])
+            cards = [card for card in cards if (card.position, card.id) > after_key]
+        has_more = bool(limit) and len(cards) > limit
+        return TaskPage(tasks=cards[:limit] if has_more else cards, has_more=has_more)
+
+    def column_task_counts(self, filters: Optional[Dict[str, Any]] = None) -> Dict[int, int]:
+        """Card count per column for the filters (see KanbanManager.get_column_task_counts)."""
+        counts: Dict[int, int] = {}
+        for card in self._cards(filters or {}):
+            counts[card.column_id] = counts.get(card.column_id, 0) + 1
+        return counts
+
+    def changes_for(self, task_ids: Iterable[int], filters: Optional[Dict[str, Any]] = None) -> BoardChanges:
+        """
+        BoardChanges for cards the sync worker touched, filtered like the board.
+
+        Args:
+            task_ids: IDs from ReplicaSyncResult.task_ids
+            filters: Same filter dict as get_board_snapshot
+
+        Returns:
+            BoardChanges with matching cards and the rest as removed
+        """
+        task_ids = sorted(set(task_ids))
+        cards: List[TaskCard] = []
+        # Stay under SQLite's bound parameter limit
+        for start in range(0, len(task_ids), 500):
+            chunk = task_ids[start:start + 500]
+            cards.extend(self._cards(filters or {}, f"id IN ({','.join('?' * len(chunk))})", tuple(chunk)))
+        found = {card.id for card in cards}
+        return BoardChanges(
+            cursor=self.cursor,
+            tasks=cards,
+            removed_task_ids=[task_id for task_id in task_ids if task_id not in found],
+        )
+
+    # -----------------------------------------------------------------------
+    # Write queue
+    # -----------------------------------------------------------------------
+
+    def _pending_task_ids(self) -> Set[int]:
+        return {
+            row["task_id"]
+            for row in self._conn.execute("SELECT DISTINCT task_id FROM write_queue WHERE status = 'pending'")
+        }
+
+    def pending_task_ids(self) -> Set[int]:
+        """Tasks with queued writes (their replica rows show the local, unsynced state)."""
+        with self._lock:
+            return self._pending_task_ids()
+
+    def queue_move(self, user_id: int, task_id: int, column_id: int, before_task_id: Optional[int] = None) -> TaskCard:
+        """
+        Move a card locally and queue the move for replay.
+
+        The card gets a provisional position (midpoint or append); the server
+        assigns the real one when the write is replayed. A second move of a
+        card that is still queued replaces the first, keeping the original
+        base version so conflicts are judged against what the user saw.
+
+        Args:
+            user_id: User the write is replayed as
+            task_id: Task ID
+            column_id: Target column ID
+            before_task_id: Card to drop in front of (None = end of column)
+
+        Returns:
+            The card as now stored in the replica
+
+        Raises:
+            ValueError: If the task or column is not in the replica
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT * FROM task_cards WHERE id = ?", (task_id,)).fetchone()
+            if row is None:
+                raise ValueError(f"Task {task_id} not found")
+            card = _decode_card(row)
+            column = next((column for column in self.columns() if column.id == column_id), None)
+            if column is None:
+                raise ValueError(f"Column {column_id} not found")
+
+            existing = self._conn.execute(
+                "SELECT id, base_column_id FROM write_queue "
+                "WHERE status = 'pending' AND task_id = ? AND user_id = ? ORDER BY id DESC LIMIT 1",
+                (task_id, user_id),
+            ).fetchone()
+            base_column_id = existing["base_column_id"] if existing else card.column_id
+            if column_id == base_column_id:
+                operation, arguments = "reorder_task", {"before_task_id": before_task_id}
+            else:
+                operation, arguments = "move_task", {"new_column_id": column_id, "before_task_id": before_task_id}
+
+            if existing:
+                self._conn.execute(
+                    "UPDATE write_queue SET operation = ?, arguments = ?, queued_at = ? WHERE id = ?",
+                    (operation, json.dumps(arguments), datetime.now().isoformat(), existing["id"]),
+                )
+            else:
+                self._conn.execute(
+                    "INSERT INTO write_queue (user_id, operation, task_id, arguments, base_updated_at, "
+                    "base_column_id, queued_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        user_id, operation, task_id, json.dumps(arguments), _encode(card.updated_at),
+                        card.column_id, datetime.now().isoformat(),
+                    ),
+                )
+
+            moved = card._replace(
+                column_id=column_id,
+                column_name=column.name,
+                position=self._provisional_position(column_id, before_task_id, task_id),
+            )
+            self._upsert_cards([moved])
+            return moved
+
+    def _provisional_position(self, column_id: int, before_task_id: Optional[int], task_id: int) -> Decimal:
+        keys = sorted(
+            (Decimal(row["position"]), row["id"])
+            for row in self._conn.execute(
+                "SELECT id, position FROM task_cards WHERE column_id = ? AND id <> ?", (column_id, task_id)
+            )
+        )
+        index = next((i for i, (_, card_id) in enumerate(keys) if card_id == before_task_id), None)
+        if index is None:
+            return keys[-1][0] + 1 if keys else Decimal("1")
+        following = keys[index][0]
+        preceding = keys[index - 1][0] if index > 0 else following - 1
+        return (preceding + following) / 2
+
+    def pending_writes(self, user_id: int) -> List[QueuedWrite]:
+        """Queued writes of a user, oldest first."""
+        with self._lock:
+            return [
+                self._queued_write(row)
+                for row in self._conn.execute(
+                    "SELECT * FROM write_queue WHERE status = 'pending' AND user_id = ? ORDER BY id", (user_id,)
+                )
+            ]
+
+    def complete_write(self, write_id: int) -> None:
+        """Drop a write that was replayed successfully."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM write_queue WHERE id = ?", (write_id,))
+
+    def reject_write(self, write_id: int, status: str, reason: str) -> None:
+        """Keep a write that will not be replayed ('conflict' or 'failed') for the record."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE write_queue SET status = ?, last_error = ? WHERE id = ?", (status, reason, write_id)
+            )
+
+    def record_attempt(self, write_id: int, error: str) -> None:
+        """Count a replay attempt that failed because the database was unreachable."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE write_queue SET attempts = attempts + 1, last_error = ? WHERE id = ?", (error, write_id)
+            )
+
+    @staticmethod
+    def _queued_write(row: sqlite3.Row) -> QueuedWrite:
+        return QueuedWrite(
+            id=row["id"],
+            user_id=row["user_id"],
+            operation=row["operation"],
+            task_id=row["task_id"],
+            arguments=json.loads(row["arguments"]),
+            base_updated_at=datetime.fromisoformat(row["base_updated_at"]) if row["base_updated_at"] else None,
+            base_column_id=row["base_column_id"],
+            queued_at=datetime.fromisoformat(row["queued_at"]),
+            attempts=row["attempts"],
+            status=row["status"],
+            last_error=row["last_error"],
+        )
+
+
+class ReplicaSyncWorker:
+    """
+    Background thread that keeps a LocalReplica current.
+
+    Each cycle replays the user's queued writes, then pulls changes with
+    KanbanManager.get_changes_since from the replica's ``updated_at``
+    cursor (a full snapshot the first time and when columns change).
+    ``callback(result)`` is called from the worker thread after every
+    cycle; while PostgreSQL is unreachable cycles report ``online=False``
+    and queued writes stay queued.
+    """
+
+    def __init__(
+        self,
+        replica: LocalReplica,
+        manager: KanbanManager,
+        callback: Optional[Callable[[ReplicaSyncResult], None]] = None,
+        interval: float = 10.0,
+    ):
+        self.replica = replica
+        self.manager = manager
+        self.callback = callback
+        self.interval = interval
+        self.online: Optional[bool] = None
+        self._sync_lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the sync thread (no-op if already running); the first cycle runs immediately."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._wake_event.set()
+        self._thread = threading.Thread(target=self._run, name="kanban-replica-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the sync thread."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def sync_now(self) -> None:
+        """Run a cycle as soon as possible (e.g. after a queued write or a change notification)."""
+        self._wake_event.set()
+
+    def queue_move(self, task_id: int, column_id: int, before_task_id: Optional[int] = None) -> TaskCard:
+        """Move a card in the replica, queue the write and wake the worker (see LocalReplica.queue_move)."""
+        card = self.replica.queue_move(self.manager.current_user_id, task_id, column_id, before_task_id)
+        self.sync_now()
+        return card
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._wake_event.wait(self.interval)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+            result = self.sync_once()
+            if self.callback:
+                try:
+                    self.callback(result)
+                except Exception as e:
+                    logger.warning(f"Replica sync callback failed: {e}")
+
+    def sync_once(self) -> ReplicaSyncResult:
+        """Replay queued writes and pull server changes once (on the calling thread)."""
+        result = ReplicaSyncResult()
+        with self._sync_lock:
+            try:
+                self._replay(result)
+                self._pull(result)
+            except (DBAPIError, PoolTimeoutError) as e:
+                result.online = False
+                result.error = str(getattr(e, "orig", None) or e)
+            except Exception as e:
+                logger.warning(f"Replica sync failed: {e}")
+                result.error = str(e)
+
+        if result.online != self.online:
+            state = "online" if result.online else f"offline ({result.error})"
+            print(f"[Replica] Database {state}")
+            self.online = result.online
+        return result
+
+    def _replay(self, result: ReplicaSyncResult) -> None:
+        writes = self.replica.pending_writes(self.manager.current_user_id)
+        if not writes:
+            return
+        versions = self.manager.get_task_versions(sorted({write.task_id for write in writes}))
+        for write in writes:
+            conflict = self._conflict(write, versions.get(write.task_id))
+            if conflict:
+                self.replica.reject_write(write.id, "conflict", conflict)
+                write.status, write.last_error = "conflict", conflict
+                result.conflicts.append(write)
+                result.task_ids.add(write.task_id)
+                continue
+            try:
+                getattr(self.manager, write.operation)(write.task_id, **write.arguments)
+            except DBAPIError as e:
+                self.replica.record_attempt(write.id, str(e.orig or e))
+                raise
+            except ValueError as e:
+                self.replica.reject_write(write.id, "failed", str(e))
+                write.status, write.last_error = "failed", str(e)
+                result.failed.append(write)
+            else:
+                self.replica.complete_write(write.id)
+                result.applied += 1
+            result.task_ids.add(write.task_id)
+        rejected = {write.task_id for write in result.conflicts + result.failed}
+        if rejected:
+            # Put the server's version of the card back in place of the local move
+            result.task_ids |= self.replica.refresh_cards(rejected, self.manager.get_task_cards(sorted(rejected)))
+            print(
+                f"[Replica] Replayed {result.applied} queued writes, "
+                f"{len(result.conflicts)} conflicts, {len(result.failed)} failed"
+            )
+
+    @staticmethod
+    def _conflict(write: QueuedWrite, version: Optional[Tuple[datetime, int]]) -> Optional[str]:
+        """Why a queued write must not be replayed, or None if it is safe."""
+        if write.operation not in QUEUEABLE_OPERATIONS:
+            return f"Unsupported queued operation {write.operation!r}"
+        if version is None:
+            return "Task was deleted"
+        updated_at, column_id = version
+        # Another client moved the card after the user saw it: their move wins
+        if write.base_updated_at is not None and updated_at > write.base_updated_at and column_id != write.base_column_id:
+            return "Task was moved by someone else"
+        return None
+
+    def _pull(self, result: ReplicaSyncResult) -> None:
+        reference = self.manager.reference.get()
+        cursor = self.replica.cursor
+        changes = self.manager.get_changes_since(cursor) if cursor is not None else None
+        if changes is None or changes.columns_changed:
+            snapshot = self.manager.get_board_snapshot()
+            result.task_ids |= self.replica.replace_board(snapshot, reference_version=reference.version)
+            result.full_reload = True
+            result.columns_changed = changes is not None
+            return
+
+        if _version_text(reference.version) != self.replica.reference_version:
+            self.replica.replace_reference(
+                reference.columns, reference.users, reference.groups, reference.group_member_names(), reference.version
+            )
+            result.reference_changed = True
+
+        result.task_ids |= self.replica.apply_changes(changes)
+        if not changes.is_empty or result.applied:
+            # Finishing a task can unblock cards anywhere on the board
+            result.task_ids |= self.replica.replace_blocked(self.manager.get_blocked_tasks())
+
+
+def replica_path(db_manager: DatabaseManager) -> str:
+    """
+    SQLite file for a database: ``local_replica_path`` from the database
+    config, else ``cache/kanban_replica_<host>_<database>.sqlite3`` next to
+    the config directory.
+    """
+    db_config = db_manager.config["database"]
+    if db_config.get("local_replica_path"):
+        return str(db_config["local_replica_path"])
+    name = f"kanban_replica_{db_config['host']}_{db_config['database']}.sqlite3".replace(":", "_")
+    return str(Path(db_manager.config_path).resolve().parent.parent / "cache" / name)
+
+
+def open_local_replica(db_manager: DatabaseManager) -> Optional[LocalReplica]:
+    """
+    Open the local replica for a database manager.
+
+    Returns:
+        The LocalReplica, or None if ``local_replica`` is false in the database config
+    """
+    if not db_manager.config["database"].get("local_replica", True):
+        return None
+    return LocalReplica(replica_path(db_manager))
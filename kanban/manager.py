@@ -3,28 +3,227 @@
 from __future__ import annotations
 
 import os
+import re
 import shutil
-from datetime import date, datetime
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Date, Float, and_, case, cast, column, func, literal, literal_column, or_, select, table, tuple_
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, aliased, contains_eager, joinedload
 
+from kanban.archive import ALL_TASKS, task_source
 from kanban.audit_logger import AuditLogger
-from kanban.database import DatabaseManager
+from kanban.database import DatabaseManager, instrument_operations
+from kanban.dependency_graph import (
+    BLOCKING_TYPE,
+    DEPENDENCY_LOCK_ID,
+    DEPENDENCY_TYPES,
+    CriticalPath,
+    blocked_tasks,
+    blocker_closure,
+    closure_tasks,
+    creates_cycle,
+    critical_path,
+    dependent_closure,
+    get_dependency_cache,
+)
 from kanban.models import (
+    KanbanActivityLog,
     KanbanAttachment,
     KanbanColumn,
     KanbanComment,
+    KanbanDependency,
     KanbanGroup,
     KanbanGroupMember,
     KanbanSession,
     KanbanTask,
+    KanbanTaskTombstone,
     KanbanUser,
+    TASK_NUMBER_SEQUENCE,
+    format_task_number,
+)
+from kanban.reference_cache import get_reference_cache
+
+# Must match the idx_tasks_search expression exactly for the GIN index to be used
+TASK_SEARCH_VECTOR = literal_column(
+    "to_tsvector('english', kanban_tasks.title || ' ' || COALESCE(kanban_tasks.description, ''))"
+)
+# Same expression over hot + archived tasks (kanban.archive.task_source); matches idx_tasks_archive_search
+ALL_TASKS_SEARCH_VECTOR = literal_column(
+    f"to_tsvector('english', {ALL_TASKS}.title || ' ' || COALESCE({ALL_TASKS}.description, ''))"
+)
+
+# Window re-read by get_changes_since to cover transactions that committed late
+SYNC_OVERLAP = timedelta(seconds=5)
+
+# Card ordering keys (kanban_tasks.position, NUMERIC(24, 12)). Appends step by
+# POSITION_STEP; drops between two cards take the midpoint. A column is renumbered
+# in the background once a gap falls below REBALANCE_GAP, and synchronously
+# when a gap is too small to split (MIN_POSITION_GAP).
+POSITION_STEP = Decimal("1")
+POSITION_QUANTUM = Decimal("1e-12")
+REBALANCE_GAP = Decimal("1e-6")
+MIN_POSITION_GAP = Decimal("1e-10")
+
+# Slack on the "no activity before the task was created" bound used to prune
+# activity log partitions (audit timestamps come from client clocks)
+ACTIVITY_CLOCK_SKEW = timedelta(days=1)
+
+# Fields accepted by bulk_create_tasks (besides title/column_id) and bulk_update_tasks
+BULK_CREATE_FIELDS = frozenset({
+    "title", "column_id", "description", "assigned_to", "assigned_group_id", "priority",
+    "category", "deadline", "estimated_hours", "tags", "is_workflow_task", "workflow_type",
+    "workflow_reference", "workflow_metadata",
+})
+BULK_UPDATE_FIELDS = frozenset({
+    "title", "description", "assigned_to", "assigned_group_id", "priority", "category",
+    "deadline", "estimated_hours", "actual_hours", "tags", "status",
+})
+
+# Materialized daily rollup behind the Reports tab (scripts/migrate_add_reporting_views.sql).
+# assignee_id / group_id are 0 for unassigned tasks.
+TASK_ROLLUP = table(
+    "mv_task_rollup",
+    column("created_on"),
+    column("assignee_id"),
+    column("group_id"),
+    column("total_tasks"),
+    column("done_tasks"),
+    column("completed_tasks"),
+    column("in_progress_tasks"),
+    column("overdue_tasks"),
+    column("with_deadline"),
+    column("on_time"),
+    column("completed_with_date"),
+    column("completion_days"),
 )
 
 
+# Characters of the description shipped with a card (the card shows an 80-character preview)
+CARD_DESCRIPTION_CHARS = 120
+
+
+class TaskCard(NamedTuple):
+    """
+    What the board needs to draw one card, projected straight from SQL.
+
+    Heavy task columns (full description, workflow_metadata, tags) and the
+    creator/column objects are not loaded; the detail dialog fetches the
+    full task with get_task when it opens.
+    """
+
+    id: int
+    task_number: str
+    title: str
+    description_preview: Optional[str]
+    column_id: int
+    column_name: str
+    position: Decimal
+    priority: str
+    status: Optional[str]
+    deadline: Optional[date]
+    completed_at: Optional[datetime]
+    assigned_to: Optional[int]
+    assignee_name: Optional[str]
+    assignee_color: Optional[str]
+    assigned_group_id: Optional[int]
+    group_name: Optional[str]
+    group_color: Optional[str]
+    group_member_count: int
+    comment_count: int
+    attachment_count: int
+    # Row version, used by the local replica (kanban.local_replica) to detect conflicting writes
+    updated_at: Optional[datetime] = None
+
+    @property
+    def is_overdue(self) -> bool:
+        """Same rule as KanbanTask.is_overdue: past deadline, not archived and not in Done."""
+        if not self.deadline or self.status == "archived" or self.column_name == "Done":
+            return False
+        return datetime.now().date() > self.deadline
+
+    @property
+    def was_completed_late(self) -> bool:
+        """Same rule as KanbanTask.was_completed_late."""
+        if not self.deadline or not self.completed_at:
+            return False
+        return self.completed_at.date() > self.deadline
+
+
+@dataclass
+class BoardSnapshot:
+    """Everything the board needs to render, fetched in one session."""
+
+    columns: List[KanbanColumn]
+    tasks_by_column: Dict[int, List[TaskCard]]
+    users: List[KanbanUser]
+    groups: List[KanbanGroup]
+    group_member_names: Dict[int, List[str]] = field(default_factory=dict)
+    synced_at: Optional[datetime] = None
+    # Filtered task count per column when tasks_by_column holds only the first page
+    column_totals: Dict[int, int] = field(default_factory=dict)
+    # task_id -> task numbers of its open blockers (see KanbanManager.get_blocked_tasks)
+    blocked_by: Dict[int, List[str]] = field(default_factory=dict)
+
+    def column_count(self, column_id: int) -> int:
+        """Number of (filtered) tasks in a column, used for badges and WIP limits."""
+        if column_id in self.column_totals:
+            return self.column_totals[column_id]
+        return len(self.tasks_by_column.get(column_id, []))
+
+
+@dataclass
+class TaskPage:
+    """One keyset page of a column's tasks, ordered by (position, id)."""
+
+    tasks: List[TaskCard]
+    has_more: bool
+    total: Optional[int] = None
+
+    @property
+    def next_cursor(self) -> Optional[Tuple[Decimal, int]]:
+        """``after`` value for the next page (None once the column is exhausted)."""
+        if not self.has_more or not self.tasks:
+            return None
+        return self.tasks[-1].position, self.tasks[-1].id
+
+
+@dataclass
+class ActivityPage:
+    """One keyset page of a task's activity log, newest first."""
+
+    activities: List[KanbanActivityLog]
+    has_more: bool
+
+    @property
+    def next_before_id(self) -> Optional[int]:
+        """``before_id`` for the next (older) page (None once the history is exhausted)."""
+        if not self.has_more or not self.activities:
+            return None
+        return self.activities[-1].id
+
+
+@dataclass
+class BoardChanges:
+    """Task changes since a sync cursor, used to patch the board incrementally."""
+
+    cursor: datetime
+    tasks: List[TaskCard] = field(default_factory=list)
+    removed_task_ids: List[int] = field(default_factory=list)
+    columns_changed: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        """True when nothing on the board needs to be redrawn."""
+        return not self.tasks and not self.removed_task_ids and not self.columns_changed
+
+
+@instrument_operations
 class KanbanManager:
     """
     Core business logic for Kanban operations.
@@ -53,6 +252,10 @@ class KanbanManager:
         self.user_agent = user_agent
         self.session_token = session_token
         self.logger = AuditLogger(db_manager)
+        self.reference = get_reference_cache(db_manager)
+        self.dependency_cache = get_dependency_cache(db_manager)
+        self._rebalance_lock = threading.Lock()
+        self._rebalance_pending: set = set()
 
     # -----------------------------------------------------------------------
     # Task CRUD Operations
@@ -104,24 +307,19 @@ class KanbanManager:
         """
         session = self.db.get_session()
         try:
-            # Generate task number
-            task_number = self._generate_task_number(session)
-
             # Get max position in column
             max_position = (
                 session.query(func.max(KanbanTask.position))
                 .filter_by(column_id=column_id, is_deleted=False)
                 .scalar()
-                or 0
             )
 
             # Create task
             task = KanbanTask(
                 title=title,
-                task_number=task_number,
                 description=description,
                 column_id=column_id,
-                position=float(max_position) + 1.0,
+                position=self._append_position(max_position),
                 assigned_to=assigned_to,
                 assigned_group_id=assigned_group_id,
                 created_by=self.current_user_id,
@@ -137,12 +335,13 @@ class KanbanManager:
             )
 
             session.add(task)
-            session.flush()  # Get task ID before logging
+            session.flush()  # Get task ID and task number (column default) before logging
 
             # Log creation
-            self.logger.log_task_created(task, self.current_user_id)
+            self.logger.log_task_created(task, self.current_user_id, session=session)
 
             session.commit()
+            self.db.record_writes()
             return task
 
         except Exception as e:
@@ -210,18 +409,19 @@ class KanbanManager:
 
             # Track changes
             changes = {}
-            for field, new_value in updates.items():
-                if hasattr(task, field):
-                    old_value = getattr(task, field)
+            for field_name, new_value in updates.items():
+                if hasattr(task, field_name):
+                    old_value = getattr(task, field_name)
                     if old_value != new_value:
-                        changes[field] = {"old": old_value, "new": new_value}
-                        setattr(task, field, new_value)
+                        changes[field_name] = {"old": old_value, "new": new_value}
+                        setattr(task, field_name, new_value)
 
             # Log changes
             if changes:
-                self.logger.log_task_updated(task, self.current_user_id, changes)
+                self.logger.log_task_updated(task, self.current_user_id, changes, session=session)
 
             session.commit()
+            self.db.record_writes()
             
             # Make the task object persistent after commit
             session.expire_all()
@@ -254,16 +454,17 @@ class KanbanManager:
 
             if hard_delete:
                 # Permanent deletion
-                self.logger.log_task_deleted(task, self.current_user_id)
+                self.logger.log_task_deleted(task, self.current_user_id, session=session, hard_delete=True)
                 session.delete(task)
             else:
                 # Soft delete
                 task.is_deleted = True
                 task.deleted_at = datetime.now()
                 task.deleted_by = self.current_user_id
-                self.logger.log_task_deleted(task, self.current_user_id)
+                self.logger.log_task_deleted(task, self.current_user_id, session=session)
 
             session.commit()
+            self.db.record_writes()
 
         except Exception as e:
             session.rollback()
@@ -271,7 +472,13 @@ class KanbanManager:
         finally:
             session.close()
 
-    def move_task(self, task_id: int, new_column_id: int, new_position: Optional[float] = None) -> KanbanTask:
+    def move_task(
+        self,
+        task_id: int,
+        new_column_id: int,
+        new_position: Optional[float] = None,
+        before_task_id: Optional[int] = None,
+    ) -> KanbanTask:
         """
         Move task to different column with audit trail.
 
@@ -279,6 +486,8 @@ class KanbanManager:
             task_id: Task ID
             new_column_id: Target column ID
             new_position: Optional position in new column
+            before_task_id: Optional card in the new column to drop in front of
+                (ignored when new_position is given; default appends)
 
         Returns:
             Updated task object
@@ -303,14 +512,13 @@ class KanbanManager:
             print(f"[Manager] Task {task_id} old column {old_column_id}")
 
             # Update position
+            needs_rebalance = False
             if new_position is None:
-                max_pos = (
-                    session.query(func.max(KanbanTask.position))
-                    .filter_by(column_id=new_column_id, is_deleted=False)
-                    .scalar()
-                    or 0
+                new_position, needs_rebalance = self._position_before(
+                    session, new_column_id, before_task_id, exclude_task_id=task_id
                 )
-                new_position = float(max_pos) + 1.0
+            else:
+                new_position = Decimal(str(new_position)).quantize(POSITION_QUANTUM)
 
             task.column_id = new_column_id
             task.position = new_position
@@ -337,13 +545,16 @@ class KanbanManager:
                 if task.status not in ["blocked", "archived"]:
                     task.status = "active"
 
+            # Audit row commits atomically with the move
+            self.logger.log_task_moved(task, self.current_user_id, old_column_id, new_column_id, session=session)
+
             # Commit the changes
             session.commit()
+            self.db.record_writes()
             print(f"[Manager] Task {task_id} move committed successfully to column {new_column_id}")
-            
-            # Log move before closing session (while task is still attached)
-            self.logger.log_task_moved(task, self.current_user_id, old_column_id, new_column_id)
-            
+            if needs_rebalance:
+                self._schedule_rebalance(new_column_id)
+
             session.close()
             
             print(f"[Manager] Task {task_id} move complete")
@@ -356,6 +567,173 @@ class KanbanManager:
             print(f"[Manager] move_task error: {e}")
             raise e
 
+    def reorder_task(self, task_id: int, before_task_id: Optional[int] = None) -> Decimal:
+        """
+        Move a card to a new spot within its column (a single-row UPDATE).
+
+        The new ordering key is the midpoint between the neighbouring cards,
+        so no other row is touched unless the column has become too dense.
+        The change is logged as a position update.
+
+        Args:
+            task_id: Task ID
+            before_task_id: Card to place it in front of (None = end of column)
+
+        Returns:
+            The task's new position
+
+        Raises:
+            ValueError: If task not found
+        """
+        session = self.db.get_session()
+        try:
+            current = (
+                session.query(KanbanTask.column_id, KanbanTask.position)
+                .filter_by(id=task_id, is_deleted=False)
+                .first()
+            )
+            if current is None:
+                raise ValueError(f"Task {task_id} not found")
+            column_id, old_position = current
+
+            position, needs_rebalance = self._position_before(
+                session, column_id, before_task_id, exclude_task_id=task_id
+            )
+            session.query(KanbanTask).filter(KanbanTask.id == task_id).update(
+                {KanbanTask.position: position}, synchronize_session=False
+            )
+
+            # Audit row commits atomically with the reorder
+            changes = {"position": {"old": old_position, "new": position}}
+            activities = AuditLogger.task_updated_entries(task_id, self.current_user_id, changes)
+            AuditLogger.attach_task_snapshots(session, activities, {task_id: {"position": position}})
+            self.logger.log_activities(activities, session=session)
+
+            session.commit()
+            self.db.record_writes()
+            if needs_rebalance:
+                self._schedule_rebalance(column_id)
+            return position
+
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def rebalance_column(self, column_id: int) -> int:
+        """
+        Renumber a column's positions to POSITION_STEP, 2 * POSITION_STEP, ...
+
+        Keeps the current order (position, id). Runs as one UPDATE.
+
+        Args:
+            column_id: Column ID
+
+        Returns:
+            Number of tasks renumbered
+        """
+        session = self.db.get_session()
+        try:
+            count = self._rebalance_column(session, column_id)
+            session.commit()
+            return count
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def _position_before(
+        self,
+        session: Session,
+        column_id: int,
+        before_task_id: Optional[int],
+        exclude_task_id: Optional[int] = None,
+    ):
+        """
+        Ordering key that places a card just before ``before_task_id``.
+
+        Appends to the column when before_task_id is None or not in the column.
+        If the gap to the previous card is too small to split, the column is
+        renumbered in this session first.
+
+        Returns:
+            (position, needs_rebalance): needs_rebalance is True when the gap
+            left is small enough that the column should be renumbered soon
+        """
+        siblings = [KanbanTask.column_id == column_id, KanbanTask.is_deleted == False]  # noqa: E712
+        if exclude_task_id is not None:
+            siblings.append(KanbanTask.id != exclude_task_id)
+
+        anchor = None
+        if before_task_id is not None:
+            anchor = session.query(KanbanTask.position).filter(*siblings, KanbanTask.id == before_task_id).scalar()
+        if anchor is None:
+            last = session.query(func.max(KanbanTask.position)).filter(*siblings).scalar()
+            return self._append_position(last), False
+
+        anchor = Decimal(str(anchor))
+        previous = (
+            session.query(func.max(KanbanTask.position))
+            .filter(*siblings, KanbanTask.position < anchor)
+            .scalar()
+        )
+        previous = Decimal(str(previous)) if previous is not None else anchor - POSITION_STEP
+
+        gap = anchor - previous
+        if gap < MIN_POSITION_GAP:
+            print(f"[Manager] Column {column_id} positions too dense, rebalancing")
+            self._rebalance_column(session, column_id)
+            return self._position_before(session, column_id, before_task_id, exclude_task_id)
+
+        return ((previous + anchor) / 2).quantize(POSITION_QUANTUM), gap / 2 < REBALANCE_GAP
+
+    @staticmethod
+    def _append_position(last, steps: int = 1) -> Decimal:
+        """Ordering key ``steps`` POSITION_STEPs after ``last`` (a column's max position, None if empty)."""
+        return (Decimal(str(last or 0)) + POSITION_STEP * steps).quantize(POSITION_QUANTUM)
+
+    @staticmethod
+    def _rebalance_column(session: Session, column_id: int) -> int:
+        """Renumber a column's live tasks in (position, id) order with one UPDATE."""
+        ranked = (
+            select(
+                KanbanTask.id,
+                func.row_number().over(order_by=(KanbanTask.position, KanbanTask.id)).label("rank"),
+            )
+            .where(KanbanTask.column_id == column_id, KanbanTask.is_deleted == False)  # noqa: E712
+            .subquery()
+        )
+        return (
+            session.query(KanbanTask)
+            .filter(KanbanTask.id == ranked.c.id)
+            .update({KanbanTask.position: ranked.c.rank * POSITION_STEP}, synchronize_session=False)
+        )
+
+    def _schedule_rebalance(self, column_id: int) -> None:
+        """Renumber a column on a background thread (at most one pending per column)."""
+        with self._rebalance_lock:
+            if column_id in self._rebalance_pending:
+                return
+            self._rebalance_pending.add(column_id)
+        threading.Thread(
+            target=self._background_rebalance,
+            args=(column_id,),
+            name=f"rebalance-column-{column_id}",
+            daemon=True,
+        ).start()
+
+    def _background_rebalance(self, column_id: int) -> None:
+        try:
+            count = self.rebalance_column(column_id)
+            print(f"[Manager] Rebalanced {count} positions in column {column_id}")
+        except Exception as e:
+            print(f"[Manager] Background rebalance of column {column_id} failed: {e}")
+        finally:
+            with self._rebalance_lock:
+                self._rebalance_pending.discard(column_id)
+
     def get_tasks_by_column(self, column_id: int) -> List[KanbanTask]:
         """
         Get all tasks in a column, ordered by position.
@@ -368,87 +746,780 @@ class KanbanManager:
         """
         session = self.db.get_session()
         try:
-            tasks = (
-                session.query(KanbanTask)
+            # Group member counts come from one aggregated subquery, not one query per task
+            member_counts = self._group_member_counts_subquery(session)
+            rows = (
+                session.query(KanbanTask, func.coalesce(member_counts.c.member_count, 0))
+                .outerjoin(member_counts, member_counts.c.group_id == KanbanTask.assigned_group_id)
                 .options(
                     joinedload(KanbanTask.assignee),
                     joinedload(KanbanTask.assigned_group),
                     joinedload(KanbanTask.creator),
                     joinedload(KanbanTask.column),
                 )
-                .filter_by(column_id=column_id, is_deleted=False)
+                .filter(KanbanTask.column_id == column_id, KanbanTask.is_deleted == False)  # noqa: E712
                 .order_by(KanbanTask.position)
                 .all()
             )
-            
-            # Eagerly load member counts for assigned groups
-            for task in tasks:
+
+            tasks = []
+            for task, member_count in rows:
                 if task.assigned_group:
-                    member_count = (
-                        session.query(func.count(KanbanGroupMember.id))
-                        .filter(KanbanGroupMember.group_id == task.assigned_group.id)
-                        .scalar()
-                    )
-                    task.assigned_group._member_count = member_count or 0
-            
+                    task.assigned_group._member_count = member_count
+                tasks.append(task)
             return tasks
         finally:
             session.close()
 
-    def get_tasks_by_user(self, user_id: int) -> List[KanbanTask]:
+    def get_tasks_by_user(self, user_id: int) -> List[KanbanTask]:
+        """
+        Get all tasks assigned to a user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            List of tasks
+        """
+        session = self.db.get_session()
+        try:
+            tasks = (
+                session.query(KanbanTask)
+                .options(
+                    joinedload(KanbanTask.assignee),
+                    joinedload(KanbanTask.creator),
+                    joinedload(KanbanTask.column),
+                )
+                .filter_by(assigned_to=user_id, is_deleted=False)
+                .order_by(KanbanTask.created_at.desc())
+                .all()
+            )
+            return tasks
+        finally:
+            session.close()
+
+    def search_tasks(
+        self, query: str, limit: Optional[int] = 50, offset: int = 0, include_archived: bool = False
+    ) -> List[KanbanTask]:
+        """
+        Full-text search over title and description, plus task number lookup.
+
+        Uses the ``idx_tasks_search`` GIN index (websearch syntax such as
+        ``"exact phrase"`` and ``-exclude`` is supported; plain words match
+        as prefixes). Results are ordered by task number match, then
+        ``ts_rank``.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results (None for all)
+            offset: Number of results to skip (paging)
+            include_archived: Also search archived tasks (idx_tasks_archive_search)
+
+        Returns:
+            List of matching tasks, best match first
+        """
+        tasks_entity = task_source(include_archived)
+        vector = ALL_TASKS_SEARCH_VECTOR if include_archived else TASK_SEARCH_VECTOR
+        condition = self._search_condition(query, tasks_entity, vector)
+        if condition is None:
+            return []
+
+        session = self.db.get_session()
+        try:
+            tsquery = self._search_tsquery(query)
+            rank = func.ts_rank(vector, tsquery) if tsquery is not None else literal(0)
+            number_match = self._task_number_condition(query, tasks_entity)
+            tasks = (
+                session.query(tasks_entity)
+                .options(
+                    joinedload(tasks_entity.assignee),
+                    joinedload(tasks_entity.creator),
+                    joinedload(tasks_entity.column),
+                )
+                .filter(condition, tasks_entity.is_deleted == False)  # noqa: E712
+                .order_by(
+                    case((number_match, 0), else_=1),
+                    rank.desc(),
+                    tasks_entity.id.desc(),
+                )
+                .offset(offset)
+                .limit(limit)
+                .all()
+            )
+            return tasks
+        finally:
+            session.close()
+
+    @staticmethod
+    def _search_tsquery(query: str):
+        """
+        Build the tsquery for a search string.
+
+        Plain words become prefix matches (``foo bar`` -> ``foo:* & bar:*``)
+        so search-as-you-type works; input using websearch syntax (quotes,
+        ``-word``, ``or``) goes through ``websearch_to_tsquery``.
+        """
+        query = (query or "").strip()
+        if not query:
+            return None
+        if '"' in query or " or " in query.lower() or query.startswith("-") or " -" in query:
+            return func.websearch_to_tsquery("english", query)
+
+        words = re.findall(r"\w+", query)
+        if not words:
+            return None
+        return func.to_tsquery("english", " & ".join(f"{word}:*" for word in words))
+
+    @staticmethod
+    def _task_number_condition(query: str, tasks=KanbanTask):
+        """Match ``TASK-0042``, ``task-00`` (prefix) or a bare ``42`` against task_number."""
+        query = (query or "").strip().upper()
+        if query.isdigit():
+            return tasks.task_number == f"TASK-{int(query):04d}"
+        return tasks.task_number.like(f"{query}%")
+
+    @classmethod
+    def _search_condition(cls, query: str, tasks=KanbanTask, vector=TASK_SEARCH_VECTOR):
+        """WHERE clause for a search string (full-text or task number), or None if empty."""
+        if not (query or "").strip():
+            return None
+        number_match = cls._task_number_condition(query, tasks)
+        tsquery = cls._search_tsquery(query)
+        if tsquery is None:
+            return number_match
+        return or_(vector.op("@@")(tsquery), number_match)
+
+    def get_board_snapshot(
+        self, filters: Optional[Dict[str, Any]] = None, page_size: Optional[int] = None
+    ) -> BoardSnapshot:
+        """
+        Load the whole board (columns, ordered tasks, users, groups) in one session.
+
+        Runs a fixed number of queries regardless of how many columns or
+        cards exist, so the board refresh, filter dropdowns and WIP badges
+        can all render from a single result. Columns, users and groups come
+        from the reference cache; blocked cards from one dependency query
+        (cached per board version).
+
+        Args:
+            filters: Optional dict with any of ``assigned_to``,
+                ``assigned_group_id``, ``priority`` and ``search``
+            page_size: If given, only the first page_size tasks of each column
+                are loaded and ``column_totals`` holds the full counts (fetch
+                further pages with get_tasks_by_column_page)
+
+        Returns:
+            BoardSnapshot with tasks grouped by column id
+        """
+        filters = filters or {}
+        reference = self.reference.get()
+        columns = reference.columns
+        session = self.db.get_session()
+        try:
+            # Server clock at the start of the read, used as the delta-sync cursor
+            synced_at = session.query(func.localtimestamp()).scalar()
+
+            query = self._board_card_query(session, filters)
+            column_totals: Dict[int, int] = {}
+            if page_size:
+                # First page of every column via LATERAL ... LIMIT on (column_id, position, id)
+                first_page = self._apply_task_filters(
+                    select(KanbanTask.id)
+                    .where(KanbanTask.column_id == KanbanColumn.id, KanbanTask.is_deleted == False)  # noqa: E712
+                    .order_by(KanbanTask.position, KanbanTask.id)
+                    .limit(page_size)
+                    .correlate(KanbanColumn),
+                    filters,
+                ).lateral("first_page")
+                page_ids = (
+                    select(first_page.c.id)
+                    .select_from(KanbanColumn)
+                    .join(first_page, literal(True))
+                    .where(KanbanColumn.is_active == True)  # noqa: E712
+                )
+                query = query.filter(KanbanTask.id.in_(page_ids))
+                counts = self._column_task_counts(session, filters)
+                column_totals = {column.id: counts.get(column.id, 0) for column in columns}
+
+            tasks_by_column: Dict[int, List[TaskCard]] = {column.id: [] for column in columns}
+            for card in self._task_cards(query.all()):
+                tasks_by_column.setdefault(card.column_id, []).append(card)
+
+            blocked = self._dependency_graph(("blocked",), blocked_tasks, session=session)
+
+            return BoardSnapshot(
+                columns=columns,
+                tasks_by_column=tasks_by_column,
+                users=list(reference.users),
+                groups=list(reference.groups),
+                group_member_names=reference.group_member_names(),
+                synced_at=synced_at,
+                column_totals=column_totals,
+                blocked_by={task_id: list(blockers) for task_id, blockers in blocked.items()},
+            )
+        finally:
+            session.close()
+
+    def get_tasks_by_column_page(
+        self,
+        column_id: int,
+        after: Optional[Tuple[Any, int]] = None,
+        limit: Optional[int] = 20,
+        filters: Optional[Dict[str, Any]] = None,
+        include_total: bool = False,
+    ) -> TaskPage:
+        """
+        Get one page of a column's tasks using keyset pagination.
+
+        Pages are ordered by (position, id) and start strictly after the
+        ``after`` key, so each page is an index range scan on
+        idx_tasks_column_position instead of an OFFSET.
+
+        Args:
+            column_id: Column ID
+            after: (position, id) of the last task already shown (None = first page)
+            limit: Page size (None = everything after ``after``)
+            filters: Same filter dict as get_board_snapshot
+            include_total: Also count the column's (filtered) tasks
+
+        Returns:
+            TaskPage with the tasks and whether more follow
+        """
+        filters = filters or {}
+        session = self.db.get_session()
+        try:
+            query = self._board_card_query(session, filters).filter(KanbanTask.column_id == column_id)
+            if after is not None:
+                query = query.filter(tuple_(KanbanTask.position, KanbanTask.id) > tuple_(*after))
+            if limit:
+                query = query.limit(limit + 1)
+
+            tasks = self._task_cards(query.all())
+            has_more = bool(limit) and len(tasks) > limit
+            page = TaskPage(tasks=tasks[:limit] if has_more else tasks, has_more=has_more)
+            if include_total:
+                page.total = self._column_task_counts(session, filters, column_id).get(column_id, 0)
+            return page
+        finally:
+            session.close()
+
+    def get_column_task_counts(self, filters: Optional[Dict[str, Any]] = None) -> Dict[int, int]:
+        """
+        Count (filtered) live tasks per active column in one grouped query.
+
+        Args:
+            filters: Same filter dict as get_board_snapshot
+
+        Returns:
+            Dict of column_id -> task count (columns without tasks are omitted)
+        """
+        session = self.db.get_session()
+        try:
+            return self._column_task_counts(session, filters or {})
+        finally:
+            session.close()
+
+    def _column_task_counts(
+        self, session: Session, filters: Dict[str, Any], column_id: Optional[int] = None
+    ) -> Dict[int, int]:
+        query = (
+            session.query(KanbanTask.column_id, func.count(KanbanTask.id))
+            .join(KanbanTask.column)
+            .filter(KanbanTask.is_deleted == False, KanbanColumn.is_active == True)  # noqa: E712
+        )
+        if column_id is not None:
+            query = query.filter(KanbanTask.column_id == column_id)
+        query = self._apply_task_filters(query, filters)
+        return dict(query.group_by(KanbanTask.column_id).all())
+
+    def get_changes_since(self, cursor: datetime, filters: Optional[Dict[str, Any]] = None) -> BoardChanges:
+        """
+        Get board changes since a sync cursor (for incremental auto-refresh).
+
+        An idle board costs a single statement: three indexed EXISTS probes
+        on ``kanban_tasks.updated_at``, ``kanban_task_tombstones.changed_at``
+        and ``kanban_columns.modified_at``. Changed tasks are only loaded
+        when one of them finds something.
+
+        Args:
+            cursor: ``synced_at`` of the last snapshot or ``cursor`` of the last BoardChanges
+            filters: Same filter dict as get_board_snapshot
+
+        Returns:
+            BoardChanges with the new cursor, changed tasks that match the
+            filters and ids of tasks to drop from the board
+        """
+        filters = filters or {}
+        # Re-read a small window so rows committed by slower transactions are not missed
+        since = cursor - SYNC_OVERLAP
+        session = self.db.get_session()
+        try:
+            server_now, tasks_changed, tombstones_added, columns_changed = session.query(
+                func.localtimestamp(),
+                session.query(KanbanTask.id).filter(KanbanTask.updated_at >= since).exists(),
+                session.query(KanbanTaskTombstone.id).filter(KanbanTaskTombstone.changed_at >= since).exists(),
+                session.query(KanbanColumn.id).filter(KanbanColumn.modified_at >= since).exists(),
+            ).one()
+
+            changes = BoardChanges(cursor=server_now, columns_changed=bool(columns_changed))
+            if columns_changed:
+                # Column edits by another client: don't wait for the version check
+                self.reference.invalidate()
+            if columns_changed or not (tasks_changed or tombstones_added):
+                return changes
+
+            removed_ids = set()
+            if tombstones_added:
+                removed_ids.update(
+                    task_id
+                    for (task_id,) in session.query(KanbanTaskTombstone.task_id)
+                    .filter(KanbanTaskTombstone.changed_at >= since)
+                    .distinct()
+                )
+
+            if tasks_changed:
+                changed_ids = [
+                    task_id for (task_id,) in session.query(KanbanTask.id).filter(KanbanTask.updated_at >= since)
+                ]
+                query = self._board_card_query(session, filters).filter(KanbanTask.id.in_(changed_ids))
+                changes.tasks = self._task_cards(query.all())
+                # Changed but soft-deleted, archived column or filtered out -> drop from board
+                removed_ids.update(changed_ids)
+
+            removed_ids.difference_update(task.id for task in changes.tasks)
+            changes.removed_task_ids = sorted(removed_ids)
+            return changes
+        finally:
+            session.close()
+
+    def get_task_cards(self, task_ids: List[int]) -> List[TaskCard]:
+        """
+        Board cards for specific tasks (live tasks in active columns only).
+
+        Args:
+            task_ids: Task IDs
+
+        Returns:
+            List of TaskCard in board order
+        """
+        if not task_ids:
+            return []
+        session = self.db.get_session()
+        try:
+            return self._task_cards(self._board_card_query(session, {}).filter(KanbanTask.id.in_(task_ids)).all())
+        finally:
+            session.close()
+
+    def get_task_versions(self, task_ids: List[int]) -> Dict[int, Tuple[datetime, int]]:
+        """
+        Current row version of live tasks, in one query.
+
+        Args:
+            task_ids: Task IDs
+
+        Returns:
+            Dict of task_id -> (updated_at, column_id); deleted or missing tasks are omitted
+        """
+        if not task_ids:
+            return {}
+        session = self.db.get_session()
+        try:
+            rows = (
+                session.query(KanbanTask.id, KanbanTask.updated_at, KanbanTask.column_id)
+                .filter(KanbanTask.id.in_(task_ids), KanbanTask.is_deleted == False)  # noqa: E712
+                .all()
+            )
+            return {task_id: (updated_at, column_id) for task_id, updated_at, column_id in rows}
+        finally:
+            session.close()
+
+    def _board_card_query(self, session: Session, filters: Dict[str, Any]):
+        """
+        Card query used to render the board: live tasks in active columns as
+        TaskCard columns (assignee and group joined in, comment, attachment
+        and group member counts as subqueries), in board order.
+        """
+        comment_count = (
+            select(func.count(KanbanComment.id))
+            .where(KanbanComment.task_id == KanbanTask.id, KanbanComment.is_deleted == False)  # noqa: E712
+            .correlate(KanbanTask)
+            .scalar_subquery()
+        )
+        attachment_count = (
+            select(func.count(KanbanAttachment.id))
+            .where(KanbanAttachment.task_id == KanbanTask.id, KanbanAttachment.is_deleted == False)  # noqa: E712
+            .correlate(KanbanTask)
+            .scalar_subquery()
+        )
+        member_counts = self._group_member_counts_subquery(session)
+        query = (
+            session.query(
+                KanbanTask.id,
+                KanbanTask.task_number,
+                KanbanTask.title,
+                func.substr(KanbanTask.description, 1, CARD_DESCRIPTION_CHARS).label("description_preview"),
+                KanbanTask.column_id,
+                KanbanColumn.name.label("column_name"),
+                KanbanTask.position,
+                KanbanTask.priority,
+                KanbanTask.status,
+                KanbanTask.deadline,
+                KanbanTask.completed_at,
+                KanbanTask.assigned_to,
+                KanbanUser.display_name.label("assignee_name"),
+                KanbanUser.avatar_color.label("assignee_color"),
+                KanbanTask.assigned_group_id,
+                KanbanGroup.name.label("group_name"),
+                KanbanGroup.color.label("group_color"),
+                func.coalesce(member_counts.c.member_count, 0).label("group_member_count"),
+                func.coalesce(comment_count, 0).label("comment_count"),
+                func.coalesce(attachment_count, 0).label("attachment_count"),
+                KanbanTask.updated_at,
+            )
+            .select_from(KanbanTask)
+            .join(KanbanColumn, KanbanColumn.id == KanbanTask.column_id)
+            .outerjoin(KanbanUser, KanbanUser.id == KanbanTask.assigned_to)
+            .outerjoin(KanbanGroup, KanbanGroup.id == KanbanTask.assigned_group_id)
+            .outerjoin(member_counts, member_counts.c.group_id == KanbanTask.assigned_group_id)
+            .filter(KanbanTask.is_deleted == False, KanbanColumn.is_active == True)  # noqa: E712
+        )
+        query = self._apply_task_filters(query, filters)
+        return query.order_by(KanbanColumn.position, KanbanTask.position, KanbanTask.id)
+
+    @staticmethod
+    def _task_cards(rows) -> List[TaskCard]:
+        """TaskCard records from _board_card_query rows."""
+        return [TaskCard(**row._mapping) for row in rows]
+
+    @staticmethod
+    def _apply_task_filters(query, filters: Dict[str, Any]):
+        """Apply board filter values (assignee, group, priority, search) to a task query."""
+        if filters.get("assigned_to") is not None:
+            query = query.filter(KanbanTask.assigned_to == filters["assigned_to"])
+        if filters.get("assigned_group_id") is not None:
+            query = query.filter(KanbanTask.assigned_group_id == filters["assigned_group_id"])
+        if filters.get("priority") is not None:
+            query = query.filter(KanbanTask.priority == filters["priority"])
+
+        search_condition = KanbanManager._search_condition(filters.get("search"))
+        if search_condition is not None:
+            query = query.filter(search_condition)
+        return query
+
+    @staticmethod
+    def _group_member_counts_subquery(session: Session):
+        """Aggregated ``(group_id, member_count)`` subquery over group memberships."""
+        return (
+            session.query(
+                KanbanGroupMember.group_id.label("group_id"),
+                func.count(KanbanGroupMember.id).label("member_count"),
+            )
+            .group_by(KanbanGroupMember.group_id)
+            .subquery()
+        )
+
+    # -----------------------------------------------------------------------
+    # Bulk Task Operations
+    # -----------------------------------------------------------------------
+
+    def bulk_create_tasks(self, tasks: List[Dict[str, Any]]) -> List[KanbanTask]:
+        """
+        Create several tasks in one transaction.
+
+        Positions are appended per column from a single max(position) query,
+        task numbers come from the column default, and all task_created
+        audit rows are written with one multi-row INSERT.
+
+        Args:
+            tasks: One dict per task with ``title`` and ``column_id`` plus any
+                optional create_task argument (description, assigned_to, ...)
+
+        Returns:
+            Created tasks, in input order
+
+        Raises:
+            ValueError: If a dict is missing title/column_id or has unknown keys
+        """
+        if not tasks:
+            return []
+
+        for spec in tasks:
+            if not spec.get("title") or not spec.get("column_id"):
+                raise ValueError("Each task needs a title and a column_id")
+            unknown = set(spec) - BULK_CREATE_FIELDS
+            if unknown:
+                raise ValueError(f"Unknown task fields: {', '.join(sorted(unknown))}")
+
+        session = self.db.get_session()
+        try:
+            column_ids = {spec["column_id"] for spec in tasks}
+            max_positions = dict(
+                session.query(KanbanTask.column_id, func.max(KanbanTask.position))
+                .filter(KanbanTask.column_id.in_(column_ids), KanbanTask.is_deleted == False)  # noqa: E712
+                .group_by(KanbanTask.column_id)
+                .all()
+            )
+            next_positions = {column_id: max_positions.get(column_id) for column_id in column_ids}
+
+            created = []
+            for spec in tasks:
+                values = {"priority": "medium", "is_workflow_task": False, **spec}
+                values["tags"] = values.get("tags") or []
+                next_positions[values["column_id"]] = self._append_position(next_positions[values["column_id"]])
+                created.append(
+                    KanbanTask(
+                        position=next_positions[values["column_id"]],
+                        created_by=self.current_user_id,
+                        **values,
+                    )
+                )
+
+            session.add_all(created)
+            session.flush()  # Ids and task numbers for the audit rows
+
+            self.logger.log_activities(
+                [AuditLogger.task_created_entry(task, self.current_user_id) for task in created],
+                session=session,
+            )
+
+            session.commit()
+            self.db.record_writes(len(created))
+            return created
+
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def bulk_move_tasks(self, task_ids: List[int], new_column_id: int) -> int:
+        """
+        Move several tasks to a column with one UPDATE.
+
+        Tasks are appended to the target column in the given order; tasks
+        already in it are skipped (no reordering, no audit row). Status
+        bookkeeping matches move_task (completed on Done, reopened when
+        leaving Done, started on In Progress).
+
+        Args:
+            task_ids: Tasks to move
+            new_column_id: Target column ID
+
+        Returns:
+            Number of tasks moved (excluding skipped ones)
+
+        Raises:
+            ValueError: If the column is not found
+        """
+        if not task_ids:
+            return 0
+
+        session = self.db.get_session()
+        try:
+            column = session.query(KanbanColumn).filter_by(id=new_column_id, is_active=True).first()
+            if not column:
+                raise ValueError(f"Column {new_column_id} not found")
+
+            # Current column names, for the audit trail (tasks already in the column stay put)
+            old_column_names = dict(
+                session.query(KanbanTask.id, KanbanColumn.name)
+                .join(KanbanColumn, KanbanColumn.id == KanbanTask.column_id)
+                .filter(
+                    KanbanTask.id.in_(task_ids),
+                    KanbanTask.is_deleted == False,  # noqa: E712
+                    KanbanTask.column_id != new_column_id,
+                )
+                .all()
+            )
+            ordered_ids = [task_id for task_id in dict.fromkeys(task_ids) if task_id in old_column_names]
+            if not ordered_ids:
+                return 0
+
+            max_pos = (
+                session.query(func.max(KanbanTask.position))
+                .filter_by(column_id=new_column_id, is_deleted=False)
+                .scalar()
+            )
+            now = datetime.now()
+            was_done = KanbanTask.column_id.in_(
+                select(KanbanColumn.id).where(KanbanColumn.name == "Done").scalar_subquery()
+            )
+            reopened_status = case(
+                (and_(was_done, KanbanTask.status == "completed"), "active"), else_=KanbanTask.status
+            )
+
+            values: Dict[Any, Any] = {
+                KanbanTask.column_id: new_column_id,
+                KanbanTask.position: case(
+                    {task_id: self._append_position(max_pos, index + 1) for index, task_id in enumerate(ordered_ids)},
+                    value=KanbanTask.id,
+                ),
+            }
+            if column.name == "Done":
+                values[KanbanTask.completed_at] = func.coalesce(KanbanTask.completed_at, now)
+                values[KanbanTask.status] = case(
+                    (KanbanTask.status == "archived", KanbanTask.status), else_="completed"
+                )
+            else:
+                values[KanbanTask.completed_at] = case((was_done, None), else_=KanbanTask.completed_at)
+                values[KanbanTask.status] = reopened_status
+                if column.name == "In Progress":
+                    values[KanbanTask.started_at] = func.coalesce(KanbanTask.started_at, now)
+                    values[KanbanTask.status] = case(
+                        (
+                            and_(
+                                KanbanTask.started_at.is_(None),
+                                or_(KanbanTask.status.is_(None), KanbanTask.status.notin_(["blocked", "archived"])),
+                            ),
+                            "active",
+                        ),
+                        else_=reopened_status,
+                    )
+
+            moved = (
+                session.query(KanbanTask)
+                .filter(KanbanTask.id.in_(ordered_ids))
+                .update(values, synchronize_session=False)
+            )
+
+            activities = [
+                AuditLogger.task_moved_entry(task_id, self.current_user_id, old_column_names[task_id], column.name)
+                for task_id in ordered_ids
+            ]
+            moved_tasks = session.query(KanbanTask).filter(KanbanTask.id.in_(ordered_ids)).populate_existing()
+            AuditLogger.attach_task_snapshots(
+                session, activities, {task.id: AuditLogger.move_values(task) for task in moved_tasks}
+            )
+            self.logger.log_activities(activities, session=session)
+
+            session.commit()
+            self.db.record_writes(moved)
+            print(f"[Manager] Bulk moved {moved} tasks to column {new_column_id}")
+            return moved
+
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def bulk_update_tasks(self, task_ids: List[int], **updates) -> int:
         """
-        Get all tasks assigned to a user.
+        Apply the same field updates to several tasks with one UPDATE.
+
+        Only tasks where at least one field actually changes are updated and
+        audited (one task_updated row per changed field, inserted in one batch).
 
         Args:
-            user_id: User ID
+            task_ids: Tasks to update
+            **updates: Fields to set (see BULK_UPDATE_FIELDS; use
+                bulk_move_tasks to change columns)
 
         Returns:
-            List of tasks
+            Number of tasks changed
+
+        Raises:
+            ValueError: If an unsupported field is given
         """
+        unknown = set(updates) - BULK_UPDATE_FIELDS
+        if unknown:
+            raise ValueError(f"Cannot bulk update fields: {', '.join(sorted(unknown))}")
+        if not task_ids or not updates:
+            return 0
+
         session = self.db.get_session()
         try:
-            tasks = (
-                session.query(KanbanTask)
-                .options(
-                    joinedload(KanbanTask.assignee),
-                    joinedload(KanbanTask.creator),
-                    joinedload(KanbanTask.column),
-                )
-                .filter_by(assigned_to=user_id, is_deleted=False)
-                .order_by(KanbanTask.created_at.desc())
+            rows = (
+                session.query(KanbanTask.id, *(getattr(KanbanTask, name) for name in updates))
+                .filter(KanbanTask.id.in_(task_ids), KanbanTask.is_deleted == False)  # noqa: E712
                 .all()
             )
-            return tasks
+
+            changed_ids = []
+            activities = []
+            for row in rows:
+                changes = {
+                    name: {"old": getattr(row, name), "new": value}
+                    for name, value in updates.items()
+                    if getattr(row, name) != value
+                }
+                if changes:
+                    changed_ids.append(row.id)
+                    activities.extend(AuditLogger.task_updated_entries(row.id, self.current_user_id, changes))
+
+            if changed_ids:
+                session.query(KanbanTask).filter(KanbanTask.id.in_(changed_ids)).update(
+                    updates, synchronize_session=False
+                )
+                AuditLogger.attach_task_snapshots(
+                    session, activities, {task_id: updates for task_id in changed_ids}
+                )
+                self.logger.log_activities(activities, session=session)
+
+            session.commit()
+            self.db.record_writes(len(changed_ids))
+            return len(changed_ids)
+
+        except Exception as e:
+            session.rollback()
+            raise e
         finally:
             session.close()
 
-    def search_tasks(self, query: str) -> List[KanbanTask]:
+    def bulk_delete_tasks(self, task_ids: List[int], hard_delete: bool = False) -> int:
         """
-        Search tasks by title and description.
+        Delete several tasks (soft delete by default) in one transaction.
 
         Args:
-            query: Search query
+            task_ids: Tasks to delete
+            hard_delete: If True, permanently delete from database
 
         Returns:
-            List of matching tasks
+            Number of tasks deleted
         """
+        if not task_ids:
+            return 0
+
         session = self.db.get_session()
         try:
-            search_pattern = f"%{query}%"
-            tasks = (
-                session.query(KanbanTask)
-                .options(
-                    joinedload(KanbanTask.assignee),
-                    joinedload(KanbanTask.creator),
-                    joinedload(KanbanTask.column),
-                )
-                .filter(
-                    (KanbanTask.title.ilike(search_pattern) | KanbanTask.description.ilike(search_pattern)),
-                    KanbanTask.is_deleted == False,  # noqa: E712
+            query = session.query(KanbanTask).filter(KanbanTask.id.in_(task_ids))
+            if not hard_delete:
+                query = query.filter(KanbanTask.is_deleted == False)  # noqa: E712
+            tasks = query.all()
+            if not tasks:
+                return 0
+
+            # Audit first: on hard delete the FK sets task_id to NULL but keeps the rows
+            now = datetime.now()
+            activities = [AuditLogger.task_deleted_entry(task, self.current_user_id) for task in tasks]
+            if hard_delete:
+                # Full checkpoints: the history is orphaned once the task row is gone
+                AuditLogger.attach_task_snapshots(session, activities, {task.id: {} for task in tasks}, checkpoint=True)
+            else:
+                deletion = {"is_deleted": True, "deleted_at": now, "deleted_by": self.current_user_id}
+                AuditLogger.attach_task_snapshots(session, activities, {task.id: deletion for task in tasks})
+            self.logger.log_activities(activities, session=session)
+
+            target = session.query(KanbanTask).filter(KanbanTask.id.in_([task.id for task in tasks]))
+            if hard_delete:
+                deleted = target.delete(synchronize_session=False)
+            else:
+                deleted = target.update(
+                    {
+                        KanbanTask.is_deleted: True,
+                        KanbanTask.deleted_at: now,
+                        KanbanTask.deleted_by: self.current_user_id,
+                    },
+                    synchronize_session=False,
                 )
-                .all()
-            )
-            return tasks
+
+            session.commit()
+            self.db.record_writes(deleted)
+            return deleted
+
+        except Exception as e:
+            session.rollback()
+            raise e
         finally:
             session.close()
 
@@ -457,22 +1528,12 @@ class KanbanManager:
     # -----------------------------------------------------------------------
 
     def get_all_columns(self) -> List[KanbanColumn]:
-        """Get all active columns ordered by position."""
-        session = self.db.get_session()
-        try:
-            columns = session.query(KanbanColumn).filter_by(is_active=True).order_by(KanbanColumn.position).all()
-            return columns
-        finally:
-            session.close()
+        """Get all active columns ordered by position (from the reference cache)."""
+        return list(self.reference.get().columns)
 
     def get_column_by_name(self, name: str) -> Optional[KanbanColumn]:
-        """Get column by name."""
-        session = self.db.get_session()
-        try:
-            column = session.query(KanbanColumn).filter_by(name=name, is_active=True).first()
-            return column
-        finally:
-            session.close()
+        """Get column by name (from the reference cache)."""
+        return next((column for column in self.reference.get().columns if column.name == name), None)
 
     # -----------------------------------------------------------------------
     # Comment Operations
@@ -507,7 +1568,7 @@ class KanbanManager:
             session.flush()
 
             # Log comment addition
-            self.logger.log_comment_added(comment, self.current_user_id)
+            self.logger.log_comment_added(comment, self.current_user_id, session=session)
 
             session.commit()
             return comment
@@ -589,7 +1650,7 @@ class KanbanManager:
             session.flush()
 
             # Log attachment addition
-            self.logger.log_attachment_added(attachment, self.current_user_id)
+            self.logger.log_attachment_added(attachment, self.current_user_id, session=session)
 
             session.commit()
             return attachment
@@ -639,7 +1700,7 @@ class KanbanManager:
                 attachment.deleted_by = self.current_user_id
 
                 # Log attachment removal
-                self.logger.log_attachment_removed(attachment, self.current_user_id)
+                self.logger.log_attachment_removed(attachment, self.current_user_id, session=session)
 
                 session.commit()
         except Exception as e:
@@ -649,102 +1710,411 @@ class KanbanManager:
             session.close()
 
     # -----------------------------------------------------------------------
-    # User Operations
+    # Dependency Operations
     # -----------------------------------------------------------------------
 
-    def get_all_users(self) -> List[KanbanUser]:
-        """Get all active users."""
+    def add_dependency(
+        self, task_id: int, depends_on_task_id: int, dependency_type: str = BLOCKING_TYPE
+    ) -> KanbanDependency:
+        """
+        Record that a task depends on another one.
+
+        "blocks" edges must keep the graph acyclic: the insert is rejected
+        when depends_on_task_id already (transitively) waits on task_id. The
+        check and insert run under a transaction-level advisory lock so two
+        concurrent inserts cannot close a cycle between them.
+
+        Args:
+            task_id: Task that waits
+            depends_on_task_id: Task it waits on
+            dependency_type: One of blocks, relates_to, duplicate_of
+
+        Returns:
+            Created dependency object
+
+        Raises:
+            ValueError: If a task is not found, the type is unknown, the
+                dependency exists or it would create a cycle
+        """
+        if dependency_type not in DEPENDENCY_TYPES:
+            raise ValueError(f"Invalid dependency type: {dependency_type}")
+        if task_id == depends_on_task_id:
+            raise ValueError("A task cannot depend on itself")
+
+        session = self.db.get_session()
+        try:
+            found = {
+                found_id
+                for (found_id,) in session.query(KanbanTask.id).filter(
+                    KanbanTask.id.in_([task_id, depends_on_task_id]), KanbanTask.is_deleted == False  # noqa: E712
+                )
+            }
+            for required_id in (task_id, depends_on_task_id):
+                if required_id not in found:
+                    raise ValueError(f"Task {required_id} not found")
+
+            if dependency_type == BLOCKING_TYPE:
+                session.execute(select(func.pg_advisory_xact_lock(DEPENDENCY_LOCK_ID)))
+                if creates_cycle(session, task_id, depends_on_task_id):
+                    raise ValueError(
+                        f"Task {task_id} cannot depend on task {depends_on_task_id}: it would create a cycle"
+                    )
+
+            existing = (
+                session.query(KanbanDependency.id)
+                .filter(
+                    or_(
+                        and_(
+                            KanbanDependency.task_id == task_id,
+                            KanbanDependency.depends_on_task_id == depends_on_task_id,
+                        ),
+                        and_(
+                            KanbanDependency.task_id == depends_on_task_id,
+                            KanbanDependency.depends_on_task_id == task_id,
+                            KanbanDependency.dependency_type != BLOCKING_TYPE,
+                        ),
+                    )
+                )
+                .first()
+            )
+            if existing:
+                raise ValueError(f"Task {task_id} is already linked to task {depends_on_task_id}")
+
+            dependency = KanbanDependency(
+                task_id=task_id,
+                depends_on_task_id=depends_on_task_id,
+                dependency_type=dependency_type,
+                created_by=self.current_user_id,
+            )
+            session.add(dependency)
+            session.flush()
+
+            self.logger.log_dependency_added(dependency, self.current_user_id, session=session)
+
+            session.commit()
+            self.dependency_cache.invalidate()
+            return dependency
+
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def remove_dependency(self, task_id: int, depends_on_task_id: int) -> None:
+        """Remove the dependency of task_id on depends_on_task_id (no-op if there is none)."""
         session = self.db.get_session()
         try:
-            users = session.query(KanbanUser).filter_by(is_active=True).order_by(KanbanUser.display_name).all()
-            return users
+            dependency = (
+                session.query(KanbanDependency)
+                .filter_by(task_id=task_id, depends_on_task_id=depends_on_task_id)
+                .first()
+            )
+            if dependency:
+                self.logger.log_dependency_removed(dependency, self.current_user_id, session=session)
+                session.delete(dependency)
+                session.commit()
+                self.dependency_cache.invalidate()
+        except Exception as e:
+            session.rollback()
+            raise e
         finally:
             session.close()
 
-    def get_user(self, user_id: int) -> Optional[KanbanUser]:
-        """Get a user by ID."""
+    def get_task_dependencies(self, task_id: int) -> Dict[str, List[KanbanDependency]]:
+        """
+        Get a task's direct dependencies in both directions.
+
+        Returns:
+            Dict with ``depends_on`` (edges from the task, other task in
+            ``depends_on_task``) and ``dependents`` (edges to it, other task
+            in ``task``); deleted tasks are left out
+        """
         session = self.db.get_session()
         try:
-            user = session.query(KanbanUser).filter_by(id=user_id, is_active=True).first()
-            return user
+            other = aliased(KanbanTask)
+            depends_on = (
+                session.query(KanbanDependency)
+                .join(other, other.id == KanbanDependency.depends_on_task_id)
+                .options(contains_eager(KanbanDependency.depends_on_task.of_type(other)))
+                .filter(KanbanDependency.task_id == task_id, other.is_deleted == False)  # noqa: E712
+                .order_by(other.task_number)
+                .all()
+            )
+            dependents = (
+                session.query(KanbanDependency)
+                .join(other, other.id == KanbanDependency.task_id)
+                .options(contains_eager(KanbanDependency.task.of_type(other)))
+                .filter(KanbanDependency.depends_on_task_id == task_id, other.is_deleted == False)  # noqa: E712
+                .order_by(other.task_number)
+                .all()
+            )
+            return {"depends_on": depends_on, "dependents": dependents}
         finally:
             session.close()
 
-    def get_user_by_username(self, username: str) -> Optional[KanbanUser]:
-        """Get a user by username."""
+    def get_blockers(self, task_id: int, open_only: bool = True) -> List[Tuple[int, str]]:
+        """
+        Get every task a task transitively waits on ("blocks" edges).
+
+        Args:
+            task_id: Task ID
+            open_only: Only tasks that are not done (the ones actually blocking)
+
+        Returns:
+            (task id, task number) pairs ordered by task number
+        """
+        return self._dependency_graph(
+            ("blockers", task_id, open_only),
+            lambda session: closure_tasks(session, blocker_closure(task_id), open_only),
+        )
+
+    def get_unblocked_by(self, task_id: int, open_only: bool = True) -> List[Tuple[int, str]]:
+        """
+        Get every task that transitively waits on a task, i.e. everything finishing it helps unblock.
+
+        Args:
+            task_id: Task ID
+            open_only: Only tasks that are not done
+
+        Returns:
+            (task id, task number) pairs ordered by task number
+        """
+        return self._dependency_graph(
+            ("unblocks", task_id, open_only),
+            lambda session: closure_tasks(session, dependent_closure(task_id), open_only),
+        )
+
+    def get_critical_path(self, task_id: Optional[int] = None) -> CriticalPath:
+        """
+        Get the longest chain of open blocking tasks by estimated hours.
+
+        Args:
+            task_id: Task whose blocker chain to measure (None = whole board)
+
+        Returns:
+            CriticalPath ordered from the first task to work on
+        """
+        path = self._dependency_graph(
+            ("critical_path", task_id), lambda session: critical_path(session, task_id)
+        )
+        return CriticalPath(task_ids=list(path.task_ids), total_hours=path.total_hours)
+
+    def get_blocked_tasks(self) -> Dict[int, List[str]]:
+        """
+        Get every open task that has an open blocker, in one query.
+
+        Returns:
+            Dict of task id -> task numbers of its open direct blockers
+        """
+        blocked = self._dependency_graph(("blocked",), blocked_tasks)
+        return {task_id: list(blockers) for task_id, blockers in blocked.items()}
+
+    def _dependency_graph(self, key: Tuple[Any, ...], compute, session: Optional[Session] = None):
+        """Graph query result from the per-board-version cache (computed in ``session`` or a new one)."""
+        if session is not None:
+            return self.dependency_cache.get(session, key, compute)
+        session = self.db.get_session()
+        try:
+            return self.dependency_cache.get(session, key, compute)
+        finally:
+            session.close()
+
+    # -----------------------------------------------------------------------
+    # Activity Operations
+    # -----------------------------------------------------------------------
+
+    def get_task_activity(self, task_id: int, before_id: Optional[int] = None, limit: int = 30) -> ActivityPage:
+        """
+        Get one page of a task's activity history, newest first.
+
+        Keyset-paged on id via idx_activity_task_id (task_id, id DESC). The
+        created_at lower bound (the task's creation time) lets PostgreSQL skip
+        monthly partitions from before the task existed.
+
+        Args:
+            task_id: Task ID
+            before_id: id of the oldest activity already shown (None = newest page)
+            limit: Page size
+
+        Returns:
+            ActivityPage with the activities (user eager-loaded) and whether older ones exist
+        """
+        session = self.db.get_session()
+        try:
+            query = self._task_activity_query(session.query(KanbanActivityLog), task_id).options(
+                joinedload(KanbanActivityLog.user)
+            )
+            if before_id is not None:
+                query = query.filter(KanbanActivityLog.id < before_id)
+
+            activities = query.order_by(KanbanActivityLog.id.desc()).limit(limit + 1).all()
+            has_more = len(activities) > limit
+            return ActivityPage(activities=activities[:limit], has_more=has_more)
+        finally:
+            session.close()
+
+    def get_task_state_at(self, task_id: int, activity_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Reconstruct a task's state as of an activity from its audit snapshots.
+
+        Reads the nearest checkpoint at or before ``activity_id`` and replays
+        the deltas after it (at most CHECKPOINT_INTERVAL snapshot rows).
+
+        Args:
+            task_id: Task ID
+            activity_id: Activity log id to reconstruct at (None = latest)
+
+        Returns:
+            Task state dict (see AuditLogger._task_to_dict), or None if the
+            task has no snapshot at or before that activity
+        """
         session = self.db.get_session()
         try:
-            user = session.query(KanbanUser).filter_by(username=username, is_active=True).first()
-            return user
+            has_snapshot = func.jsonb_typeof(KanbanActivityLog.task_snapshot) == "object"
+            bound = [has_snapshot]
+            if activity_id is not None:
+                bound.append(KanbanActivityLog.id <= activity_id)
+
+            # Pre-delta snapshots have no "kind" and are full states
+            checkpoint_id = self._task_activity_query(
+                session.query(func.max(KanbanActivityLog.id)), task_id
+            ).filter(
+                *bound,
+                func.coalesce(KanbanActivityLog.task_snapshot["kind"].as_string(), "checkpoint") == "checkpoint",
+            ).scalar()
+            if checkpoint_id is None:
+                return None
+
+            snapshots = [
+                snapshot
+                for (snapshot,) in self._task_activity_query(session.query(KanbanActivityLog.task_snapshot), task_id)
+                .filter(*bound, KanbanActivityLog.id >= checkpoint_id)
+                .order_by(KanbanActivityLog.id)
+            ]
+            return AuditLogger.replay_snapshots(snapshots)
         finally:
             session.close()
 
+    @staticmethod
+    def _task_activity_query(query, task_id: int):
+        """
+        Restrict an activity log query to one task. The created_at bound (the
+        task's creation time) lets PostgreSQL prune older monthly partitions.
+        """
+        task_created_at = (
+            select(KanbanTask.created_at - ACTIVITY_CLOCK_SKEW).where(KanbanTask.id == task_id).scalar_subquery()
+        )
+        return query.filter(KanbanActivityLog.task_id == task_id, KanbanActivityLog.created_at >= task_created_at)
+
+    # -----------------------------------------------------------------------
+    # User Operations
+    # -----------------------------------------------------------------------
+
+    def get_all_users(self) -> List[KanbanUser]:
+        """Get all active users (from the reference cache)."""
+        return list(self.reference.get().users)
+
+    def get_user(self, user_id: int) -> Optional[KanbanUser]:
+        """Get an active user by ID (from the reference cache)."""
+        return self.reference.get().users_by_id.get(user_id)
+
+    def get_user_by_username(self, username: str) -> Optional[KanbanUser]:
+        """Get an active user by username (from the reference cache)."""
+        return next((user for user in self.reference.get().users if user.username == username), None)
+
     # -----------------------------------------------------------------------
     # Utility Methods
     # -----------------------------------------------------------------------
 
-    def _generate_task_number(self, session: Session) -> str:
+    def reserve_task_numbers(self, count: int) -> List[str]:
         """
-        Generate a unique task number (TASK-0001, TASK-0002, etc.).
+        Reserve task numbers for bulk creation.
+
+        Numbers come from the same sequence as the task_number column default,
+        so they never collide with concurrently created tasks. Unused numbers
+        are simply skipped (gaps are allowed).
 
         Args:
-            session: Active database session
+            count: How many task numbers to reserve
 
         Returns:
-            Generated task number
-        """
-        # Get the highest task number
-        last_task = session.query(KanbanTask).order_by(KanbanTask.id.desc()).first()
-
-        if last_task and last_task.task_number:
-            # Extract number from last task
-            try:
-                last_num = int(last_task.task_number.split("-")[1])
-                next_num = last_num + 1
-            except (IndexError, ValueError):
-                # Fallback to ID-based numbering
-                next_num = (last_task.id or 0) + 1
-        else:
-            next_num = 1
-
-        return f"TASK-{next_num:04d}"
-
-    def get_task_statistics(self) -> Dict[str, Any]:
-        """Get overall task statistics based on column positions (not status field)."""
+            Reserved task numbers in ascending order
+        """
+        if count <= 0:
+            return []
+
         session = self.db.get_session()
         try:
-            # Get column IDs for workflow states
-            done_column = session.query(KanbanColumn).filter_by(name="Done", is_active=True).first()
-            in_progress_column = session.query(KanbanColumn).filter_by(name="In Progress", is_active=True).first()
-            
-            # Count tasks by column position (actual workflow state)
-            total_tasks = session.query(KanbanTask).filter_by(is_deleted=False).count()
-            
-            completed_tasks = 0
-            if done_column:
-                completed_tasks = session.query(KanbanTask).filter_by(
-                    column_id=done_column.id, 
-                    is_deleted=False
-                ).count()
-            
-            in_progress_tasks = 0
-            if in_progress_column:
-                in_progress_tasks = session.query(KanbanTask).filter_by(
-                    column_id=in_progress_column.id,
-                    is_deleted=False
-                ).count()
-            
+            return self._reserve_task_numbers(session, count)
+        finally:
+            session.close()
+
+    @staticmethod
+    def _reserve_task_numbers(session: Session, count: int) -> List[str]:
+        """Draw ``count`` values from the task number sequence in one round trip."""
+        numbers = (
+            session.query(TASK_NUMBER_SEQUENCE.next_value())
+            .select_from(func.generate_series(1, count))
+            .all()
+        )
+        return [format_task_number(number) for number, in sorted(numbers)]
+
+    def get_task_statistics(self, include_archived: bool = False) -> Dict[str, Any]:
+        """
+        Get overall task statistics based on column positions (not status field).
+
+        Read from the mv_task_rollup materialized view when reporting views
+        are enabled (falls back to the live tables if it is missing).
+        Otherwise computed in a single aggregate query (``COUNT(*) FILTER
+        (...)`` per bucket). Overdue follows KanbanTask.is_overdue: deadline
+        before today, not in the Done column and not archived.
+
+        Args:
+            include_archived: Also count tasks moved to the archive tables
+                (always computed from the live tables)
+        """
+        tasks = task_source(include_archived)
+        session = self.db.get_session()
+        try:
+            counts = None
+            if self.db.reporting_views_enabled and not include_archived:
+                try:
+                    counts = session.query(
+                        func.coalesce(func.sum(TASK_ROLLUP.c.total_tasks), 0),
+                        func.coalesce(func.sum(TASK_ROLLUP.c.completed_tasks), 0),
+                        func.coalesce(func.sum(TASK_ROLLUP.c.in_progress_tasks), 0),
+                        func.coalesce(func.sum(TASK_ROLLUP.c.overdue_tasks), 0),
+                    ).one()
+                except DBAPIError as e:
+                    print(f"[Manager] Reporting views unavailable, using live tables: {e}")
+                    session.rollback()
+
+            if counts is None:
+                in_done = and_(KanbanColumn.name == "Done", KanbanColumn.is_active == True)  # noqa: E712
+                in_progress = and_(KanbanColumn.name == "In Progress", KanbanColumn.is_active == True)  # noqa: E712
+                overdue = and_(
+                    tasks.deadline < func.current_date(),
+                    KanbanColumn.name != "Done",
+                    or_(tasks.status.is_(None), tasks.status != "archived"),
+                )
+                counts = (
+                    session.query(
+                        func.count(tasks.id),
+                        func.count(tasks.id).filter(in_done),
+                        func.count(tasks.id).filter(in_progress),
+                        func.count(tasks.id).filter(overdue),
+                    )
+                    .select_from(tasks)
+                    .join(KanbanColumn, KanbanColumn.id == tasks.column_id)
+                    .filter(tasks.is_deleted == False)  # noqa: E712
+                    .one()
+                )
+
+            total_tasks, completed_tasks, in_progress_tasks, overdue_tasks = (int(value) for value in counts)
+
             # Calculate active tasks (not in Done column)
             active_tasks = total_tasks - completed_tasks
-            
-            # Use is_overdue property (already excludes Done column and archived)
-            all_tasks = (
-                session.query(KanbanTask)
-                .options(joinedload(KanbanTask.column))
-                .filter_by(is_deleted=False)
-                .all()
-            )
-            overdue_tasks = sum(1 for task in all_tasks if task.is_overdue)
 
             return {
                 "total_tasks": total_tasks,
@@ -782,9 +2152,165 @@ class KanbanManager:
         """Alias for get_tasks_by_user."""
         return self.get_tasks_by_user(user_id)
 
-    def get_statistics(self) -> Dict[str, Any]:
+    def get_statistics(self, include_archived: bool = False) -> Dict[str, Any]:
         """Alias for get_task_statistics."""
-        return self.get_task_statistics()
+        return self.get_task_statistics(include_archived)
+
+    def get_team_performance(
+        self, start_date: Optional[date] = None, include_archived: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Compute per-user, per-group and unassigned performance metrics.
+
+        All buckets come from one grouped query (GROUPING SETS over assignee
+        and group), so the cost does not depend on the number of users. The
+        query runs against the mv_task_rollup materialized view when
+        reporting views are enabled, otherwise against the live tables.
+
+        Args:
+            start_date: Only count tasks created on or after this date (None = all time)
+            include_archived: Also count tasks moved to the archive tables
+                (always computed from the live tables)
+
+        Returns:
+            List of dicts with keys kind ("user", "group" or "unassigned"), id,
+            name, active, done, on_time_pct, overdue and avg_days. Inactive
+            users/groups and buckets without tasks are omitted.
+        """
+        session = self.db.get_session()
+        try:
+            rows = None
+            if self.db.reporting_views_enabled and not include_archived:
+                try:
+                    rows = self._team_performance_rollup_query(session, start_date).all()
+                except DBAPIError as e:
+                    print(f"[Manager] Reporting views unavailable, using live tables: {e}")
+                    session.rollback()
+            if rows is None:
+                rows = self._team_performance_live_query(session, start_date, task_source(include_archived)).all()
+
+            results = []
+            for row in rows:
+                # Unassigned / no group is NULL in the live query and 0 in the rollup
+                if row.by_group:
+                    if not row.assigned_group_id or not row.group_active:
+                        continue
+                    kind, entity_id, name = "group", row.assigned_group_id, row.group_name
+                elif not row.assigned_to:
+                    kind, entity_id, name = "unassigned", None, None
+                else:
+                    if not row.user_active:
+                        continue
+                    kind, entity_id, name = "user", row.assigned_to, row.display_name
+
+                total, done = int(row.total), int(row.done)
+                with_deadline = int(row.with_deadline)
+                has_metrics = kind != "unassigned"
+                results.append({
+                    "kind": kind,
+                    "id": entity_id,
+                    "name": name,
+                    "active": total - done,
+                    "done": done,
+                    "on_time_pct": (int(row.on_time) / with_deadline * 100)
+                    if has_metrics and with_deadline else None,
+                    "overdue": int(row.overdue),
+                    "avg_days": (float(row.avg_days or 0) if has_metrics and done else None),
+                })
+
+            # Users first, then groups, then the unassigned bucket
+            kind_order = {"user": 0, "group": 1, "unassigned": 2}
+            results.sort(key=lambda r: (kind_order[r["kind"]], r["id"] or 0))
+            return results
+        finally:
+            session.close()
+
+    @staticmethod
+    def _team_performance_live_query(session: Session, start_date: Optional[date], tasks=KanbanTask):
+        """Team performance buckets aggregated directly from kanban_tasks (or the hot + archive union)."""
+        in_done = KanbanColumn.name == "Done"
+        completed_on = cast(tasks.completed_at, Date)
+        done_with_deadline = and_(
+            in_done, tasks.deadline.isnot(None), tasks.completed_at.isnot(None)
+        )
+        overdue = and_(
+            tasks.deadline < func.current_date(),
+            KanbanColumn.name != "Done",
+            or_(tasks.status.is_(None), tasks.status != "archived"),
+        )
+
+        query = (
+            session.query(
+                func.grouping(tasks.assigned_to).label("by_group"),
+                tasks.assigned_to,
+                KanbanUser.display_name,
+                KanbanUser.is_active.label("user_active"),
+                tasks.assigned_group_id,
+                KanbanGroup.name.label("group_name"),
+                KanbanGroup.is_active.label("group_active"),
+                func.count(tasks.id).label("total"),
+                func.count(tasks.id).filter(in_done).label("done"),
+                func.count(tasks.id).filter(overdue).label("overdue"),
+                func.count(tasks.id).filter(done_with_deadline).label("with_deadline"),
+                func.count(tasks.id)
+                .filter(and_(done_with_deadline, completed_on <= tasks.deadline))
+                .label("on_time"),
+                func.avg(completed_on - cast(tasks.created_at, Date))
+                .filter(and_(in_done, tasks.completed_at.isnot(None)))
+                .label("avg_days"),
+            )
+            .select_from(tasks)
+            .join(KanbanColumn, KanbanColumn.id == tasks.column_id)
+            .outerjoin(KanbanUser, KanbanUser.id == tasks.assigned_to)
+            .outerjoin(KanbanGroup, KanbanGroup.id == tasks.assigned_group_id)
+            .filter(tasks.is_deleted == False)  # noqa: E712
+        )
+        if start_date:
+            query = query.filter(tasks.created_at >= start_date)
+
+        return query.group_by(
+            func.grouping_sets(
+                tuple_(tasks.assigned_to, KanbanUser.display_name, KanbanUser.is_active),
+                tuple_(tasks.assigned_group_id, KanbanGroup.name, KanbanGroup.is_active),
+            )
+        )
+
+    @staticmethod
+    def _team_performance_rollup_query(session: Session, start_date: Optional[date]):
+        """Team performance buckets summed from the mv_task_rollup materialized view."""
+        rollup = TASK_ROLLUP.c
+        query = (
+            session.query(
+                func.grouping(rollup.assignee_id).label("by_group"),
+                rollup.assignee_id.label("assigned_to"),
+                KanbanUser.display_name,
+                KanbanUser.is_active.label("user_active"),
+                rollup.group_id.label("assigned_group_id"),
+                KanbanGroup.name.label("group_name"),
+                KanbanGroup.is_active.label("group_active"),
+                func.sum(rollup.total_tasks).label("total"),
+                func.sum(rollup.done_tasks).label("done"),
+                func.sum(rollup.overdue_tasks).label("overdue"),
+                func.sum(rollup.with_deadline).label("with_deadline"),
+                func.sum(rollup.on_time).label("on_time"),
+                (
+                    cast(func.sum(rollup.completion_days), Float)
+                    / func.nullif(func.sum(rollup.completed_with_date), 0)
+                ).label("avg_days"),
+            )
+            .select_from(TASK_ROLLUP)
+            .outerjoin(KanbanUser, KanbanUser.id == rollup.assignee_id)
+            .outerjoin(KanbanGroup, KanbanGroup.id == rollup.group_id)
+        )
+        if start_date:
+            query = query.filter(rollup.created_on >= start_date)
+
+        return query.group_by(
+            func.grouping_sets(
+                tuple_(rollup.assignee_id, KanbanUser.display_name, KanbanUser.is_active),
+                tuple_(rollup.group_id, KanbanGroup.name, KanbanGroup.is_active),
+            )
+        )
 
     # -----------------------------------------------------------------------
     # Group Operations
@@ -821,6 +2347,7 @@ class KanbanManager:
             )
             session.add(group)
             session.commit()
+            self.reference.invalidate()
             return group
         except Exception as e:
             session.rollback()
@@ -829,37 +2356,12 @@ class KanbanManager:
             session.close()
 
     def get_all_groups(self) -> List[KanbanGroup]:
-        """Get all active groups."""
-        session = self.db.get_session()
-        try:
-            groups = (
-                session.query(KanbanGroup)
-                .filter_by(is_active=True)
-                .order_by(KanbanGroup.name)
-                .all()
-            )
-            
-            # Eagerly load member counts before session closes
-            for group in groups:
-                member_count = (
-                    session.query(func.count(KanbanGroupMember.id))
-                    .filter(KanbanGroupMember.group_id == group.id)
-                    .scalar()
-                )
-                group._member_count = member_count or 0
-            
-            return groups
-        finally:
-            session.close()
+        """Get all active groups with their member counts (from the reference cache)."""
+        return list(self.reference.get().groups)
 
     def get_group(self, group_id: int) -> Optional[KanbanGroup]:
-        """Get a group by ID."""
-        session = self.db.get_session()
-        try:
-            group = session.query(KanbanGroup).filter_by(id=group_id, is_active=True).first()
-            return group
-        finally:
-            session.close()
+        """Get an active group by ID (from the reference cache)."""
+        return self.reference.get().groups_by_id.get(group_id)
 
     def update_group(
         self, group_id: int, name: Optional[str] = None, description: Optional[str] = None, color: Optional[str] = None
@@ -900,6 +2402,7 @@ class KanbanManager:
 
             group.modified_by = self.current_user_id
             session.commit()
+            self.reference.invalidate()
             return group
         except Exception as e:
             session.rollback()
@@ -926,6 +2429,7 @@ class KanbanManager:
             group.is_active = False
             group.modified_by = self.current_user_id
             session.commit()
+            self.reference.invalidate()
         except Exception as e:
             session.rollback()
             raise e
@@ -974,6 +2478,7 @@ class KanbanManager:
             )
             session.add(member)
             session.commit()
+            self.reference.invalidate()
             return member
         except Exception as e:
             session.rollback()
@@ -1002,6 +2507,7 @@ class KanbanManager:
 
             session.delete(member)
             session.commit()
+            self.reference.invalidate()
         except Exception as e:
             session.rollback()
             raise e
@@ -1016,18 +2522,7 @@ class KanbanManager:
             group_id: Group ID
 
         Returns:
-            List of user objects
+            List of active user objects (from the reference cache)
         """
-        session = self.db.get_session()
-        try:
-            members = (
-                session.query(KanbanUser)
-                .join(KanbanGroupMember, KanbanGroupMember.user_id == KanbanUser.id)
-                .filter(KanbanGroupMember.group_id == group_id, KanbanUser.is_active == True)  # noqa: E712
-                .order_by(KanbanUser.display_name)
-                .all()
-            )
-            return members
-        finally:
-            session.close()
+        return list(self.reference.get().group_members.get(group_id, []))
 
@@ -7,23 +7,41 @@ from typing import Optional
 
 from sqlalchemy import (
     ARRAY,
+    DDL,
     JSON,
+    BigInteger,
     Boolean,
     Column,
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
+    Sequence,
     String,
+    Table,
     Text,
     UniqueConstraint,
+    event,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import object_session, relationship
 
 Base = declarative_base()
 
+# Task numbers (TASK-0001, TASK-0002, ...) are assigned by the kanban_tasks.task_number
+# column default from this sequence; see KanbanManager.reserve_task_numbers for bulk use.
+TASK_NUMBER_SEQUENCE = Sequence("kanban_task_number_seq", metadata=Base.metadata)
+TASK_NUMBER_DEFAULT = text("'TASK-' || to_char(nextval('kanban_task_number_seq'), 'FM99999999990000')")
+
+
+def format_task_number(number: int) -> str:
+    """Format a sequence value the same way as the task_number column default."""
+    return f"TASK-{number:04d}"
+
 
 class KanbanUser(Base):
     """User model for Kanban system."""
@@ -162,17 +180,19 @@ class KanbanTask(Base):
     """Task/Card model for Kanban board."""
 
     __tablename__ = "kanban_tasks"
+    # Fetch server-generated columns (task_number) with RETURNING on insert
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True)
 
     # Basic Info
     title = Column(String(500), nullable=False)
     description = Column(Text)
-    task_number = Column(String(50), unique=True)  # TASK-0001
+    task_number = Column(String(50), unique=True, server_default=TASK_NUMBER_DEFAULT)  # TASK-0001
 
     # Organization
     column_id = Column(Integer, ForeignKey("kanban_columns.id"), nullable=False, index=True)
-    position = Column(Numeric(10, 2), nullable=False)  # REAL for flexible reordering
+    position = Column(Numeric(24, 12), nullable=False)  # Fractional key: midpoint inserts, see KanbanManager.reorder_task
 
     # Assignment & Ownership
     assigned_to = Column(Integer, ForeignKey("kanban_users.id"), index=True)
@@ -201,7 +221,7 @@ class KanbanTask(Base):
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.now, index=True)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, index=True)  # Delta-sync cursor
     started_at = Column(DateTime)  # When moved to "In Progress"
     completed_at = Column(DateTime)  # When moved to "Done"
 
@@ -285,6 +305,9 @@ class KanbanTask(Base):
     @property
     def comment_count(self) -> int:
         """Get count of non-deleted comments."""
+        if hasattr(self, "_comment_count"):
+            return self._comment_count
+
         comments = self.__dict__.get("comments")
         if comments is not None:
             return len([c for c in comments if not c.is_deleted])
@@ -302,6 +325,9 @@ class KanbanTask(Base):
     @property
     def attachment_count(self) -> int:
         """Get count of non-deleted attachments."""
+        if hasattr(self, "_attachment_count"):
+            return self._attachment_count
+
         attachments = self.__dict__.get("attachments")
         if attachments is not None:
             return len([a for a in attachments if not a.is_deleted])
@@ -317,20 +343,51 @@ class KanbanTask(Base):
         )
 
 
+class KanbanTaskTombstone(Base):
+    """
+    Marker left when a task leaves a column (hard delete, soft delete or move).
+
+    Written by the ``trigger_task_tombstone`` database trigger so delta sync
+    clients can drop cards that no longer exist where they last saw them.
+    """
+
+    __tablename__ = "kanban_task_tombstones"
+
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False)  # No FK: the task row may be gone
+    column_id = Column(Integer)  # Column the task left
+    reason = Column(String(20), nullable=False)  # deleted, moved
+    changed_at = Column(DateTime, default=datetime.now, index=True)
+
+    def __repr__(self) -> str:
+        return f"<KanbanTaskTombstone(task_id={self.task_id}, reason='{self.reason}')>"
+
+
 class KanbanActivityLog(Base):
-    """Activity log model for comprehensive audit trail."""
+    """
+    Activity log model for comprehensive audit trail.
+
+    The table is range-partitioned by created_at month (kanban_activity_log_YYYYMM
+    plus a default partition), so created_at is part of the primary key.
+    Old months are archived by scripts/archive_activity_log.py.
+    """
 
     __tablename__ = "kanban_activity_log"
+    __table_args__ = (
+        Index("idx_activity_task_id", "task_id", text("id DESC")),
+        Index("idx_activity_user", "user_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id = Column(Integer, primary_key=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
 
     # What happened
-    task_id = Column(Integer, ForeignKey("kanban_tasks.id", ondelete="SET NULL"), index=True)
-    activity_type = Column(String(50), nullable=False, index=True)
+    task_id = Column(Integer, ForeignKey("kanban_tasks.id", ondelete="SET NULL"))
+    activity_type = Column(String(50), nullable=False)
     # Types: created, updated, deleted, moved, assigned, unassigned, commented, etc.
 
     # Who did it
-    user_id = Column(Integer, ForeignKey("kanban_users.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("kanban_users.id"), nullable=False)
 
     # Details
     field_name = Column(String(100))  # Which field changed
@@ -342,11 +399,11 @@ class KanbanActivityLog(Base):
     ip_address = Column(String(45))  # User's IP
     user_agent = Column(Text)  # Application version
 
-    # When
-    created_at = Column(DateTime, default=datetime.now, index=True)
+    # When (partition key)
+    created_at = Column(DateTime, primary_key=True, default=datetime.now)
 
     # Full snapshot (for critical changes)
-    task_snapshot = Column(JSON)  # Complete task state after change
+    task_snapshot = Column(JSONB)  # Checkpoint or delta snapshot (queried with jsonb_* functions)
 
     # Relationships
     task = relationship("KanbanTask", back_populates="activity_logs")
@@ -356,6 +413,15 @@ class KanbanActivityLog(Base):
         return f"<KanbanActivityLog(id={self.id}, type='{self.activity_type}', task_id={self.task_id})>"
 
 
+# create_all() only creates the partitioned parent; give it a catch-all partition
+# (monthly partitions come from ensure_activity_log_partitions() in the setup SQL)
+event.listen(
+    KanbanActivityLog.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS kanban_activity_log_default PARTITION OF kanban_activity_log DEFAULT"),
+)
+
+
 class KanbanComment(Base):
     """Comment model for task discussions."""
 
@@ -438,7 +504,11 @@ class KanbanDependency(Base):
     task = relationship("KanbanTask", foreign_keys=[task_id], back_populates="dependencies_from")
     depends_on_task = relationship("KanbanTask", foreign_keys=[depends_on_task_id], back_populates="dependencies_to")
 
-    __table_args__ = (UniqueConstraint("task_id", "depends_on_task_id", name="uq_task_dependency"),)
+    __table_args__ = (
+        UniqueConstraint("task_id", "depends_on_task_id", name="uq_task_dependency"),
+        # Reverse edge lookups (what a task unblocks); the unique constraint covers the forward ones
+        Index("idx_dependencies_depends_on", "depends_on_task_id", "task_id"),
+    )
 
     def __repr__(self) -> str:
         return f"<KanbanDependency(task_id={self.task_id} depends_on {self.depends_on_task_id})>"
@@ -487,3 +557,81 @@ class KanbanSettings(Base):
         return f"<KanbanSettings(key='{self.setting_key}')>"
 
 
+
+
+# ---------------------------------------------------------------------------
+# Archive (cold) tables
+# ---------------------------------------------------------------------------
+# Long-completed, archived and soft-deleted tasks are moved out of the hot
+# tables by kanban/archive.py, together with their comments, attachment
+# metadata and activity. The archive tables mirror the hot columns (same
+# names and types, no foreign keys) plus archived_at, so rows can be copied
+# by column name and read back through a UNION ALL with the hot table.
+
+
+def _archive_columns(table) -> list:
+    """Copies of a hot table's columns for its archive table."""
+    return [
+        Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable, autoincrement=False)
+        for column in table.columns
+    ]
+
+
+class KanbanTaskArchive(Base):
+    """Archived task (same columns as kanban_tasks plus archive metadata)."""
+
+    __table__ = Table(
+        "kanban_tasks_archive",
+        Base.metadata,
+        *_archive_columns(KanbanTask.__table__),
+        Column("archived_at", DateTime, nullable=False, default=datetime.now),
+        Column("archive_reason", String(20), nullable=False),  # completed, archived, deleted
+        Index(
+            "idx_tasks_archive_search",
+            text("to_tsvector('english', title || ' ' || COALESCE(description, ''))"),
+            postgresql_using="gin",
+        ),
+        Index("idx_tasks_archive_task_number", "task_number", postgresql_ops={"task_number": "varchar_pattern_ops"}),
+        Index("idx_tasks_archive_assigned", "assigned_to"),
+        Index("idx_tasks_archive_assigned_group", "assigned_group_id"),
+        Index("idx_tasks_archive_created_at", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<KanbanTaskArchive(id={self.id}, task_number='{self.task_number}', reason='{self.archive_reason}')>"
+
+
+class KanbanCommentArchive(Base):
+    """Comment of an archived task."""
+
+    __table__ = Table(
+        "kanban_comments_archive",
+        Base.metadata,
+        *_archive_columns(KanbanComment.__table__),
+        Column("archived_at", DateTime, nullable=False, default=datetime.now),
+        Index("idx_comments_archive_task", "task_id"),
+    )
+
+
+class KanbanAttachmentArchive(Base):
+    """Attachment metadata of an archived task (the file itself stays in place)."""
+
+    __table__ = Table(
+        "kanban_attachments_archive",
+        Base.metadata,
+        *_archive_columns(KanbanAttachment.__table__),
+        Column("archived_at", DateTime, nullable=False, default=datetime.now),
+        Index("idx_attachments_archive_task", "task_id"),
+    )
+
+
+class KanbanActivityLogArchive(Base):
+    """Activity of an archived task (not partitioned; archived tasks are rarely read)."""
+
+    __table__ = Table(
+        "kanban_activity_log_archive",
+        Base.metadata,
+        *_archive_columns(KanbanActivityLog.__table__),
+        Column("archived_at", DateTime, nullable=False, default=datetime.now),
+        Index("idx_activity_archive_task_id", "task_id", text("id DESC")),
+    )
@@ -0,0 +1,187 @@
+"""Process-wide cache of Kanban reference data (users, columns, groups)."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+
+from kanban.database import DatabaseManager
+from kanban.models import KanbanColumn, KanbanGroup, KanbanGroupMember, KanbanSettings, KanbanUser
+
+logger = logging.getLogger(__name__)
+
+# kanban_settings row bumped by the bump_reference_data_version() triggers
+REFERENCE_VERSION_KEY = "reference_data_version"
+
+
+@dataclass
+class ReferenceData:
+    """One consistent load of the reference tables (active rows only)."""
+
+    version: Optional[int]
+    columns: List[KanbanColumn]
+    users: List[KanbanUser]
+    groups: List[KanbanGroup]
+    # group_id -> active members ordered by display name
+    group_members: Dict[int, List[KanbanUser]] = field(default_factory=dict)
+    users_by_id: Dict[int, KanbanUser] = field(init=False)
+    groups_by_id: Dict[int, KanbanGroup] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.users_by_id = {user.id: user for user in self.users}
+        self.groups_by_id = {group.id: group for group in self.groups}
+
+    def group_member_names(self) -> Dict[int, List[str]]:
+        """group_id -> member display names, as used by the board tooltips."""
+        return {
+            group_id: [member.display_name for member in members] for group_id, members in self.group_members.items()
+        }
+
+
+class ReferenceCache:
+    """
+    Versioned cache of users, columns and groups.
+
+    Data is loaded once and served from memory. At most every
+    ``check_interval`` seconds a read probes the ``reference_data_version``
+    row in kanban_settings (one indexed single-row query); triggers on the
+    reference tables bump it, so edits made by other clients are picked up
+    within that interval. Writes made through KanbanManager call
+    ``invalidate()`` and are visible immediately.
+
+    Cached objects are detached from any session and shared between
+    callers; treat them as read-only.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, check_interval: float = 15.0):
+        self.db = db_manager
+        self.check_interval = check_interval
+        self._data: Optional[ReferenceData] = None
+        self._checked_at = 0.0
+        self._lock = threading.RLock()
+        self.loads = 0
+        self.version_checks = 0
+
+    def get(self) -> ReferenceData:
+        """
+        Get the current reference data, reloading it if it is stale.
+
+        Returns:
+            ReferenceData (served from memory when warm)
+        """
+        with self._lock:
+            if self._data is not None and time.monotonic() - self._checked_at < self.check_interval:
+                return self._data
+
+            session = self.db.get_session()
+            try:
+                if self._data is not None:
+                    version = self._current_version(session)
+                    self.version_checks += 1
+                    if version is not None and version == self._data.version:
+                        self._checked_at = time.monotonic()
+                        return self._data
+                self._data = self._load(session)
+                self._checked_at = time.monotonic()
+                return self._data
+            finally:
+                session.close()
+
+    def invalidate(self) -> None:
+        """Drop the cached data; the next read reloads it."""
+        with self._lock:
+            self._data = None
+            self._checked_at = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Load and version-check counters plus the cached version."""
+        with self._lock:
+            return {
+                "loads": self.loads,
+                "version_checks": self.version_checks,
+                "version": self._data.version if self._data is not None else None,
+            }
+
+    @staticmethod
+    def _current_version(session) -> Optional[int]:
+        value = session.query(KanbanSettings.setting_value).filter_by(setting_key=REFERENCE_VERSION_KEY).scalar()
+        try:
+            return int(value) if value is not None else None
+        except (TypeError, ValueError):
+            logger.warning(f"Unexpected {REFERENCE_VERSION_KEY} value: {value!r}")
+            return None
+
+    def _load(self, session) -> ReferenceData:
+        # Read the version first: a change committed during the load bumps it
+        # past this value, so the next check reloads again.
+        version = self._current_version(session)
+
+        columns = session.query(KanbanColumn).filter_by(is_active=True).order_by(KanbanColumn.position).all()
+
+        users = session.query(KanbanUser).filter_by(is_active=True).order_by(KanbanUser.display_name).all()
+
+        member_counts = (
+            session.query(KanbanGroupMember.group_id, func.count(KanbanGroupMember.id).label("member_count"))
+            .group_by(KanbanGroupMember.group_id)
+            .subquery()
+        )
+        groups = []
+        for group, member_count in (
+            session.query(KanbanGroup, func.coalesce(member_counts.c.member_count, 0))
+            .outerjoin(member_counts, member_counts.c.group_id == KanbanGroup.id)
+            .filter(KanbanGroup.is_active == True)  # noqa: E712
+            .order_by(KanbanGroup.name)
+            .all()
+        ):
+            group._member_count = member_count
+            groups.append(group)
+
+        users_by_id = {user.id: user for user in users}
+        group_members: Dict[int, List[KanbanUser]] = {}
+        for group_id, user_id in (
+            session.query(KanbanGroupMember.group_id, KanbanGroupMember.user_id)
+            .join(KanbanUser, KanbanUser.id == KanbanGroupMember.user_id)
+            .filter(KanbanUser.is_active == True)  # noqa: E712
+            .order_by(KanbanGroupMember.group_id, KanbanUser.display_name)
+            .all()
+        ):
+            group_members.setdefault(group_id, []).append(users_by_id[user_id])
+
+        self.loads += 1
+        print(
+            f"[ReferenceCache] Loaded {len(users)} users, {len(columns)} columns, "
+            f"{len(groups)} groups (version {version})"
+        )
+        return ReferenceData(version=version, columns=columns, users=users, groups=groups, group_members=group_members)
+
+
+_caches: "weakref.WeakKeyDictionary[DatabaseManager, ReferenceCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_reference_cache(db_manager: DatabaseManager) -> ReferenceCache:
+    """
+    Get the process-wide reference cache for a database manager.
+
+    The version check interval comes from ``reference_check_interval``
+    (seconds) in the database config.
+
+    Args:
+        db_manager: Database manager instance
+
+    Returns:
+        The shared ReferenceCache
+    """
+    with _caches_lock:
+        cache = _caches.get(db_manager)
+        if cache is None:
+            db_config = (getattr(db_manager, "config", None) or {}).get("database", {})
+            cache = ReferenceCache(db_manager, check_interval=float(db_config.get("reference_check_interval", 15)))
+            _caches[db_manager] = cache
+        return cache
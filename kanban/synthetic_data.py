@@ -0,0 +1,625 @@
+"""Deterministic synthetic Kanban data, streamed into PostgreSQL with COPY FROM STDIN."""
+
+from __future__ import annotations
+
+import io
+import math
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+# (value, weight) tables the generator samples from
+PRIORITY_WEIGHTS = (("low", 25), ("medium", 45), ("high", 22), ("critical", 8))
+CATEGORY_WEIGHTS = (("user_ops", 30), ("sap", 20), ("general", 20), ("agile", 15), ("telco", 15))
+ESTIMATE_WEIGHTS = ((1, 20), (2, 25), (4, 25), (8, 18), (16, 9), (40, 3))
+# Share of open tasks per column name; unknown columns get an even share
+OPEN_COLUMN_WEIGHTS = {"Backlog": 35, "To Do": 30, "In Progress": 20, "Review": 15}
+DONE_COLUMN = "Done"
+
+TITLE_TEMPLATES = {
+    "user_ops": ("Set up laptop for {name}", "Reset password for {name}", "Printer not working on floor {n}"),
+    "sap": ("Create SAP account for {name}", "Update SAP authorizations for {name}", "SAP transport {n} to production"),
+    "general": ("Renew license batch {n}", "Backup check for server {n}", "Network outage in building {n}"),
+    "agile": ("Create Agile account for {name}", "Reset Agile password for {name}", "Agile ECO {n} approval stuck"),
+    "telco": ("VPN access for {name}", "Mobile plan change for {name}", "Replace desk phone {n}"),
+}
+COMMENT_TEXTS = (
+    "Checked with the user, waiting for confirmation.",
+    "Escalated to the vendor.",
+    "Done on our side, please verify.",
+    "Needs approval from the department head.",
+    "Could not reproduce, asking for a screenshot.",
+    "Scheduled for the next maintenance window.",
+)
+FIRST_NAMES = ("Alex", "Jamie", "Lin", "Priya", "Omar", "Mei", "Sam", "Ravi", "Nora", "Ken", "Ana", "Tom")
+LAST_NAMES = ("Tan", "Ng", "Lee", "Kumar", "Wong", "Lim", "Chen", "Ong", "Goh", "Rao", "Ho", "Teo")
+GROUP_COLORS = ("#60A5FA", "#34D399", "#FBBF24", "#F87171", "#A78BFA", "#F472B6")
+
+TASK_COLUMNS = (
+    "id", "title", "description", "column_id", "position", "assigned_to", "assigned_group_id", "created_by",
+    "priority", "status", "category", "tags", "deadline", "estimated_hours", "actual_hours", "is_workflow_task",
+    "created_at", "updated_at", "started_at", "completed_at", "is_deleted",
+)
+COMMENT_COLUMNS = ("task_id", "user_id", "comment", "is_edited", "is_deleted", "created_at")
+ACTIVITY_COLUMNS = (
+    "task_id", "activity_type", "user_id", "field_name", "old_value", "new_value", "comment", "created_at",
+)
+LOADED_TABLES = (
+    "kanban_users", "kanban_groups", "kanban_group_members", "kanban_tasks", "kanban_comments", "kanban_activity_log",
+)
+# Database hosts synthetic data may be loaded into without --allow-remote
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+
+@dataclass
+class SyntheticSpec:
+    """What to generate. The same spec (seed and anchor included) always produces the same rows."""
+
+    tasks: int
+    users: int = 50
+    groups: int = 10
+    # Means of Poisson-distributed per-task counts
+    comments_per_task: float = 2.0
+    updates_per_task: float = 2.0
+    # Tasks are created over this many days before the anchor, more of them recently
+    history_days: int = 730
+    seed: int = 42
+    # Point in time the history ends at (default: today 00:00)
+    anchor: Optional[datetime] = None
+    category: Optional[str] = None  # Put every task in this category (default: realistic mix)
+    user_prefix: str = "synthetic.user."
+    group_prefix: str = "synthetic-group-"
+    # Rows per COPY statement
+    chunk_rows: int = 50_000
+
+
+@dataclass
+class SyntheticLoadResult:
+    """Ids and row counts of one load."""
+
+    user_ids: List[int]
+    group_ids: List[int]
+    column_ids: List[int]
+    task_ids: Tuple[int, int]  # First and last generated task id
+    counts: Dict[str, int] = field(default_factory=dict)
+    triggers_skipped: bool = False
+
+
+def parse_size(value: str) -> int:
+    """Parse a row count given as 10000, 10k or 1m."""
+    value = value.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(value[-1:], 1)
+    if multiplier > 1:
+        value = value[:-1]
+    return int(float(value) * multiplier)
+
+
+def copy_value(value: Any) -> str:
+    """Encode one value for COPY's text format (\\N is NULL)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, (list, tuple)):
+        # Array literal first (quoted elements), then COPY escaping on top
+        text_value = "{" + ",".join(
+            "NULL" if item is None else '"' + str(item).replace("\\", "\\\\").replace('"', '\\"') + '"'
+            for item in value
+        ) + "}"
+    else:
+        text_value = str(value)
+    return (
+        text_value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+    )
+
+
+def copy_rows(cursor, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]], chunk_rows: int) -> int:
+    """
+    Stream rows into a table with COPY FROM STDIN, ``chunk_rows`` rows per COPY.
+
+    Only one chunk is held in memory at a time, so the row iterable can be
+    a generator of any length.
+
+    Args:
+        cursor: psycopg2 cursor (raw DBAPI connection)
+        table: Target table
+        columns: Column names, in row order
+        rows: Row tuples
+        chunk_rows: Rows per COPY statement
+
+    Returns:
+        Number of rows copied
+    """
+    statement = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    buffer = io.StringIO()
+    pending = 0
+    total = 0
+    for row in rows:
+        buffer.write("\t".join(copy_value(value) for value in row))
+        buffer.write("\n")
+        pending += 1
+        if pending >= chunk_rows:
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+            total += pending
+            buffer = io.StringIO()
+            pending = 0
+    if pending:
+        buffer.seek(0)
+        cursor.copy_expert(statement, buffer)
+        total += pending
+    return total
+
+
+def begin_bulk(cursor) -> bool:
+    """
+    Skip triggers and FK checks for the rest of the transaction if permitted (needs superuser).
+
+    Also disables ON DELETE CASCADE, so callers deleting rows must remove
+    children themselves.
+    """
+    cursor.execute("SAVEPOINT bulk_mode")
+    try:
+        cursor.execute("SET LOCAL session_replication_role = replica")
+    except Exception:
+        cursor.execute("ROLLBACK TO SAVEPOINT bulk_mode")
+        return False
+    cursor.execute("RELEASE SAVEPOINT bulk_mode")
+    return True
+
+
+def clear_synthetic_tasks(engine: Engine, category: str, user_prefix: str) -> int:
+    """
+    Delete generated tasks and everything hanging off them.
+
+    Only tasks in ``category`` that were created by a user whose username
+    starts with ``user_prefix`` are touched, so naming a real category
+    cannot wipe real tasks. Children (activity, comments, attachments,
+    dependencies, tombstones) are deleted explicitly first; the task delete
+    then runs in bulk mode when permitted, skipping the per-row tombstone
+    and NOTIFY triggers. Users and groups are kept for the next load.
+
+    Args:
+        engine: SQLAlchemy engine on a psycopg2 connection
+        category: Category of the generated tasks
+        user_prefix: Username prefix of the synthetic users that created them
+
+    Returns:
+        Number of tasks deleted
+    """
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute(
+            "CREATE TEMP TABLE synthetic_clear ON COMMIT DROP AS "
+            "SELECT t.id FROM kanban_tasks t JOIN kanban_users u ON u.id = t.created_by "
+            "WHERE t.category = %s AND u.username LIKE %s",
+            (category, _like_prefix(user_prefix)),
+        )
+        for statement in (
+            "DELETE FROM kanban_activity_log WHERE task_id IN (SELECT id FROM synthetic_clear)",
+            "DELETE FROM kanban_comments WHERE task_id IN (SELECT id FROM synthetic_clear)",
+            "DELETE FROM kanban_attachments WHERE task_id IN (SELECT id FROM synthetic_clear)",
+            "DELETE FROM kanban_dependencies WHERE task_id IN (SELECT id FROM synthetic_clear) "
+            "OR depends_on_task_id IN (SELECT id FROM synthetic_clear)",
+            "DELETE FROM kanban_task_tombstones WHERE task_id IN (SELECT id FROM synthetic_clear)",
+        ):
+            cursor.execute(statement)
+        begin_bulk(cursor)
+        cursor.execute("DELETE FROM kanban_tasks WHERE id IN (SELECT id FROM synthetic_clear)")
+        deleted = cursor.rowcount
+        connection.commit()
+        return deleted
+    except Exception as e:
+        connection.rollback()
+        raise e
+    finally:
+        connection.close()
+
+
+class SyntheticDataGenerator:
+    """
+    Row generator behind load_synthetic_data.
+
+    All randomness comes from one ``random.Random(spec.seed)`` and is drawn
+    in a fixed order, so ids aside, a spec always yields the same rows.
+    Distributions:
+
+    - creation times skew recent (older history is thinner) and fall on
+      weekdays within office hours
+    - the older a task, the likelier it is Done; open tasks spread over the
+      other columns by OPEN_COLUMN_WEIGHTS
+    - assignees follow a long tail (a few people own most tasks), ~15% of
+      tasks go to a group instead
+    - ~65% of tasks have a deadline; about a third of finished ones with a
+      deadline completed late
+    - comments and field updates are Poisson per task, each comment with a
+      comment_added activity, each column step with a task_moved one
+
+    Activity rows carry no task_snapshot, so reconstructing a synthetic
+    task's history (KanbanManager.get_task_state_at) finds no checkpoint.
+    """
+
+    def __init__(self, spec: SyntheticSpec, columns: Sequence[Tuple[int, str]]):
+        self.spec = spec
+        self.random = random.Random(spec.seed)
+        self.anchor = spec.anchor or datetime.combine(date.today(), time())
+        self.columns = list(columns)
+        self.user_ids: List[int] = []
+        self.user_weights: List[float] = []
+        self.group_ids: List[int] = []
+        self.column_names = {column_id: name for column_id, name in self.columns}
+        self.done_column = next((column_id for column_id, name in self.columns if name == DONE_COLUMN),
+                                self.columns[-1][0])
+        self.open_columns = [column_id for column_id, _ in self.columns if column_id != self.done_column]
+        self.open_weights = _cumulative(
+            OPEN_COLUMN_WEIGHTS.get(self.column_names[column_id], 100 / max(len(self.open_columns), 1))
+            for column_id in self.open_columns
+        )
+        self.positions: Dict[int, Decimal] = {}
+
+    # -- Reference rows -----------------------------------------------------
+
+    def user_rows(self) -> List[Tuple[Any, ...]]:
+        """(username, display_name, email, role, department, is_active) for every synthetic user."""
+        rows = []
+        for number in range(1, self.spec.users + 1):
+            name = f"{self.random.choice(FIRST_NAMES)} {self.random.choice(LAST_NAMES)}"
+            username = f"{self.spec.user_prefix}{number}"
+            rows.append((username, name, f"{username}@example.com", "member", "Synthetic", True))
+        return rows
+
+    def group_rows(self) -> List[Tuple[Any, ...]]:
+        """(name, description, color, is_active) for every synthetic group."""
+        return [
+            (f"{self.spec.group_prefix}{number}", "Synthetic group", GROUP_COLORS[number % len(GROUP_COLORS)], True)
+            for number in range(1, self.spec.groups + 1)
+        ]
+
+    def set_people(self, user_ids: Sequence[int], group_ids: Sequence[int]) -> None:
+        """Database ids of the synthetic users and groups (after they were merged)."""
+        self.user_ids = list(user_ids)
+        # Long tail: the k-th user gets weight 1 / k^0.8
+        self.user_weights = _cumulative(1 / (rank + 1) ** 0.8 for rank in range(len(self.user_ids)))
+        self.group_ids = list(group_ids)
+
+    def membership_rows(self) -> List[Tuple[int, int, str]]:
+        """(group_id, user_id, role): everyone in one to three groups, the first member of each a lead."""
+        rows = []
+        leads = set()
+        for user_id in self.user_ids:
+            count = min(len(self.group_ids), self.random.choices((1, 2, 3), (60, 30, 10))[0])
+            for group_id in self.random.sample(self.group_ids, count):
+                role = "member" if group_id in leads else "lead"
+                leads.add(group_id)
+                rows.append((group_id, user_id, role))
+        return rows
+
+    # -- Tasks, comments and activity --------------------------------------
+
+    def set_positions(self, positions: Dict[int, Decimal]) -> None:
+        """Continue each column's positions after its current last task."""
+        self.positions = {column_id: Decimal(positions.get(column_id) or 0) for column_id, _ in self.columns}
+
+    def task_rows(self, task_ids: Sequence[int], comments: List[tuple], activity: List[tuple]) -> List[tuple]:
+        """Rows for the given task ids; their comment and activity rows are appended to the lists."""
+        rng = self.random
+        rows = []
+        for task_id in task_ids:
+            created_at = self._created_at()
+            age_days = (self.anchor - created_at).total_seconds() / 86400
+            # ~50% done after two weeks, ~90% after seven
+            done = rng.random() < 1 - math.exp(-age_days / 20)
+            column_id = self.done_column if done else self._pick(self.open_columns, self.open_weights)
+            creator = self._user()
+            if rng.random() < 0.15 and self.group_ids:
+                assigned_to, assigned_group_id = None, rng.choice(self.group_ids)
+            else:
+                assigned_to, assigned_group_id = self._user(), None
+            # Titles follow the category mix even when spec.category overrides the stored one
+            title_category = _weighted(rng, CATEGORY_WEIGHTS)
+            category = self.spec.category or title_category
+            priority = _weighted(rng, PRIORITY_WEIGHTS)
+            estimate = _weighted(rng, ESTIMATE_WEIGHTS)
+
+            path = self._column_path(column_id)
+            started_at = completed_at = None
+            moves = []
+            moved_at = created_at
+            for old_column, new_column in zip(path, path[1:]):
+                moved_at = min(moved_at + timedelta(hours=rng.gammavariate(2, 18)), self.anchor)
+                moves.append((old_column, new_column, moved_at))
+                if started_at is None and self.column_names[new_column] == "In Progress":
+                    started_at = moved_at
+            if done:
+                completed_at = moved_at
+            deadline = None
+            if rng.random() < 0.65:
+                slack = rng.gammavariate(2, 7)
+                if completed_at is not None and rng.random() < 0.2:
+                    # Finished late: deadline before the completion
+                    slack = max((completed_at - created_at).days - rng.randint(1, 5), 0)
+                deadline = (created_at + timedelta(days=slack)).date()
+            blocked = not done and rng.random() < 0.04
+            actual = round(estimate * rng.uniform(0.5, 1.8), 1) if done else 0
+
+            events = [created_at] + [moved for _, _, moved in moves]
+            actor = assigned_to or creator
+            activity.append((task_id, "task_created", creator, None, None, None, None, created_at))
+            for old_column, new_column, moved_at in moves:
+                activity.append((task_id, "task_moved", actor, "column", self.column_names[old_column],
+                                 self.column_names[new_column], None, moved_at))
+            last_event = moves[-1][2] if moves else created_at
+            for _ in range(_poisson(rng, self.spec.comments_per_task)):
+                commented_at = self._between(created_at, last_event + timedelta(days=2))
+                text_value = rng.choice(COMMENT_TEXTS)
+                commenter = rng.choice((actor, creator, self._user()))
+                comments.append((task_id, commenter, text_value, False, False, commented_at))
+                activity.append((task_id, "comment_added", commenter, None, None, None, text_value, commented_at))
+                events.append(commented_at)
+            for _ in range(_poisson(rng, self.spec.updates_per_task)):
+                updated_at = self._between(created_at, last_event + timedelta(days=1))
+                old_priority, new_priority = rng.sample([name for name, _ in PRIORITY_WEIGHTS], 2)
+                activity.append((task_id, "task_updated", actor, "priority", old_priority, new_priority, None,
+                                 updated_at))
+                events.append(updated_at)
+
+            self.positions[column_id] += 1
+            rows.append((
+                task_id,
+                self._title(title_category, task_id),
+                f"Synthetic {category} task generated for load testing.",
+                column_id,
+                self.positions[column_id],
+                assigned_to,
+                assigned_group_id,
+                creator,
+                priority,
+                "completed" if done else "blocked" if blocked else "active",
+                category,
+                [category, priority] if rng.random() < 0.3 else None,
+                deadline,
+                estimate,
+                actual,
+                False,
+                created_at,
+                max(events),
+                started_at,
+                completed_at,
+                False,
+            ))
+        return rows
+
+    def _created_at(self) -> datetime:
+        rng = self.random
+        # sqrt skews towards the anchor: the board grew over time
+        days_ago = self.spec.history_days * (1 - math.sqrt(rng.random()))
+        created = self.anchor - timedelta(days=days_ago)
+        if created.weekday() >= 5:
+            created -= timedelta(days=created.weekday() - 4)
+        created = created.replace(hour=rng.randint(8, 17), minute=rng.randint(0, 59), second=rng.randint(0, 59),
+                                  microsecond=0)
+        return min(created, self.anchor - timedelta(minutes=1))
+
+    def _column_path(self, column_id: int) -> List[int]:
+        """Columns a task went through to reach column_id (Backlog is skipped half the time)."""
+        order = [column for column, _ in self.columns if column != self.done_column] + [self.done_column]
+        path = order[: order.index(column_id) + 1]
+        if len(path) > 1 and self.column_names[path[0]] == "Backlog" and self.random.random() < 0.5:
+            path = path[1:]
+        return path
+
+    def _between(self, start: datetime, end: datetime) -> datetime:
+        end = min(end, self.anchor)
+        if end <= start:
+            return start
+        return start + timedelta(seconds=self.random.uniform(0, (end - start).total_seconds()))
+
+    def _title(self, category: str, task_id: int) -> str:
+        template = self.random.choice(TITLE_TEMPLATES[category])
+        name = f"{self.random.choice(FIRST_NAMES)} {self.random.choice(LAST_NAMES)}"
+        return template.format(name=name, n=task_id % 97 + 1)
+
+    def _user(self) -> int:
+        return self._pick(self.user_ids, self.user_weights)
+
+    def _pick(self, values: Sequence[Any], cumulative: Sequence[float]) -> Any:
+        return self.random.choices(values, cum_weights=cumulative)[0]
+
+
+def _cumulative(weights: Iterable[float]) -> List[float]:
+    total = 0.0
+    cumulative = []
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+    return cumulative
+
+
+def _weighted(rng: random.Random, table: Sequence[Tuple[Any, float]]) -> Any:
+    return rng.choices([value for value, _ in table], [weight for _, weight in table])[0]
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    """Poisson sample (Knuth; fine for the small means used here)."""
+    if mean <= 0:
+        return 0
+    limit = math.exp(-mean)
+    count = 0
+    product = rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def _like_prefix(prefix: str) -> str:
+    """LIKE pattern matching values that start with ``prefix`` literally."""
+    return prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def _ensure_activity_partitions(cursor, start: date, end: date) -> int:
+    """
+    Create the kanban_activity_log_YYYYMM partitions for every month from
+    ``start`` to ``end`` (same layout as scripts/migrate_partition_activity_log.sql).
+
+    ensure_activity_log_partitions() only covers the current month onwards,
+    so without these the generated history would all land in the default
+    partition. Months the default partition already holds rows for are
+    skipped, since PostgreSQL refuses to carve them out of it.
+
+    Returns:
+        Number of partitions created
+    """
+    cursor.execute("SELECT to_regclass('kanban_activity_log_default')")
+    if cursor.fetchone()[0] is None:
+        return 0  # Activity log is not partitioned (migration not applied)
+    created = 0
+    month_start = start.replace(day=1)
+    while month_start <= end:
+        month_end = (month_start + timedelta(days=32)).replace(day=1)
+        partition_name = f"kanban_activity_log_{month_start:%Y%m}"
+        cursor.execute("SELECT to_regclass(%s)", (partition_name,))
+        if cursor.fetchone()[0] is None:
+            cursor.execute(
+                "SELECT EXISTS (SELECT 1 FROM kanban_activity_log_default WHERE created_at >= %s AND created_at < %s)",
+                (month_start, month_end),
+            )
+            if cursor.fetchone()[0]:
+                print(f"[Synthetic] {partition_name} not created; the default partition has rows for that month")
+            else:
+                cursor.execute(
+                    f'CREATE TABLE "{partition_name}" PARTITION OF kanban_activity_log FOR VALUES FROM (%s) TO (%s)',
+                    (month_start.isoformat(), month_end.isoformat()),
+                )
+                created += 1
+        month_start = month_end
+    return created
+
+
+def _upsert_reference(cursor, table: str, columns: Sequence[str], rows: Sequence[tuple], conflict: str,
+                      chunk_rows: int) -> None:
+    """COPY into a temp table and merge, so reruns reuse existing rows (COPY has no ON CONFLICT)."""
+    staging = f"synthetic_{table}"
+    cursor.execute(f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+    copy_rows(cursor, staging, columns, rows, chunk_rows)
+    names = ", ".join(columns)
+    cursor.execute(f"INSERT INTO {table} ({names}) SELECT {names} FROM {staging} ON CONFLICT ({conflict}) DO NOTHING")
+
+
+def load_synthetic_data(engine: Engine, spec: SyntheticSpec) -> SyntheticLoadResult:
+    """
+    Generate a dataset and stream it into the database in one transaction.
+
+    Users, groups and memberships are merged by name with triggers on (so
+    reference_data_version moves); tasks, comments and activity are then
+    COPYed in chunks of ``spec.chunk_rows``, with triggers skipped when
+    permitted. Task ids are drawn from the table's sequence up front, one
+    chunk at a time, so comments and activity can reference them without a
+    round trip. Monthly activity-log partitions are created for the whole
+    history first. Run ANALYZE afterwards (see analyze_tables).
+
+    Args:
+        engine: SQLAlchemy engine on a psycopg2 connection
+        spec: What to generate
+
+    Returns:
+        Ids and row counts of the load
+    """
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT id, name FROM kanban_columns WHERE is_active = TRUE ORDER BY position")
+        columns = cursor.fetchall()
+        if not columns:
+            raise ValueError("No active columns; create the board columns first")
+
+        generator = SyntheticDataGenerator(spec, columns)
+        _upsert_reference(
+            cursor, "kanban_users", ("username", "display_name", "email", "role", "department", "is_active"),
+            generator.user_rows(), "username", spec.chunk_rows,
+        )
+        cursor.execute(
+            "SELECT id FROM kanban_users WHERE username LIKE %s ORDER BY id", (_like_prefix(spec.user_prefix),)
+        )
+        user_ids = [row[0] for row in cursor.fetchall()]
+        _upsert_reference(
+            cursor, "kanban_groups", ("name", "description", "color", "is_active"),
+            generator.group_rows(), "name", spec.chunk_rows,
+        )
+        cursor.execute(
+            "SELECT id FROM kanban_groups WHERE name LIKE %s ORDER BY id", (_like_prefix(spec.group_prefix),)
+        )
+        group_ids = [row[0] for row in cursor.fetchall()]
+        if not user_ids:
+            raise ValueError("At least one synthetic user is needed")
+
+        generator.set_people(user_ids, group_ids)
+        memberships = generator.membership_rows() if group_ids else []
+        _upsert_reference(
+            cursor, "kanban_group_members", ("group_id", "user_id", "role"),
+            memberships, "group_id, user_id", spec.chunk_rows,
+        )
+
+        # Creation times can be moved back to the Friday before history_days
+        history_start = generator.anchor - timedelta(days=spec.history_days + 3)
+        partitions = _ensure_activity_partitions(cursor, history_start.date(), generator.anchor.date())
+        if partitions:
+            print(f"[Synthetic] Created {partitions} activity log partitions for the history")
+
+        triggers_skipped = begin_bulk(cursor)
+        if not triggers_skipped:
+            print("[Synthetic] Not allowed to skip triggers; the load will be slower")
+        cursor.execute("SELECT column_id, MAX(position) FROM kanban_tasks GROUP BY column_id")
+        generator.set_positions(dict(cursor.fetchall()))
+
+        counts = {"tasks": 0, "comments": 0, "activity": 0}
+        first_id = last_id = None
+        remaining = spec.tasks
+        while remaining > 0:
+            size = min(remaining, spec.chunk_rows)
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence('kanban_tasks', 'id')) FROM generate_series(1, %s)", (size,)
+            )
+            task_ids = [row[0] for row in cursor.fetchall()]
+            first_id = task_ids[0] if first_id is None else first_id
+            last_id = task_ids[-1]
+            comments: List[tuple] = []
+            activity: List[tuple] = []
+            tasks = generator.task_rows(task_ids, comments, activity)
+            counts["tasks"] += copy_rows(cursor, "kanban_tasks", TASK_COLUMNS, tasks, spec.chunk_rows)
+            counts["comments"] += copy_rows(cursor, "kanban_comments", COMMENT_COLUMNS, comments, spec.chunk_rows)
+            counts["activity"] += copy_rows(cursor, "kanban_activity_log", ACTIVITY_COLUMNS, activity, spec.chunk_rows)
+            remaining -= size
+            print(f"[Synthetic] {counts['tasks']:,}/{spec.tasks:,} tasks copied")
+
+        connection.commit()
+    except Exception as e:
+        connection.rollback()
+        raise e
+    finally:
+        connection.close()
+
+    counts.update(users=len(user_ids), groups=len(group_ids), memberships=len(memberships))
+    return SyntheticLoadResult(
+        user_ids=user_ids,
+        group_ids=group_ids,
+        column_ids=[column_id for column_id, _ in columns],
+        task_ids=(first_id, last_id) if first_id is not None else (0, -1),
+        counts=counts,
+        triggers_skipped=triggers_skipped,
+    )
+
+
+def analyze_tables(engine: Engine) -> None:
+    """ANALYZE the tables a load wrote to, so the planner sees the new row counts."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for table_name in LOADED_TABLES:
+            connection.execute(text(f"ANALYZE {table_name}"))
@@ -13,7 +13,8 @@ from config_manager import (
 )
 from kanban.auth import AuthResult, logout, resume_session, update_last_activity
 from kanban.database import get_db_manager
-from kanban.manager import KanbanManager
+from kanban.local_replica import ReplicaSyncResult, ReplicaSyncWorker, open_local_replica
+from kanban.manager import BoardChanges, BoardSnapshot, KanbanManager
 from kanban.ui_components import AdminPasswordResetDialog, ChangePasswordDialog, LoginDialog
 
 # Import color constants from ui.py
@@ -39,20 +40,30 @@ class DraggableTaskCard(QtWidgets.QFrame):
     """A draggable task card widget."""
     
     clicked = QtCore.Signal(int)  # Emits task_id when clicked
+    selection_toggled = QtCore.Signal(int)  # Emits task_id on Ctrl+click
     
-    def __init__(self, task, parent=None):
+    def __init__(self, task, parent=None, selected: bool = False, selection_provider=None):
         super().__init__(parent)
         self.task = task
         self.task_id = task.id
+        self.selected = selected
+        # Returns the selected task ids; dragging a selected card drags all of them
+        self.selection_provider = selection_provider
         self._setup_ui()
         
     def _setup_ui(self):
         """Setup the card UI."""
+        self._apply_style()
+        self.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+
+    def _apply_style(self):
+        border = f"2px solid {ACCENT}" if self.selected else "1px solid rgba(56, 189, 248, 0.2)"
+        background = "rgba(56, 189, 248, 0.12)" if self.selected else CARD_BG
         self.setStyleSheet(
             f"""
             QFrame {{
-                background-color: {CARD_BG};
-                border: 1px solid rgba(56, 189, 248, 0.2);
+                background-color: {background};
+                border: {border};
                 border-radius: 6px;
                 padding: 8px;
             }}
@@ -62,7 +73,12 @@ class DraggableTaskCard(QtWidgets.QFrame):
             }}
             """
         )
-        self.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+
+    def set_selected(self, selected: bool) -> None:
+        """Show or clear the multi-select highlight."""
+        if selected != self.selected:
+            self.selected = selected
+            self._apply_style()
         
     def mousePressEvent(self, event):
         """Handle mouse press - start drag or click."""
@@ -77,10 +93,13 @@ class DraggableTaskCard(QtWidgets.QFrame):
         if (event.pos() - self.drag_start_position).manhattanLength() < QtWidgets.QApplication.startDragDistance():
             return
             
-        # Create drag
+        # Create drag (all selected cards when dragging a selected card)
+        task_ids = [self.task_id]
+        if self.selected and self.selection_provider:
+            task_ids = self.selection_provider() or task_ids
         drag = QtGui.QDrag(self)
         mime_data = QtCore.QMimeData()
-        mime_data.setText(str(self.task_id))
+        mime_data.setText(",".join(str(task_id) for task_id in task_ids))
         drag.setMimeData(mime_data)
         
         # Create drag pixmap (preview)
@@ -96,7 +115,10 @@ class DraggableTaskCard(QtWidgets.QFrame):
         try:
             if hasattr(self, 'drag_start_position'):
                 if (event.pos() - self.drag_start_position).manhattanLength() < QtWidgets.QApplication.startDragDistance():
-                    self.clicked.emit(self.task_id)
+                    if event.modifiers() & QtCore.Qt.KeyboardModifier.ControlModifier:
+                        self.selection_toggled.emit(self.task_id)
+                    else:
+                        self.clicked.emit(self.task_id)
             super().mouseReleaseEvent(event)
         except RuntimeError:
             # Widget was deleted during drag operation, ignore
@@ -106,7 +128,8 @@ class DraggableTaskCard(QtWidgets.QFrame):
 class DropZoneColumn(QtWidgets.QFrame):
     """A column that accepts dropped task cards."""
     
-    task_dropped = QtCore.Signal(int, int)  # Emits (task_id, column_id)
+    task_dropped = QtCore.Signal(int, int, int)  # Emits (task_id, column_id, before_task_id or 0 = end)
+    tasks_dropped = QtCore.Signal(list, int)  # Emits (task_ids, column_id) for multi-card drags
     
     def __init__(self, column_id, parent=None):
         super().__init__(parent)
@@ -147,8 +170,12 @@ class DropZoneColumn(QtWidgets.QFrame):
         
     def dropEvent(self, event):
         """Handle drop - emit signal."""
-        task_id = int(event.mimeData().text())
-        self.task_dropped.emit(task_id, self.column_id)
+        task_ids = [int(task_id) for task_id in event.mimeData().text().split(",") if task_id]
+        if len(task_ids) == 1:
+            before_task_id = self._card_below(event.position().toPoint(), exclude=task_ids)
+            self.task_dropped.emit(task_ids[0], self.column_id, before_task_id)
+        elif task_ids:
+            self.tasks_dropped.emit(task_ids, self.column_id)
         event.acceptProposedAction()
         
         # Reset styling
@@ -163,6 +190,28 @@ class DropZoneColumn(QtWidgets.QFrame):
         )
 
 
+    def _card_below(self, pos: QtCore.QPoint, exclude: list) -> int:
+        """Task id of the first card whose vertical midpoint is below the drop point (0 = end)."""
+        cards = [
+            card for card in self.findChildren(DraggableTaskCard)
+            if card.isVisible() and card.task_id not in exclude
+        ]
+        cards.sort(key=lambda card: card.mapTo(self, QtCore.QPoint(0, 0)).y())
+        for card in cards:
+            if pos.y() < card.mapTo(self, QtCore.QPoint(0, 0)).y() + card.height() / 2:
+                return card.task_id
+        return 0
+
+
+class BoardChangeNotifier(QtCore.QObject):
+    """Re-emits database change notifications (listener thread) on the Qt main thread."""
+
+    changed = QtCore.Signal(dict)
+    connection_changed = QtCore.Signal(bool)
+    # ReplicaSyncResult from the local replica's sync thread
+    replica_synced = QtCore.Signal(object)
+
+
 class KanbanBoardWidget(QtWidgets.QWidget):
     """Main Kanban board widget displaying columns and task cards."""
 
@@ -173,8 +222,17 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         self.auth_result: AuthResult | None = None
         self.columns = []
         self.column_widgets = {}
-        self.column_page_sizes = {}  # Track how many tasks to show per column
+        self.column_totals = {}  # column_id -> filtered task count when columns are paged
         self.column_view_modes = {}  # Track view mode per column (auto, detailed, compact, mini)
+        self.group_member_names = {}  # group_id -> member display names, from the last board snapshot
+        self.column_tasks = {}  # column_id -> tasks currently rendered (patched by delta sync)
+        self.blocked_by = {}  # task_id -> task numbers of its open blockers
+        self.sync_cursor = None  # Server timestamp of the last board sync
+        self.replica = None  # LocalReplica (SQLite copy of the board), see _start_replica
+        self.replica_worker = None  # ReplicaSyncWorker keeping the replica current
+        self.board_from_replica = False  # Whether the rendered board was read from the replica
+        self.selected_task_ids: set[int] = set()  # Multi-select (Ctrl+click) for bulk actions
+        self.task_cards = {}  # task_id -> rendered DraggableTaskCard
         self.account_button: QtWidgets.QToolButton | None = None
         self.account_menu: QtWidgets.QMenu | None = None
         self.admin_reset_action: QtGui.QAction | None = None
@@ -183,14 +241,38 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         self.sign_out_action: QtGui.QAction | None = None
         self._last_username: str | None = None
         
-        # Pagination settings
+        # Pagination settings: unfiltered columns load PAGINATION_THRESHOLD cards,
+        # then "Load More" fetches TASKS_PER_PAGE at a time (keyset pages)
         self.TASKS_PER_PAGE = 20
+        self.PAGINATION_THRESHOLD = 30
         
+        # Debounce board search: one database search after typing pauses
+        self.search_timer = QtCore.QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(250)
+        self.search_timer.timeout.connect(self._run_search)
+
+        # Refresh intervals: polling only as a fallback while live updates are connected
+        self.AUTO_REFRESH_INTERVAL_MS = 30000  # 30 seconds
+        self.FALLBACK_REFRESH_INTERVAL_MS = 300000  # 5 minutes
+
         # Auto-refresh timer
         self.auto_refresh_timer = QtCore.QTimer(self)
-        self.auto_refresh_timer.setInterval(30000)  # 30 seconds
+        self.auto_refresh_timer.setInterval(self.AUTO_REFRESH_INTERVAL_MS)
         self.auto_refresh_timer.timeout.connect(self._auto_refresh)
 
+        # Live updates (PostgreSQL LISTEN/NOTIFY)
+        self.change_listener = None
+        self.change_notifier = BoardChangeNotifier(self)
+        self.change_notifier.changed.connect(self._on_database_changed)
+        self.change_notifier.connection_changed.connect(self._on_live_updates_connection_changed)
+        self.change_notifier.replica_synced.connect(self._on_replica_synced)
+        # Coalesce bursts of notifications (e.g. bulk edits) into a single sync
+        self.live_update_timer = QtCore.QTimer(self)
+        self.live_update_timer.setSingleShot(True)
+        self.live_update_timer.setInterval(300)
+        self.live_update_timer.timeout.connect(self._auto_refresh)
+
         self._init_database()
         self._init_ui()
         QtCore.QTimer.singleShot(0, self._attempt_initial_login)
@@ -378,6 +460,7 @@ class KanbanBoardWidget(QtWidgets.QWidget):
 
         self._update_authenticated_controls(enabled=True, username=auth.user.display_name)
         self._update_reports_tab_visibility()
+        self._start_replica()
         self._clear_board()
         self._load_board()
         
@@ -386,8 +469,11 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         if auth.user.role in {'admin', 'manager'}:
             self._refresh_reports()
         
-        # Start auto-refresh timer
+        # Start auto-refresh timer and live updates
         self.auto_refresh_timer.start()
+        self._start_live_updates()
+        self._start_report_refresher()
+        self._start_audit_writer()
 
         if auth.must_change_password:
             QtWidgets.QMessageBox.information(
@@ -400,6 +486,9 @@ class KanbanBoardWidget(QtWidgets.QWidget):
     def _show_logged_out_state(self, message: str) -> None:
         self.auth_result = None
         self.manager = None
+        self._stop_live_updates()
+        self._stop_replica()
+        self._clear_task_selection()
         self._update_authenticated_controls(enabled=False)
         self._update_reports_tab_visibility()
         self._clear_board()
@@ -423,8 +512,11 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         self.auth_result = None
         self.manager = None
         
-        # Stop auto-refresh timer
+        # Stop auto-refresh timer and live updates
         self.auto_refresh_timer.stop()
+        self._stop_live_updates()
+        self._stop_replica()
+        self._clear_task_selection()
         
         self._update_authenticated_controls(enabled=False)
         self._clear_board()
@@ -433,6 +525,127 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         self.empty_state.setText("Signed out. Use the account menu to sign in.")
         self.empty_state.show()
 
+    # ------------------------------------------------------------------
+    # Live updates
+    # ------------------------------------------------------------------
+
+    def _start_live_updates(self) -> None:
+        """Start listening for database change notifications."""
+        if self.change_listener is not None or not self.db:
+            return
+        try:
+            self.change_listener = self.db.start_change_listener(
+                self.change_notifier.changed.emit,
+                status_callback=self.change_notifier.connection_changed.emit,
+            )
+        except Exception as e:
+            print(f"[LiveUpdates] Could not start change listener, polling only: {e}")
+            self.change_listener = None
+
+    def _start_report_refresher(self) -> None:
+        """Keep the materialized reporting views fresh while this client is signed in."""
+        if not self.db:
+            return
+        try:
+            self.db.start_report_refresher()
+        except Exception as e:
+            print(f"[Reports] Could not start reporting view refresher: {e}")
+
+    def _start_audit_writer(self) -> None:
+        """Move JSONL audit summaries off the UI thread when async audit is enabled."""
+        if not self.db:
+            return
+        try:
+            self.db.start_audit_writer()
+        except Exception as e:
+            print(f"[AuditLog] Could not start background audit writer: {e}")
+
+    def _start_replica(self) -> None:
+        """Open the local board replica and start its sync thread (board reads become local)."""
+        if not self.db or not self.manager:
+            return
+        try:
+            if self.replica is None:
+                self.replica = open_local_replica(self.db)
+            if self.replica is None:
+                return
+            self.replica_worker = ReplicaSyncWorker(
+                self.replica,
+                self.manager,
+                callback=self.change_notifier.replica_synced.emit,
+                interval=float(self.db.config["database"].get("replica_sync_interval", 10)),
+            )
+            self.replica_worker.start()
+        except Exception as e:
+            print(f"[Replica] Could not open local replica, reading from the database: {e}")
+            self.replica_worker = None
+
+    def _stop_replica(self) -> None:
+        """Stop the replica sync thread (the replica file and queued writes are kept)."""
+        if self.replica_worker is not None:
+            self.replica_worker.stop()
+            self.replica_worker = None
+        self.board_from_replica = False
+
+    def _on_replica_synced(self, result: ReplicaSyncResult) -> None:
+        """Patch the board after a replica sync cycle (runs on the Qt main thread)."""
+        if not self.manager or self.replica_worker is None:
+            return
+        if result.conflicts or result.failed:
+            self._show_rejected_moves(result)
+
+        if not self.board_from_replica:
+            # Database went away while rendering from it: switch to the replica
+            if not result.online and self.replica.is_ready and self.column_widgets:
+                self._refresh_tasks()
+            return
+        if not result.changed:
+            return
+        if result.full_reload or result.columns_changed:
+            self._clear_board()
+            self._load_board()
+            return
+
+        if result.reference_changed and self._refresh_filters():
+            # A selected user/group disappeared - re-render with the reset filters
+            self._refresh_tasks()
+            return
+
+        filters = self._current_filters()
+        self._apply_board_changes(
+            self.replica.changes_for(result.task_ids, filters),
+            lambda: self.replica.column_task_counts(filters),
+            self.replica.blocked_tasks,
+        )
+
+    def _show_rejected_moves(self, result: ReplicaSyncResult) -> None:
+        """Tell the user which queued moves were not applied on the server."""
+        lines = [f"• Task {write.task_id}: {write.last_error}" for write in result.conflicts + result.failed]
+        QtWidgets.QMessageBox.warning(
+            self,
+            "Moves Not Applied",
+            "These moves were made while offline or before a sync and were not applied:\n\n" + "\n".join(lines),
+        )
+
+    def _stop_live_updates(self) -> None:
+        """Stop the change listener and go back to regular polling."""
+        self.live_update_timer.stop()
+        if self.change_listener is not None and self.db:
+            self.db.stop_change_listener(self.change_listener)
+        self.change_listener = None
+        self.auto_refresh_timer.setInterval(self.AUTO_REFRESH_INTERVAL_MS)
+
+    def _on_live_updates_connection_changed(self, connected: bool) -> None:
+        """Poll rarely while notifications arrive, every 30s when the listener is down."""
+        interval = self.FALLBACK_REFRESH_INTERVAL_MS if connected else self.AUTO_REFRESH_INTERVAL_MS
+        self.auto_refresh_timer.setInterval(interval)
+
+    def _on_database_changed(self, payload: dict) -> None:
+        """Handle a change notification from another client (debounced)."""
+        if not self.manager or not self.auth_result:
+            return
+        self.live_update_timer.start()
+
     def _change_password(self) -> None:
         if not self.auth_result:
             return
@@ -454,6 +667,9 @@ class KanbanBoardWidget(QtWidgets.QWidget):
                 item.widget().deleteLater()
         self.columns = []
         self.column_widgets = {}
+        self.column_tasks = {}
+        self.task_cards = {}
+        self.sync_cursor = None
 
     def _clear_my_tasks(self) -> None:
         """Clear all My Tasks lists."""
@@ -731,6 +947,29 @@ class KanbanBoardWidget(QtWidgets.QWidget):
 
         layout.addWidget(self.account_button)
 
+        # Bulk actions for Ctrl+click selected cards (hidden while nothing is selected)
+        self.selection_button = QtWidgets.QToolButton()
+        self.selection_button.setPopupMode(QtWidgets.QToolButton.ToolButtonPopupMode.InstantPopup)
+        self.selection_button.setFixedHeight(36)
+        self.selection_button.setStyleSheet(
+            f"""
+            QToolButton {{
+                background-color: rgba(56, 189, 248, 0.15);
+                border: 1px solid {ACCENT};
+                border-radius: 8px;
+                padding: 8px 16px;
+                color: {TEXT_PRIMARY};
+                font-weight: 600;
+                font-size: 13px;
+            }}
+            """
+        )
+        self.selection_menu = QtWidgets.QMenu(self.selection_button)
+        self.selection_menu.aboutToShow.connect(self._populate_selection_menu)
+        self.selection_button.setMenu(self.selection_menu)
+        self.selection_button.setVisible(False)
+        layout.addWidget(self.selection_button)
+
         # Refresh button
         self.refresh_btn = QtWidgets.QPushButton("🔄 Refresh")
         self.refresh_btn.setFixedHeight(36)
@@ -1021,6 +1260,12 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         header.setStyleSheet(f"font-size: 24px; font-weight: 700; color: {TEXT_PRIMARY};")
         header_row.addWidget(header)
         header_row.addStretch()
+
+        # Archived tasks live in separate tables; counting them reads both
+        self.reports_include_archived = QtWidgets.QCheckBox("Include archived")
+        self.reports_include_archived.setStyleSheet(f"color: {TEXT_MUTED}; font-weight: 600; font-size: 13px;")
+        self.reports_include_archived.toggled.connect(lambda _checked: self._refresh_reports())
+        header_row.addWidget(self.reports_include_archived)
         
         # Time period selector for performance metrics
         time_period_label = QtWidgets.QLabel("Time Period:")
@@ -1468,7 +1713,7 @@ class KanbanBoardWidget(QtWidgets.QWidget):
             from datetime import datetime, timedelta
             
             # Get statistics
-            stats = self.manager.get_statistics()
+            stats = self.manager.get_statistics(self.reports_include_archived.isChecked())
 
             # Update stat cards
             total_card = self.total_tasks_card.findChild(QtWidgets.QLabel, "Total_value")
@@ -1513,7 +1758,7 @@ class KanbanBoardWidget(QtWidgets.QWidget):
             return
         
         try:
-            from datetime import datetime, timedelta, date
+            from datetime import datetime, timedelta
             
             # Get time period
             time_period = self.reports_time_period.currentData()
@@ -1527,152 +1772,16 @@ class KanbanBoardWidget(QtWidgets.QWidget):
             else:  # all time
                 start_date = None
             
-            # Get all users and tasks
-            users = self.manager.get_all_users()
-            all_tasks = self.manager.get_all_tasks()
-            
-            # Calculate performance for each user
+            # Per-user, per-group and unassigned metrics computed in the database
             performance_data = []
-            
-            for user in users:
-                if not user.is_active:
-                    continue
-                
-                # Filter tasks for this user
-                user_tasks = [t for t in all_tasks if t.assigned_to == user.id and not t.is_deleted]
-                
-                # Apply time period filter
-                if start_date:
-                    user_tasks = [t for t in user_tasks if t.created_at.date() >= start_date]
-                
-                # Calculate metrics
-                total_assigned = len(user_tasks)
-                if total_assigned == 0:
-                    continue  # Skip users with no tasks
-                
-                # Active tasks (not in Done column)
-                active = len([t for t in user_tasks if t.column and t.column.name != "Done"])
-                
-                # Done tasks (in Done column)
-                done = len([t for t in user_tasks if t.column and t.column.name == "Done"])
-                
-                # Overdue tasks
-                overdue = len([t for t in user_tasks if t.is_overdue])
-                
-                # On-time completion percentage
-                done_with_deadline = [t for t in user_tasks 
-                                     if t.column and t.column.name == "Done" 
-                                     and t.deadline and t.completed_at]
-                
-                if done_with_deadline:
-                    on_time_count = 0
-                    for task in done_with_deadline:
-                        completed_date = task.completed_at.date() if isinstance(task.completed_at, datetime) else task.completed_at
-                        deadline_date = task.deadline if isinstance(task.deadline, date) else task.deadline
-                        if completed_date <= deadline_date:
-                            on_time_count += 1
-                    on_time_pct = (on_time_count / len(done_with_deadline)) * 100
-                else:
-                    on_time_pct = None  # N/A
-                
-                # Average completion days
-                if done > 0:
-                    completion_times = []
-                    for task in user_tasks:
-                        if task.column and task.column.name == "Done" and task.completed_at:
-                            completed_date = task.completed_at.date() if isinstance(task.completed_at, datetime) else task.completed_at
-                            created_date = task.created_at.date() if isinstance(task.created_at, datetime) else task.created_at
-                            days = (completed_date - created_date).days
-                            completion_times.append(days)
-                    avg_days = sum(completion_times) / len(completion_times) if completion_times else 0
-                else:
-                    avg_days = None  # N/A
-                
-                performance_data.append({
-                    "name": user.display_name,
-                    "active": active,
-                    "done": done,
-                    "on_time_pct": on_time_pct,
-                    "overdue": overdue,
-                    "avg_days": avg_days
-                })
-            
-            # Add team/group performance
-            groups = self.manager.get_all_groups()
-            for group in groups:
-                if not group.is_active:
-                    continue
-                
-                # Get tasks for this group
-                group_tasks = [t for t in all_tasks if t.assigned_group_id == group.id and not t.is_deleted]
-                
-                # Apply time period filter
-                if start_date:
-                    group_tasks = [t for t in group_tasks if t.created_at.date() >= start_date]
-                
-                if not group_tasks:
-                    continue
-                
-                # Calculate metrics for group
-                group_active = len([t for t in group_tasks if t.column and t.column.name != "Done"])
-                group_done = len([t for t in group_tasks if t.column and t.column.name == "Done"])
-                group_overdue = len([t for t in group_tasks if t.is_overdue])
-                
-                # On-time percentage for group
-                done_with_deadline = [t for t in group_tasks 
-                                     if t.column and t.column.name == "Done" 
-                                     and t.deadline and t.completed_at]
-                
-                if done_with_deadline:
-                    on_time_count = 0
-                    for task in done_with_deadline:
-                        completed_date = task.completed_at.date() if isinstance(task.completed_at, datetime) else task.completed_at
-                        deadline_date = task.deadline if isinstance(task.deadline, date) else task.deadline
-                        if completed_date <= deadline_date:
-                            on_time_count += 1
-                    group_on_time_pct = (on_time_count / len(done_with_deadline)) * 100
-                else:
-                    group_on_time_pct = None
-                
-                # Average days for group
-                if group_done > 0:
-                    completion_times = []
-                    for task in group_tasks:
-                        if task.column and task.column.name == "Done" and task.completed_at:
-                            completed_date = task.completed_at.date() if isinstance(task.completed_at, datetime) else task.completed_at
-                            created_date = task.created_at.date() if isinstance(task.created_at, datetime) else task.created_at
-                            days = (completed_date - created_date).days
-                            completion_times.append(days)
-                    group_avg_days = sum(completion_times) / len(completion_times) if completion_times else 0
-                else:
-                    group_avg_days = None
-                
-                performance_data.append({
-                    "name": f"👥 {group.name} (Team)",
-                    "active": group_active,
-                    "done": group_done,
-                    "on_time_pct": group_on_time_pct,
-                    "overdue": group_overdue,
-                    "avg_days": group_avg_days
-                })
-            
-            # Add unassigned tasks
-            unassigned_tasks = [t for t in all_tasks if not t.assigned_to and not t.is_deleted]
-            if start_date:
-                unassigned_tasks = [t for t in unassigned_tasks if t.created_at.date() >= start_date]
-            
-            if unassigned_tasks:
-                unassigned_active = len([t for t in unassigned_tasks if t.column and t.column.name != "Done"])
-                unassigned_done = len([t for t in unassigned_tasks if t.column and t.column.name == "Done"])
-                unassigned_overdue = len([t for t in unassigned_tasks if t.is_overdue])
-                performance_data.append({
-                    "name": UNASSIGNED_LABEL,
-                    "active": unassigned_active,
-                    "done": unassigned_done,
-                    "on_time_pct": None,
-                    "overdue": unassigned_overdue,
-                    "avg_days": None
-                })
+            for data in self.manager.get_team_performance(
+                start_date, include_archived=self.reports_include_archived.isChecked()
+            ):
+                if data["kind"] == "group":
+                    data["name"] = f"👥 {data['name']} (Team)"
+                elif data["kind"] == "unassigned":
+                    data["name"] = UNASSIGNED_LABEL
+                performance_data.append(data)
             
             # Sort by overdue (desc), then active (desc)
             performance_data.sort(key=lambda x: (-x["overdue"], -x["active"]))
@@ -1754,22 +1863,14 @@ class KanbanBoardWidget(QtWidgets.QWidget):
 
         try:
             self.empty_state.hide()
-            # Get all columns
-            self.columns = self.manager.get_all_columns()
+            # Assignee/group dropdowns are repopulated below, so load unfiltered by them
+            filters = self._current_filters()
+            filters.update(assigned_to=None, assigned_group_id=None)
+            snapshot = self._fetch_board_snapshot(filters)
+            self.columns = snapshot.columns
 
-            # Populate assignee filter
-            users = self.manager.get_all_users()
-            self.assignee_filter.clear()
-            self.assignee_filter.addItem("👤 All Users", None)
-            for user in users:
-                self.assignee_filter.addItem(f"👤 {user.display_name}", user.id)
-            
-            # Populate group filter
-            groups = self.manager.get_all_groups()
-            self.group_filter.clear()
-            self.group_filter.addItem("👥 All Groups", None)
-            for group in groups:
-                self.group_filter.addItem(f"👥 {group.name}", group.id)
+            # Populate assignee and group filters
+            self._populate_filter_dropdowns(snapshot, keep_selection=False)
 
             # Create column widgets
             for column in self.columns:
@@ -1778,7 +1879,7 @@ class KanbanBoardWidget(QtWidgets.QWidget):
                 self.board_layout.addWidget(column_widget)
 
             # Load tasks into columns
-            self._refresh_tasks()
+            self._refresh_tasks(snapshot)
 
         except Exception as e:
             self._show_error(f"Failed to load board: {e}")
@@ -1804,6 +1905,7 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         
         # Connect drop signal
         column_container.task_dropped.connect(self._on_task_dropped)
+        column_container.tasks_dropped.connect(self._on_tasks_dropped)
 
         layout = QtWidgets.QVBoxLayout(column_container)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -1878,127 +1980,220 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         # Only auto-refresh the current tab
         current_tab = self.tab_widget.currentIndex()
         if current_tab == 0:  # Board tab
-            self._refresh_tasks()
+            self._sync_board_changes()
         elif current_tab == 1:  # My Tasks tab
             self._refresh_my_tasks()
         elif current_tab == 2:  # Reports tab
             self._refresh_reports()
 
-    def _refresh_tasks(self) -> None:
+    def _current_filters(self) -> dict:
+        """Collect the toolbar filter values for KanbanManager.get_board_snapshot."""
+        return {
+            "assigned_to": self.assignee_filter.currentData(),
+            "assigned_group_id": self.group_filter.currentData(),
+            "priority": self.priority_filter.currentData(),
+            "search": self.search_input.text().strip(),
+        }
+
+    def _fetch_board_snapshot(self, filters: Optional[dict] = None) -> BoardSnapshot:
+        """
+        Board snapshot for the given (default: current) filters; unfiltered boards load the first page per column.
+
+        Served from the local replica once it has synced, except searches
+        while the database is reachable (full-text search needs PostgreSQL).
+        """
+        if filters is None:
+            filters = self._current_filters()
+        page_size = None if self._filters_active(filters) else self.PAGINATION_THRESHOLD
+        self.board_from_replica = bool(
+            self.replica_worker is not None
+            and self.replica.is_ready
+            and (not filters.get("search") or self.replica_worker.online is False)
+        )
+        if self.board_from_replica:
+            return self.replica.board_snapshot(filters, page_size=page_size)
+        return self.manager.get_board_snapshot(filters, page_size=page_size)
+
+    def _refresh_tasks(self, snapshot: Optional[BoardSnapshot] = None) -> None:
         """Refresh tasks in all columns with pagination."""
         if not self.manager:
             return
 
+        # One round trip for the whole board instead of one query per column
+        if snapshot is None:
+            snapshot = self._fetch_board_snapshot()
+        self.group_member_names = snapshot.group_member_names
+        self.column_tasks = {column.id: list(snapshot.tasks_by_column.get(column.id, [])) for column in self.columns}
+        self.column_totals = dict(snapshot.column_totals)
+        self.blocked_by = dict(snapshot.blocked_by)
+        self.sync_cursor = snapshot.synced_at
+
         for column in self.columns:
-            # Get column's tasks container
-            column_widget = self.column_widgets.get(column.id)
-            if not column_widget:
-                continue
-
-            tasks_container = column_widget.findChild(QtWidgets.QWidget, f"tasks_container_{column.id}")
-            if not tasks_container:
-                continue
-
-            # Clear existing tasks
-            layout = tasks_container.layout()
-            while layout.count() > 1:  # Keep the stretch at the end
-                item = layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-
-            # Get tasks for this column
-            tasks = self.manager.get_tasks_by_column(column.id)
-
-            # Apply filters
-            tasks = self._filter_tasks(tasks)
-            total_tasks = len(tasks)
-
-            # Determine if pagination should be used
-            use_pagination = self._should_use_pagination(tasks)
-            
-            # Get page size for this column (default to TASKS_PER_PAGE)
-            page_size = self.column_page_sizes.get(column.id, self.TASKS_PER_PAGE)
-            
-            # Determine visible tasks
-            if use_pagination and total_tasks > page_size:
-                visible_tasks = tasks[:page_size]
-            else:
-                visible_tasks = tasks
-                page_size = total_tasks  # Show all
-
-            # Determine view mode based on task count
-            view_mode = self._get_view_mode_for_column(column.id, total_tasks)
-
-            # Add task cards
-            if visible_tasks:
-                for task in visible_tasks:
-                    task_card = self._create_task_card(task, view_mode=view_mode, column_task_count=total_tasks)
-                    layout.insertWidget(layout.count() - 1, task_card)
-            elif total_tasks == 0:
-                # Show empty state if no tasks
-                empty_label = QtWidgets.QLabel("No tasks")
-                empty_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-                empty_label.setStyleSheet(f"color: {TEXT_MUTED}; padding: 20px; font-size: 11px;")
-                layout.insertWidget(layout.count() - 1, empty_label)
-
-            # Add pagination controls if needed
-            if use_pagination and total_tasks > page_size:
-                pagination_widget = self._create_pagination_controls(column.id, page_size, total_tasks)
-                layout.insertWidget(layout.count() - 1, pagination_widget)
-
-            # Update task count
-            count_badge = column_widget.findChild(QtWidgets.QLabel, f"count_badge_{column.id}")
-            if count_badge:
-                if use_pagination and total_tasks > page_size:
-                    count_badge.setText(f"{page_size}/{total_tasks}")
-                else:
-                    count_badge.setText(str(total_tasks))
-
-            # WIP limit warning
-            if column.wip_limit and total_tasks > column.wip_limit:
-                wip_label = column_widget.findChild(QtWidgets.QLabel, f"wip_label_{column.id}")
-                if wip_label:
-                    wip_label.setStyleSheet(
-                        f"font-size: 10px; color: {WARNING}; font-weight: 700; border: none; padding: 2px 0;"
-                    )
-                    wip_label.setText(f"⚠️ WIP Limit Exceeded: {total_tasks}/{column.wip_limit}")
-
-    def _filter_tasks(self, tasks: list) -> list:
-        """Apply current filters to task list."""
-        filtered = tasks
+            self._render_column(column, self.column_tasks[column.id])
+
+    def _sync_board_changes(self) -> None:
+        """Patch the board with tasks changed since the last sync (auto-refresh path)."""
+        if not self.manager:
+            return
 
-        # Assignee filter
-        assignee_id = self.assignee_filter.currentData()
-        if assignee_id is not None:
-            filtered = [t for t in filtered if t.assigned_to == assignee_id]
+        if self.replica_worker is not None:
+            # The sync thread pulls the changes; _on_replica_synced patches the board
+            self.replica_worker.sync_now()
+            if self.board_from_replica:
+                return
 
-        # Group filter
-        group_id = self.group_filter.currentData()
-        if group_id is not None:
-            filtered = [t for t in filtered if t.assigned_group_id == group_id]
+        if self.sync_cursor is None:
+            self._refresh_tasks()
+            return
 
-        # Priority filter
-        priority = self.priority_filter.currentData()
-        if priority is not None:
-            filtered = [t for t in filtered if t.priority == priority]
+        changes = self.manager.get_changes_since(self.sync_cursor, self._current_filters())
+        if changes.columns_changed:
+            # Column set or settings changed - rebuild the column widgets
+            self._clear_board()
+            self._load_board()
+            return
 
-        # Search filter
-        search_text = self.search_input.text().strip().lower()
-        if search_text:
-            filtered = [
-                t
-                for t in filtered
-                if search_text in t.title.lower() 
-                or (t.description and search_text in t.description.lower())
-                or search_text in t.task_number.lower()
-            ]
+        filters = self._current_filters()
+        self._apply_board_changes(
+            changes, lambda: self.manager.get_column_task_counts(filters), self.manager.get_blocked_tasks
+        )
 
-        return filtered
+    def _apply_board_changes(self, changes: BoardChanges, column_counts, blocked_tasks) -> None:
+        """
+        Patch the rendered board with changed and removed cards.
+
+        Args:
+            changes: BoardChanges from the database or the local replica
+            column_counts: Called for fresh per-column totals when paged columns changed
+            blocked_tasks: Called for the current task_id -> blockers map
+        """
+        self.sync_cursor = changes.cursor
+        if changes.is_empty:
+            return
+
+        # Paged columns only take tasks that sort inside the part already loaded
+        partially_loaded = {
+            column_id: (tasks[-1].position, tasks[-1].id)
+            for column_id, tasks in self.column_tasks.items()
+            if tasks and len(tasks) < self.column_totals.get(column_id, 0)
+        }
+
+        # Drop stale copies of changed/removed tasks, then insert the fresh ones
+        stale_ids = set(changes.removed_task_ids) | {task.id for task in changes.tasks}
+        touched_columns = set()
+        for column_id, tasks in self.column_tasks.items():
+            kept = [task for task in tasks if task.id not in stale_ids]
+            if len(kept) != len(tasks):
+                self.column_tasks[column_id] = kept
+                touched_columns.add(column_id)
+
+        for task in changes.tasks:
+            last_loaded = partially_loaded.get(task.column_id)
+            if last_loaded is None or (task.position, task.id) <= last_loaded:
+                self.column_tasks.setdefault(task.column_id, []).append(task)
+            touched_columns.add(task.column_id)
+
+        if self.column_totals and touched_columns:
+            counts = column_counts()
+            self.column_totals = {column.id: counts.get(column.id, 0) for column in self.columns}
+
+        # Finishing a task can unblock cards in other columns: one query for the whole board
+        blocked_by = blocked_tasks()
+        if blocked_by != self.blocked_by:
+            flipped = {
+                task_id
+                for task_id in set(blocked_by) | set(self.blocked_by)
+                if blocked_by.get(task_id) != self.blocked_by.get(task_id)
+            }
+            self.blocked_by = blocked_by
+            for column_id, tasks in self.column_tasks.items():
+                if any(task.id in flipped for task in tasks):
+                    touched_columns.add(column_id)
+
+        # Only re-render the columns that actually changed
+        for column in self.columns:
+            if column.id in touched_columns:
+                tasks = self.column_tasks[column.id]
+                tasks.sort(key=lambda t: (t.position, t.id))
+                self._render_column(column, tasks)
+
+    def _render_column(self, column, tasks: list) -> None:
+        """Render one column's (already filtered) tasks with pagination."""
+        # Get column's tasks container
+        column_widget = self.column_widgets.get(column.id)
+        if not column_widget:
+            return
+
+        tasks_container = column_widget.findChild(QtWidgets.QWidget, f"tasks_container_{column.id}")
+        if not tasks_container:
+            return
+
+        # Clear existing tasks
+        layout = tasks_container.layout()
+        while layout.count() > 1:  # Keep the stretch at the end
+            item = layout.takeAt(0)
+            if item.widget():
+                if isinstance(item.widget(), DraggableTaskCard):
+                    self.task_cards.pop(item.widget().task_id, None)
+                item.widget().deleteLater()
+
+        # Only loaded pages are in `tasks`; the total comes from the server-side count
+        loaded_tasks = len(tasks)
+        total_tasks = max(self.column_totals.get(column.id, loaded_tasks), loaded_tasks)
+        has_more = total_tasks > loaded_tasks
+
+        # Determine view mode based on task count
+        view_mode = self._get_view_mode_for_column(column.id, total_tasks)
+
+        # Add task cards
+        if tasks:
+            for task in tasks:
+                task_card = self._create_task_card(task, view_mode=view_mode, column_task_count=total_tasks)
+                layout.insertWidget(layout.count() - 1, task_card)
+        elif total_tasks == 0:
+            # Show empty state if no tasks
+            empty_label = QtWidgets.QLabel("No tasks")
+            empty_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+            empty_label.setStyleSheet(f"color: {TEXT_MUTED}; padding: 20px; font-size: 11px;")
+            layout.insertWidget(layout.count() - 1, empty_label)
+
+        # Add pagination controls if needed
+        if has_more:
+            pagination_widget = self._create_pagination_controls(column.id, loaded_tasks, total_tasks)
+            layout.insertWidget(layout.count() - 1, pagination_widget)
+
+        # Update task count
+        count_badge = column_widget.findChild(QtWidgets.QLabel, f"count_badge_{column.id}")
+        if count_badge:
+            if has_more:
+                count_badge.setText(f"{loaded_tasks}/{total_tasks}")
+            else:
+                count_badge.setText(str(total_tasks))
+
+        # WIP limit warning (reset when a patch brings the column back under the limit)
+        wip_label = column_widget.findChild(QtWidgets.QLabel, f"wip_label_{column.id}")
+        if column.wip_limit and wip_label:
+            if total_tasks > column.wip_limit:
+                wip_label.setStyleSheet(
+                    f"font-size: 10px; color: {WARNING}; font-weight: 700; border: none; padding: 2px 0;"
+                )
+                wip_label.setText(f"⚠️ WIP Limit Exceeded: {total_tasks}/{column.wip_limit}")
+            else:
+                wip_label.setStyleSheet(
+                    f"font-size: 10px; color: {TEXT_MUTED}; font-weight: 600; border: none; padding: 2px 0;"
+                )
+                wip_label.setText(f"WIP Limit: {column.wip_limit}")
 
     def _create_task_card(self, task, view_mode: str = 'detailed', column_task_count: int = 0) -> QtWidgets.QWidget:
         """Create a task card widget with specified view mode."""
-        card = DraggableTaskCard(task)
+        card = DraggableTaskCard(
+            task,
+            selected=task.id in self.selected_task_ids,
+            selection_provider=lambda: sorted(self.selected_task_ids),
+        )
         card.clicked.connect(self._show_task_detail)
+        card.selection_toggled.connect(self._toggle_task_selection)
+        self.task_cards[task.id] = card
 
         # Choose layout based on view mode
         if view_mode == 'mini':
@@ -2057,9 +2252,9 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         title.setStyleSheet(f"color: {TEXT_PRIMARY}; font-size: 13px; font-weight: 600; border: none;")
         layout.addWidget(title)
 
-        # Task description preview (if available)
-        if task.description and task.description.strip():
-            description_text = task.description.strip()
+        # Task description preview (if available; cards carry the first CARD_DESCRIPTION_CHARS)
+        if task.description_preview and task.description_preview.strip():
+            description_text = task.description_preview.strip()
             # Truncate to 80 characters for preview
             if len(description_text) > 80:
                 description_preview = description_text[:80] + "..."
@@ -2071,7 +2266,7 @@ class KanbanBoardWidget(QtWidgets.QWidget):
             description_label.setStyleSheet(
                 f"color: {TEXT_MUTED}; font-size: 11px; border: none; padding-top: 4px; line-height: 1.4;"
             )
-            # Set tooltip with full description
+            # Tooltip with the longer preview (full text is in the detail dialog)
             description_label.setToolTip(description_text)
             layout.addWidget(description_label)
 
@@ -2079,13 +2274,16 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         meta = QtWidgets.QHBoxLayout()
 
         # Status badge (show for special statuses)
-        if task.status == "blocked":
+        blockers = self.blocked_by.get(task.id)
+        if task.status == "blocked" or blockers:
             status_badge = QtWidgets.QLabel("🚫 BLOCKED")
             status_badge.setStyleSheet(
                 "color: #EF4444; font-size: 9px; font-weight: 700; "
                 "background: rgba(239, 68, 68, 0.15); padding: 2px 4px; "
                 "border-radius: 3px; border: none;"
             )
+            if blockers:
+                status_badge.setToolTip(self._blocked_tooltip(blockers))
             meta.addWidget(status_badge)
         elif task.status == "archived":
             status_badge = QtWidgets.QLabel("📦 ARCHIVED")
@@ -2106,32 +2304,29 @@ class KanbanBoardWidget(QtWidgets.QWidget):
 
         # Show assignee (user or group)
         try:
-            if task.assigned_group:
+            if task.group_name:
                 # Task assigned to group
-                group = task.assigned_group
-                group_label = QtWidgets.QLabel(f"👥 {group.name} ({group.member_count})")
+                color = task.group_color or "#60A5FA"
+                group_label = QtWidgets.QLabel(f"👥 {task.group_name} ({task.group_member_count})")
                 group_label.setStyleSheet(
                     f"color: {TEXT_MUTED}; font-size: 10px; border: none; "
-                    f"background: rgba({int(group.color[1:3], 16)}, {int(group.color[3:5], 16)}, {int(group.color[5:7], 16)}, 0.2); "
+                    f"background: rgba({int(color[1:3], 16)}, {int(color[3:5], 16)}, {int(color[5:7], 16)}, 0.2); "
                     f"padding: 2px 4px; border-radius: 3px;"
                 )
                 
-                # Add tooltip showing group members
-                if self.manager:
-                    try:
-                        members = self.manager.get_group_members(group.id)
-                        member_names = [m.display_name for m in members[:5]]  # Show first 5 members
-                        if len(members) > 5:
-                            member_names.append(f"... and {len(members) - 5} more")
-                        tooltip = f"Group: {group.name}\n\nMembers:\n" + "\n".join([f"• {name}" for name in member_names])
-                        group_label.setToolTip(tooltip)
-                    except:
-                        pass
+                # Add tooltip showing group members (preloaded with the board snapshot)
+                members = self.group_member_names.get(task.assigned_group_id, [])
+                if members:
+                    member_names = members[:5]  # Show first 5 members
+                    if len(members) > 5:
+                        member_names = member_names + [f"... and {len(members) - 5} more"]
+                    tooltip = f"Group: {task.group_name}\n\nMembers:\n" + "\n".join([f"• {name}" for name in member_names])
+                    group_label.setToolTip(tooltip)
                 
                 meta.addWidget(group_label)
-            elif task.assignee:
+            elif task.assignee_name:
                 # Task assigned to individual user
-                assignee_label = QtWidgets.QLabel(f"👤 {task.assignee.display_name}")
+                assignee_label = QtWidgets.QLabel(f"👤 {task.assignee_name}")
                 assignee_label.setStyleSheet(f"color: {TEXT_MUTED}; font-size: 10px; border: none;")
                 meta.addWidget(assignee_label)
         except Exception as e:
@@ -2196,6 +2391,7 @@ class KanbanBoardWidget(QtWidgets.QWidget):
             """
         )
         header.addWidget(priority_badge)
+        self._add_blocked_marker(header, task, font_size=8)
         header.addStretch()
 
         layout.addLayout(header)
@@ -2212,12 +2408,12 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         meta.setSpacing(4)
 
         # Assignee/Group (compact)
-        if task.assigned_group:
-            group_label = QtWidgets.QLabel(f"👥 {task.assigned_group.name[:10]}")
+        if task.group_name:
+            group_label = QtWidgets.QLabel(f"👥 {task.group_name[:10]}")
             group_label.setStyleSheet(f"color: {TEXT_MUTED}; font-size: 8px; border: none;")
             meta.addWidget(group_label)
-        elif task.assignee:
-            assignee_name = task.assignee.display_name.split()[0]  # First name only
+        elif task.assignee_name:
+            assignee_name = task.assignee_name.split()[0]  # First name only
             assignee_label = QtWidgets.QLabel(f"👤 {assignee_name}")
             assignee_label.setStyleSheet(f"color: {TEXT_MUTED}; font-size: 8px; border: none;")
             meta.addWidget(assignee_label)
@@ -2240,6 +2436,24 @@ class KanbanBoardWidget(QtWidgets.QWidget):
 
         return card
 
+    def _add_blocked_marker(self, header: QtWidgets.QHBoxLayout, task, font_size: int) -> None:
+        """Small blocked icon for the compact and mini card headers."""
+        blockers = self.blocked_by.get(task.id)
+        if task.status != "blocked" and not blockers:
+            return
+        marker = QtWidgets.QLabel("🚫")
+        marker.setStyleSheet(f"color: #EF4444; font-size: {font_size}px; border: none;")
+        marker.setToolTip(self._blocked_tooltip(blockers) if blockers else "Blocked")
+        header.addWidget(marker)
+
+    @staticmethod
+    def _blocked_tooltip(blockers: list) -> str:
+        """Tooltip listing the open tasks a card waits on."""
+        shown = blockers[:5]
+        if len(blockers) > 5:
+            shown = shown + [f"... and {len(blockers) - 5} more"]
+        return "Blocked by:\n" + "\n".join(f"• {task_number}" for task_number in shown)
+
     def _create_mini_card_layout(self, card: DraggableTaskCard, task) -> QtWidgets.QWidget:
         """Create mini card layout (for >50 tasks) - fits in 240-320px column."""
         # Use vertical layout for better fit in narrow columns
@@ -2265,6 +2479,7 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         priority_dot = QtWidgets.QLabel("●")
         priority_dot.setStyleSheet(f"color: {priority_colors.get(task.priority, '#3B82F6')}; font-size: 10px; border: none;")
         header.addWidget(priority_dot)
+        self._add_blocked_marker(header, task, font_size=7)
         header.addStretch()
         
         layout.addLayout(header)
@@ -2277,12 +2492,12 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         layout.addWidget(title)
 
         # Row 3: Quick info (if available)
-        if task.deadline or task.assignee:
+        if task.deadline or task.assignee_name:
             meta = QtWidgets.QHBoxLayout()
             meta.setSpacing(3)
             
-            if task.assignee:
-                assignee_name = task.assignee.display_name.split()[0][:6]  # First name, max 6 chars
+            if task.assignee_name:
+                assignee_name = task.assignee_name.split()[0][:6]  # First name, max 6 chars
                 assignee_label = QtWidgets.QLabel(f"👤{assignee_name}")
                 assignee_label.setStyleSheet(f"color: {TEXT_MUTED}; font-size: 7px; border: none;")
                 meta.addWidget(assignee_label)
@@ -2300,44 +2515,36 @@ class KanbanBoardWidget(QtWidgets.QWidget):
 
         return card
 
-    def _on_task_dropped(self, task_id: int, column_id: int) -> None:
-        """Handle task drop on column."""
+    def _on_task_dropped(self, task_id: int, column_id: int, before_task_id: int = 0) -> None:
+        """Handle task drop on column (before_task_id: card dropped in front of, 0 = end)."""
         if not self.manager:
             return
             
         try:
-            print(f"[DragDrop] Drop detected for task {task_id} -> column {column_id}")
-            # Check if task exists and get its current column
-            task = self.manager.get_task(task_id)
-            if not task:
-                print(f"[DragDrop] Task {task_id} not found during drop")
-                return
-            
-            old_column_id = task.column_id
-            print(f"[DragDrop] Task {task_id} currently in column {old_column_id}")
+            print(f"[DragDrop] Drop detected for task {task_id} -> column {column_id} before {before_task_id or 'end'}")
+            # Which column is the card in now? (from the rendered board, no query)
+            old_column_id = next(
+                (cid for cid, tasks in self.column_tasks.items() if any(t.id == task_id for t in tasks)),
+                None,
+            )
             
-            # Check if already in this column
+            if self.board_from_replica:
+                # Offline-first: move the card in the replica now, the sync thread replays it
+                print(f"[DragDrop] Queueing move of task {task_id} -> column {column_id}")
+                self.replica_worker.queue_move(task_id, column_id, before_task_id or None)
+                self._on_replica_synced(ReplicaSyncResult(task_ids={task_id}))
+                return
+
             if old_column_id == column_id:
-                print(f"[DragDrop] Task {task_id} already in column {column_id}, ignoring drop")
-                return  # No need to move
-            
-            # Don't hold onto the task object - it will be detached after this
-            del task
-            
-            # Move task to new column (use column_id directly)
-            print(f"[DragDrop] Moving task {task_id} to column {column_id}")
-            self.manager.move_task(task_id, column_id)
-            
-            # Verify new column value
-            updated_task = self.manager.get_task(task_id)
-            if updated_task:
-                print(f"[DragDrop] Task {task_id} reported column {updated_task.column_id} after move")
+                # Same column: just a new spot, single-row position update
+                print(f"[DragDrop] Reordering task {task_id} within column {column_id}")
+                self.manager.reorder_task(task_id, before_task_id or None)
             else:
-                print(f"[DragDrop] Task {task_id} could not be reloaded after move")
+                print(f"[DragDrop] Moving task {task_id} to column {column_id}")
+                self.manager.move_task(task_id, column_id, before_task_id=before_task_id or None)
             
-            # Refresh board - this will get fresh task objects with proper sessions
-            print(f"[DragDrop] Refreshing tasks after move")
-            self._refresh_tasks()
+            # Patch only the touched columns
+            self._sync_board_changes()
             
         except Exception as e:
             import traceback
@@ -2349,71 +2556,199 @@ class KanbanBoardWidget(QtWidgets.QWidget):
                 f"Failed to move task: {str(e)}"
             )
 
-    def _refresh_filters(self) -> None:
+    def _toggle_task_selection(self, task_id: int) -> None:
+        """Add or remove a card from the multi-selection (Ctrl+click)."""
+        if task_id in self.selected_task_ids:
+            self.selected_task_ids.discard(task_id)
+        else:
+            self.selected_task_ids.add(task_id)
+        card = self.task_cards.get(task_id)
+        if card is not None:
+            try:
+                card.set_selected(task_id in self.selected_task_ids)
+            except RuntimeError:
+                # Card was deleted by a re-render
+                self.task_cards.pop(task_id, None)
+        self._update_selection_button()
+
+    def _clear_task_selection(self) -> None:
+        """Clear the multi-selection and its card highlights."""
+        for task_id in list(self.selected_task_ids):
+            card = self.task_cards.get(task_id)
+            if card is not None:
+                try:
+                    card.set_selected(False)
+                except RuntimeError:
+                    self.task_cards.pop(task_id, None)
+        self.selected_task_ids.clear()
+        self._update_selection_button()
+
+    def _update_selection_button(self) -> None:
+        count = len(self.selected_task_ids)
+        self.selection_button.setText(f"☑ {count} selected")
+        self.selection_button.setVisible(count > 0)
+
+    def _populate_selection_menu(self) -> None:
+        """Build the bulk action menu for the current selection."""
+        self.selection_menu.clear()
+
+        move_menu = self.selection_menu.addMenu("Move to")
+        for column in self.columns:
+            move_menu.addAction(
+                column.name, lambda column_id=column.id: self._bulk_move_selected(column_id)
+            )
+
+        priority_menu = self.selection_menu.addMenu("Set priority")
+        for priority in ["critical", "high", "medium", "low"]:
+            priority_menu.addAction(
+                priority.capitalize(),
+                lambda priority=priority: self._bulk_update_selected(priority=priority),
+            )
+
+        assign_menu = self.selection_menu.addMenu("Assign to")
+        assign_menu.addAction(UNASSIGNED_LABEL, lambda: self._bulk_update_selected(assigned_to=None))
+        for index in range(1, self.assignee_filter.count()):  # Skip "All Users"
+            user_id = self.assignee_filter.itemData(index)
+            assign_menu.addAction(
+                self.assignee_filter.itemText(index),
+                lambda user_id=user_id: self._bulk_update_selected(assigned_to=user_id),
+            )
+
+        self.selection_menu.addSeparator()
+        self.selection_menu.addAction("🗑 Delete selected", self._bulk_delete_selected)
+        self.selection_menu.addAction("Clear selection", self._clear_task_selection)
+
+    def _run_bulk_action(self, action, description: str) -> None:
+        """Run a bulk manager call on the selection, then clear it and sync the board."""
+        if not self.manager or not self.selected_task_ids:
+            return
+        task_ids = sorted(self.selected_task_ids)
+        try:
+            count = action(task_ids)
+            print(f"[Bulk] {description}: {count} of {len(task_ids)} tasks")
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to {description.lower()}: {str(e)}")
+            return
+        self._clear_task_selection()
+        self._sync_board_changes()
+
+    def _bulk_move_selected(self, column_id: int) -> None:
+        self._run_bulk_action(
+            lambda task_ids: self.manager.bulk_move_tasks(task_ids, column_id), "Move tasks"
+        )
+
+    def _bulk_update_selected(self, **updates) -> None:
+        self._run_bulk_action(
+            lambda task_ids: self.manager.bulk_update_tasks(task_ids, **updates), "Update tasks"
+        )
+
+    def _bulk_delete_selected(self) -> None:
+        count = len(self.selected_task_ids)
+        reply = QtWidgets.QMessageBox.question(
+            self,
+            "Delete Tasks",
+            f"Delete {count} selected task(s)?",
+            QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No,
+        )
+        if reply != QtWidgets.QMessageBox.StandardButton.Yes:
+            return
+        self._run_bulk_action(self.manager.bulk_delete_tasks, "Delete tasks")
+
+    def _on_tasks_dropped(self, task_ids: list, column_id: int) -> None:
+        """Handle a multi-card drop: move the whole selection in one transaction."""
+        self._run_bulk_action(
+            lambda _selected: self.manager.bulk_move_tasks(task_ids, column_id), "Move tasks"
+        )
+
+    def _populate_filter_dropdowns(self, snapshot: BoardSnapshot, keep_selection: bool = True) -> bool:
+        """
+        Fill the assignee and group dropdowns from a board snapshot.
+
+        Signals are blocked while repopulating so each addItem does not
+        trigger a board refresh. Returns True if a previous selection no
+        longer exists and was reset to "All".
+        """
+        current_user = self.assignee_filter.currentData() if keep_selection else None
+        current_group = self.group_filter.currentData() if keep_selection else None
+        selection_reset = False
+
+        self.assignee_filter.blockSignals(True)
+        self.group_filter.blockSignals(True)
+        try:
+            # Refresh user filter
+            self.assignee_filter.clear()
+            self.assignee_filter.addItem("👤 All Users", None)
+            for user in snapshot.users:
+                self.assignee_filter.addItem(f"👤 {user.display_name}", user.id)
+
+            # Restore user selection if still valid
+            if current_user is not None:
+                index = self.assignee_filter.findData(current_user)
+                if index >= 0:
+                    self.assignee_filter.setCurrentIndex(index)
+                else:
+                    selection_reset = True
+
+            # Refresh group filter
+            self.group_filter.clear()
+            self.group_filter.addItem("👥 All Groups", None)
+            for group in snapshot.groups:
+                self.group_filter.addItem(f"👥 {group.name}", group.id)
+
+            # Restore group selection if still valid
+            if current_group is not None:
+                index = self.group_filter.findData(current_group)
+                if index >= 0:
+                    self.group_filter.setCurrentIndex(index)
+                else:
+                    selection_reset = True
+        finally:
+            self.assignee_filter.blockSignals(False)
+            self.group_filter.blockSignals(False)
+
+        return selection_reset
+
+    def _refresh_filters(self, snapshot: Optional[BoardSnapshot] = None) -> bool:
         """Refresh filter dropdowns (users and groups)."""
         if not self.manager:
-            return
-        
-        # Save current selections
-        current_user = self.assignee_filter.currentData()
-        current_group = self.group_filter.currentData()
-        current_priority = self.priority_filter.currentData()
-        
-        # Refresh user filter
-        users = self.manager.get_all_users()
-        self.assignee_filter.clear()
-        self.assignee_filter.addItem("👤 All Users", None)
-        for user in users:
-            self.assignee_filter.addItem(f"👤 {user.display_name}", user.id)
-        
-        # Restore user selection if still valid
-        if current_user is not None:
-            index = self.assignee_filter.findData(current_user)
-            if index >= 0:
-                self.assignee_filter.setCurrentIndex(index)
-        
-        # Refresh group filter
-        groups = self.manager.get_all_groups()
-        self.group_filter.clear()
-        self.group_filter.addItem("👥 All Groups", None)
-        for group in groups:
-            self.group_filter.addItem(f"👥 {group.name}", group.id)
-        
-        # Restore group selection if still valid
-        if current_group is not None:
-            index = self.group_filter.findData(current_group)
-            if index >= 0:
-                self.group_filter.setCurrentIndex(index)
+            return False
+
+        if snapshot is None:
+            snapshot = self._fetch_board_snapshot()
+        return self._populate_filter_dropdowns(snapshot)
+
+    def _reload_board_data(self) -> None:
+        """Refresh filters and tasks from a single board snapshot."""
+        snapshot = self._fetch_board_snapshot()
+        if self._refresh_filters(snapshot):
+            # A selected user/group disappeared - re-query with the reset filters
+            snapshot = None
+        self._refresh_tasks(snapshot)
 
     def _refresh_board(self) -> None:
         """Refresh the entire board."""
         if not self._ensure_authenticated():
             return
-        self._refresh_filters()
-        self._refresh_tasks()
+        self._reload_board_data()
         if self.auth_result:
             update_last_activity(self.auth_result.session.session_token, db_manager=self.db)
         QtWidgets.QMessageBox.information(self, "Board Refreshed", "The Kanban board has been refreshed successfully.")
 
     def _on_search_changed(self) -> None:
-        """Handle search text changes."""
+        """Handle search text changes (debounced so typing doesn't query per keystroke)."""
+        self.search_timer.start()
+
+    def _run_search(self) -> None:
+        """Run the board search in the database (full-text index) and update the counter."""
+        if not self.manager:
+            return
+
         search_text = self.search_input.text().strip()
         self._refresh_tasks()
         
         # Update search results counter
         if search_text:
-            # Count visible tasks across all columns
-            total_visible = 0
-            for column_id, column_widget in self.column_widgets.items():
-                tasks_container = column_widget.findChild(QtWidgets.QWidget, f"tasks_container_{column_id}")
-                if tasks_container:
-                    # Count task card widgets (exclude headers, spacers)
-                    layout = tasks_container.layout()
-                    for i in range(layout.count() - 1):  # Exclude stretch
-                        item = layout.itemAt(i)
-                        if item and item.widget() and isinstance(item.widget(), DraggableTaskCard):
-                            total_visible += 1
-            
+            total_visible = sum(len(tasks) for tasks in self.column_tasks.values())
             self.search_results_label.setText(f"✓ {total_visible} found")
             self.search_results_label.setVisible(True)
         else:
@@ -2421,24 +2756,13 @@ class KanbanBoardWidget(QtWidgets.QWidget):
 
     def _on_filter_changed(self) -> None:
         """Handle filter changes."""
-        # Reset pagination when filters change
-        self.column_page_sizes = {}
+        # A new snapshot also resets pagination
         self._refresh_tasks()
 
-    def _should_use_pagination(self, tasks: list) -> bool:
-        """Determine if pagination should be used for this task list."""
-        # If filters/search active, disable pagination (show all results)
-        if self.search_input.text().strip():
-            return False
-        if self.assignee_filter.currentData() is not None:
-            return False
-        if self.priority_filter.currentData() is not None:
-            return False
-        if self.group_filter.currentData() is not None:
-            return False
-        
-        # Only paginate if >30 tasks and no filters
-        return len(tasks) > 30
+    @staticmethod
+    def _filters_active(filters: dict) -> bool:
+        """Whether any filter/search is set (filtered boards show all results, unpaged)."""
+        return any(value not in (None, "") for value in filters.values())
 
     def _get_view_mode_for_column(self, column_id: int, task_count: int) -> str:
         """Determine view mode based on task count."""
@@ -2507,16 +2831,39 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         
         return container
 
-    def _load_more_tasks(self, column_id: int) -> None:
-        """Load 20 more tasks for a column."""
-        current_size = self.column_page_sizes.get(column_id, self.TASKS_PER_PAGE)
-        self.column_page_sizes[column_id] = current_size + self.TASKS_PER_PAGE
-        self._refresh_tasks()
+    def _load_more_tasks(self, column_id: int, limit: Optional[int] = None) -> None:
+        """Fetch the next page (default TASKS_PER_PAGE tasks) of a column and append it."""
+        if not self.manager:
+            return
+        if limit is None:
+            limit = self.TASKS_PER_PAGE
+
+        loaded = self.column_tasks.setdefault(column_id, [])
+        after = (loaded[-1].position, loaded[-1].id) if loaded else None
+        try:
+            if self.board_from_replica:
+                page = self.replica.tasks_by_column_page(
+                    column_id, after=after, limit=limit, filters=self._current_filters()
+                )
+            else:
+                page = self.manager.get_tasks_by_column_page(
+                    column_id, after=after, limit=limit, filters=self._current_filters()
+                )
+        except Exception as e:
+            self._show_error(f"Failed to load more tasks: {e}")
+            return
+
+        loaded.extend(page.tasks)
+        if not page.has_more:
+            self.column_totals[column_id] = len(loaded)
+
+        column = next((c for c in self.columns if c.id == column_id), None)
+        if column is not None:
+            self._render_column(column, loaded)
 
     def _load_all_tasks(self, column_id: int) -> None:
-        """Load all tasks for a column."""
-        self.column_page_sizes[column_id] = 999999  # Large number to show all
-        self._refresh_tasks()
+        """Fetch all remaining tasks for a column."""
+        self._load_more_tasks(column_id, limit=0)
 
     def _create_new_task(self) -> None:
         """Open dialog to create a new task."""
@@ -2533,8 +2880,7 @@ class KanbanBoardWidget(QtWidgets.QWidget):
         dialog = GroupManagementDialog(self.manager, parent=self)
         dialog.exec()
         # Refresh board in case group assignments changed
-        self._refresh_filters()
-        self._refresh_tasks()
+        self._reload_board_data()
 
     def _show_task_detail(self, task_id: int) -> None:
         """Open task detail dialog."""
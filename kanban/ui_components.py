@@ -275,6 +275,11 @@ class TaskDetailDialog(QtWidgets.QDialog):
         self.task_id = task_id
         self.manager = manager
         self.task = None
+        # Activity tab state (loaded on first show, then page by page on scroll)
+        self.activity_loaded = False
+        self.activity_loading = False
+        self.activity_before_id: Optional[int] = None
+        self.activity_has_more = False
 
         self.setWindowTitle("Task Details")
         self.setMinimumWidth(800)
@@ -329,7 +334,8 @@ class TaskDetailDialog(QtWidgets.QDialog):
         tabs = QtWidgets.QTabWidget()
         tabs.addTab(self._create_details_tab(), "📝 Details")
         tabs.addTab(self._create_comments_tab(), "💬 Comments")
-        tabs.addTab(self._create_activity_tab(), "📊 Activity")
+        self.activity_tab_index = tabs.addTab(self._create_activity_tab(), "📊 Activity")
+        tabs.currentChanged.connect(self._on_tab_changed)
 
         layout.addWidget(tabs, 1)
 
@@ -571,73 +577,88 @@ class TaskDetailDialog(QtWidgets.QDialog):
         return tab
 
     def _create_activity_tab(self) -> QtWidgets.QWidget:
-        """Create the activity/history tab."""
+        """Create the activity/history tab (filled when first shown)."""
         tab = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout(tab)
         layout.setContentsMargins(12, 12, 12, 12)
 
         # Activity list
-        scroll = QtWidgets.QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.activity_scroll = QtWidgets.QScrollArea()
+        self.activity_scroll.setWidgetResizable(True)
+        self.activity_scroll.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.activity_scroll.verticalScrollBar().valueChanged.connect(self._on_activity_scrolled)
 
         activity_container = QtWidgets.QWidget()
         self.activity_layout = QtWidgets.QVBoxLayout(activity_container)
         self.activity_layout.setSpacing(8)
         self.activity_layout.addStretch()
 
-        scroll.setWidget(activity_container)
-        layout.addWidget(scroll)
-
-        # Load activity log
-        self._load_activity_log()
+        self.activity_scroll.setWidget(activity_container)
+        layout.addWidget(self.activity_scroll)
 
         return tab
 
+    def _on_tab_changed(self, index: int) -> None:
+        """Load the first activity page the first time the Activity tab is shown."""
+        if index == self.activity_tab_index and not self.activity_loaded:
+            self._load_activity_log()
+
+    def _on_activity_scrolled(self, value: int) -> None:
+        """Fetch the next (older) page when the list is scrolled near the bottom."""
+        scrollbar = self.activity_scroll.verticalScrollBar()
+        if value >= scrollbar.maximum() - 40:
+            self._load_more_activity()
+
     def _load_activity_log(self) -> None:
-        """Load and display activity log from database."""
-        try:
-            # Get activity log for this task
-            session = self.manager.db.get_session()
-            from kanban.models import KanbanActivityLog, KanbanUser
-            from datetime import datetime
-
-            activities = (
-                session.query(KanbanActivityLog, KanbanUser)
-                .outerjoin(KanbanUser, KanbanActivityLog.user_id == KanbanUser.id)
-                .filter(KanbanActivityLog.task_id == self.task_id)
-                .order_by(KanbanActivityLog.id.desc())
-                .all()
-            )
-            
-            print(f"[ActivityLog] Loaded {len(activities)} activities for task {self.task_id}")
-            for activity_log, user in activities:
-                print(f"[ActivityLog]   - ID:{activity_log.id} Type:{activity_log.activity_type} Field:{activity_log.field_name} Old:{activity_log.old_value} New:{activity_log.new_value}")
+        """(Re)load the activity history from the newest page."""
+        # Clear existing
+        while self.activity_layout.count() > 1:
+            item = self.activity_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
 
-            # Clear existing
-            while self.activity_layout.count() > 1:
-                item = self.activity_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
+        self.activity_loaded = True
+        self.activity_before_id = None
+        self.activity_has_more = True
+        self._load_more_activity()
+
+    def _load_more_activity(self) -> None:
+        """Append the next page of activity (one keyset query)."""
+        if self.activity_loading or not self.activity_has_more:
+            return
+        self.activity_loading = True
+        try:
+            page = self.manager.get_task_activity(self.task_id, before_id=self.activity_before_id)
 
-            if not activities:
+            if not page.activities and self.activity_before_id is None:
                 no_activity = QtWidgets.QLabel("No activity recorded yet.")
                 no_activity.setStyleSheet("color: #94A3B8; font-style: italic; padding: 20px;")
                 no_activity.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
                 self.activity_layout.insertWidget(0, no_activity)
-                return
 
-            # Add activity items
-            for activity_log, user in activities:
-                activity_widget = self._create_activity_item(activity_log, user)
+            # Add activity items above the stretch
+            for activity_log in page.activities:
+                activity_widget = self._create_activity_item(activity_log, activity_log.user)
                 self.activity_layout.insertWidget(self.activity_layout.count() - 1, activity_widget)
 
-            session.close()
+            self.activity_has_more = page.has_more
+            self.activity_before_id = page.next_before_id
 
         except Exception as e:
+            self.activity_has_more = False
             print(f"Error loading activity log: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            self.activity_loading = False
+
+        if self.activity_has_more:
+            # A page that doesn't fill the viewport can't be scrolled: keep going
+            QtCore.QTimer.singleShot(0, self._fill_activity_viewport)
+
+    def _fill_activity_viewport(self) -> None:
+        if self.activity_scroll.verticalScrollBar().maximum() == 0:
+            self._load_more_activity()
 
     def _create_activity_item(self, activity: "KanbanActivityLog", user: Optional["KanbanUser"]) -> QtWidgets.QWidget:
         """Create a single activity item widget."""
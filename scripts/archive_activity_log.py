@@ -0,0 +1,178 @@
+"""Maintain the monthly kanban_activity_log partitions.
+
+Creates partitions for the coming months and archives old ones: partitions
+older than --keep-months are detached, exported to gzip-compressed CSV files
+and dropped. Before that, each task's first task_snapshot inside the kept
+months is rewritten as a full checkpoint (kanban/archive.py), so the task
+history that stays online does not depend on the dropped rows. Schedule it daily (Windows Task Scheduler or cron), e.g.
+
+    python scripts/archive_activity_log.py --keep-months 12
+
+Archived months can be loaded back with
+    \\copy kanban_activity_log FROM PROGRAM 'gzip -dc <file>' WITH (FORMAT csv, HEADER)
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import re
+import sys
+from datetime import date, datetime
+from pathlib import Path
+from typing import List, Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text  # noqa: E402
+
+from kanban.archive import rebase_task_snapshots  # noqa: E402
+from kanban.database import get_db_manager  # noqa: E402
+
+PARTITION_PATTERN = re.compile(r"^kanban_activity_log_(\d{4})(\d{2})$")
+DEFAULT_ARCHIVE_DIR = Path(__file__).resolve().parent.parent / "archives" / "activity_log"
+
+
+def partition_month(table_name: str) -> Optional[date]:
+    """First day of the month a kanban_activity_log_YYYYMM table covers (None for other tables)."""
+    match = PARTITION_PATTERN.match(table_name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def retention_cutoff(keep_months: int, today: Optional[date] = None) -> date:
+    """First month that is kept; partitions for earlier months are archived."""
+    today = today or date.today()
+    months = today.year * 12 + today.month - 1 - keep_months
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def ensure_partitions(engine, months_ahead: int) -> int:
+    """Create any missing monthly partitions up to months_ahead months ahead."""
+    with engine.begin() as connection:
+        return connection.execute(
+            text("SELECT ensure_activity_log_partitions(:months)"), {"months": months_ahead}
+        ).scalar()
+
+
+def detach_old_partitions(engine, keep_months: int, dry_run: bool = False) -> List[str]:
+    """Detach monthly partitions older than the retention window."""
+    cutoff = retention_cutoff(keep_months)
+    with engine.connect() as connection:
+        attached = connection.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'kanban_activity_log'::regclass ORDER BY c.relname"
+            )
+        ).scalars().all()
+
+    old = [name for name in attached if (partition_month(name) or cutoff) < cutoff]
+    if dry_run or not old:
+        return old
+
+    # DETACH ... CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for name in old:
+            print(f"  Detaching {name}...")
+            connection.execute(text(f'ALTER TABLE kanban_activity_log DETACH PARTITION "{name}" CONCURRENTLY'))
+    return old
+
+
+def detached_partitions(engine) -> List[str]:
+    """Monthly tables that are no longer attached (detached now or by an earlier, interrupted run)."""
+    with engine.connect() as connection:
+        names = connection.execute(
+            text(
+                "SELECT relname FROM pg_class "
+                "WHERE relkind = 'r' AND NOT relispartition "
+                "AND relname ~ '^kanban_activity_log_[0-9]{6}$' ORDER BY relname"
+            )
+        ).scalars().all()
+    return list(names)
+
+
+def export_partition(engine, table_name: str, archive_dir: Path) -> int:
+    """
+    Export a detached partition to <archive_dir>/<table>.csv.gz and drop it.
+
+    The table is only dropped once the file is complete and the exported row
+    count matches the table.
+
+    Returns:
+        Number of rows exported
+    """
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    target = archive_dir / f"{table_name}.csv.gz"
+    partial = target.with_suffix(".gz.partial")
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
+        expected = cursor.fetchone()[0]
+
+        with gzip.open(partial, "wb") as archive:
+            cursor.copy_expert(f'COPY "{table_name}" TO STDOUT WITH (FORMAT csv, HEADER)', archive)
+        if cursor.rowcount not in (-1, expected):
+            raise RuntimeError(f"exported {cursor.rowcount} rows, expected {expected}")
+        partial.replace(target)
+
+        cursor.execute(f'DROP TABLE "{table_name}"')
+        raw.commit()
+        return expected
+    except Exception:
+        raw.rollback()
+        if partial.exists():
+            partial.unlink()
+        raise
+    finally:
+        raw.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Create future activity log partitions and archive old months.")
+    parser.add_argument("--keep-months", type=int, default=12, help="Months of history to keep online (default 12)")
+    parser.add_argument("--months-ahead", type=int, default=3, help="Future monthly partitions to create (default 3)")
+    parser.add_argument("--archive-dir", type=Path, default=DEFAULT_ARCHIVE_DIR, help="Where to write .csv.gz files")
+    parser.add_argument("--dry-run", action="store_true", help="Only list the partitions that would be archived")
+    args = parser.parse_args(argv)
+
+    print("=" * 60)
+    print("Kanban Activity Log Maintenance")
+    print("=" * 60)
+
+    db_manager = get_db_manager()
+    engine = db_manager.engine
+
+    if not args.dry_run:
+        created = ensure_partitions(engine, args.months_ahead)
+        print(f"Partitions created: {created}")
+
+    cutoff = retention_cutoff(args.keep_months)
+    print(f"Archiving months before {cutoff:%Y-%m}")
+    old = detach_old_partitions(engine, args.keep_months, dry_run=True)
+    if args.dry_run:
+        for name in old:
+            print(f"  Would archive {name}")
+        return 0
+    if old:
+        # Kept history must not depend on checkpoints in the partitions about to go
+        rebase_task_snapshots(db_manager, datetime.combine(cutoff, datetime.min.time()))
+        detach_old_partitions(engine, args.keep_months)
+
+    failures = 0
+    for name in detached_partitions(engine):
+        try:
+            rows = export_partition(engine, name, args.archive_dir)
+            print(f"  ✅ {name}: {rows} rows -> {args.archive_dir / (name + '.csv.gz')}")
+        except Exception as e:
+            failures += 1
+            print(f"  ❌ {name}: export failed, table kept ({e})")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Move finished tasks from the hot Kanban tables to the archive tables.
+
+Tasks in Done for more than --completed-days, with status 'archived' for more
+than --archived-days and soft-deleted for more than --deleted-days move to
+kanban_tasks_archive together with their comments, attachment metadata and
+activity (see kanban/archive.py). Afterwards the hot tables are vacuumed so
+their visibility map stays current and board queries can stay index-only.
+Schedule it nightly (Windows Task Scheduler or cron), e.g.
+
+    python scripts/archive_tasks.py --completed-days 90
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text  # noqa: E402
+
+from kanban.archive import ArchivePolicy, archive_due_tasks, count_due_tasks  # noqa: E402
+from kanban.database import get_db_manager  # noqa: E402
+
+HOT_TABLES = ("kanban_tasks", "kanban_comments", "kanban_attachments", "kanban_task_tombstones")
+
+
+def vacuum_hot_tables(engine) -> None:
+    """VACUUM (ANALYZE) the hot tables (needs autocommit: VACUUM cannot run in a transaction)."""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for table_name in HOT_TABLES:
+            print(f"  Vacuuming {table_name}...")
+            connection.execute(text(f"VACUUM (ANALYZE) {table_name}"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    db_manager = get_db_manager()
+    defaults = ArchivePolicy.from_config(db_manager)
+
+    parser = argparse.ArgumentParser(description="Archive long-completed, archived and soft-deleted Kanban tasks.")
+    parser.add_argument("--completed-days", type=int, default=defaults.completed_days,
+                        help=f"Days in Done before archiving (default {defaults.completed_days})")
+    parser.add_argument("--archived-days", type=int, default=defaults.archived_days,
+                        help=f"Days with status 'archived' before archiving (default {defaults.archived_days})")
+    parser.add_argument("--deleted-days", type=int, default=defaults.deleted_days,
+                        help=f"Days soft-deleted before archiving (default {defaults.deleted_days})")
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size,
+                        help=f"Tasks moved per transaction (default {defaults.batch_size})")
+    parser.add_argument("--no-vacuum", action="store_true", help="Skip VACUUM (ANALYZE) of the hot tables")
+    parser.add_argument("--dry-run", action="store_true", help="Only count the tasks that would be archived")
+    args = parser.parse_args(argv)
+
+    policy = ArchivePolicy(
+        completed_days=args.completed_days,
+        archived_days=args.archived_days,
+        deleted_days=args.deleted_days,
+        batch_size=args.batch_size,
+    )
+
+    print("=" * 60)
+    print("Kanban Task Archive")
+    print("=" * 60)
+
+    session = db_manager.get_session()
+    try:
+        due = count_due_tasks(session, policy)
+    finally:
+        session.close()
+    for reason in ("completed", "archived", "deleted"):
+        print(f"  {reason:<10} {due.get(reason, 0)} tasks due")
+
+    if args.dry_run or not sum(due.values()):
+        return 0
+
+    try:
+        archived = archive_due_tasks(db_manager, policy)
+    except Exception as e:
+        print(f"❌ Archiving failed: {e}")
+        return 1
+    print(f"✅ Archived {archived} tasks")
+
+    if archived and not args.no_vacuum:
+        vacuum_hot_tables(db_manager.engine)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+"""Scale benchmarks for KanbanManager against generated datasets.
+
+For every dataset size the script replaces the benchmark rows (tasks with
+category 'benchmark', users bench.user.N, groups bench-group-N) in the
+configured database with a generated dataset, times the main manager
+operations and counts their queries with the query instrumentation
+(DatabaseManager.start_query_instrumentation). Results are written as JSON
+and can be compared with a baseline from an earlier run:
+
+    python scripts/benchmark_kanban.py --sizes 10k,100k --output benchmarks/results.json
+    python scripts/benchmark_kanban.py --sizes 10k,100k --baseline benchmarks/baseline.json
+
+Run it against a local benchmark database only: it refuses non-local hosts
+unless --allow-remote is given. Exit code 1 means a regression was found.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Set UTF-8 encoding for Windows console
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import text  # noqa: E402
+
+from kanban.database import DatabaseManager, get_db_manager, track_operation  # noqa: E402
+from kanban.manager import KanbanManager  # noqa: E402
+from kanban.synthetic_data import (  # noqa: E402
+    LOCAL_HOSTS,
+    SyntheticSpec,
+    analyze_tables,
+    clear_synthetic_tasks,
+    load_synthetic_data,
+    parse_size,
+)
+
+BENCH_CATEGORY = "benchmark"
+BENCH_USER_PREFIX = "bench.user."
+BENCH_GROUP_PREFIX = "bench-group-"
+
+# Hits ~1 in 10 generated titles ("Printer not working on floor N")
+SEARCH_WORD = "printer"
+
+# Median slowdowns below this many milliseconds are treated as noise
+MIN_REGRESSION_MS = 2.0
+
+
+@dataclass
+class DatasetSpec:
+    """Shape of one generated dataset."""
+
+    tasks: int
+    # Poisson means; activity also gets one row per creation, column move and comment
+    comments_per_task: float = 2.0
+    updates_per_task: float = 2.0
+    users: int = 50
+    groups: int = 10
+    seed: int = 42
+
+
+@dataclass
+class Dataset:
+    """Ids the benchmark operations run against."""
+
+    user_ids: List[int]
+    column_ids: List[int]
+    largest_column_id: int
+    sample_task_ids: List[int]
+    counts: Dict[str, int]
+
+
+def ensure_local(db_manager: DatabaseManager, allow_remote: bool) -> None:
+    """Refuse to generate data on anything but a local database unless allowed."""
+    host = db_manager.config["database"]["host"]
+    if host not in LOCAL_HOSTS and not allow_remote:
+        raise SystemExit(f"❌ Refusing to benchmark against {host}; use a local database or pass --allow-remote")
+
+
+def clear_dataset(engine) -> None:
+    """Delete the benchmark tasks and everything hanging off them (users and groups are reused)."""
+    clear_synthetic_tasks(engine, BENCH_CATEGORY, BENCH_USER_PREFIX)
+
+
+def generate_dataset(engine, spec: DatasetSpec) -> Dataset:
+    """Load a dataset with the COPY-based generator (kanban/synthetic_data.py); same spec, same data."""
+    loaded = load_synthetic_data(
+        engine,
+        SyntheticSpec(
+            tasks=spec.tasks,
+            users=spec.users,
+            groups=spec.groups,
+            comments_per_task=spec.comments_per_task,
+            updates_per_task=spec.updates_per_task,
+            seed=spec.seed,
+            category=BENCH_CATEGORY,
+            user_prefix=BENCH_USER_PREFIX,
+            group_prefix=BENCH_GROUP_PREFIX,
+        ),
+    )
+    if not loaded.triggers_skipped:
+        print("  ⚠️  Not allowed to skip triggers; generation was slower")
+    analyze_tables(engine)
+
+    with engine.connect() as connection:
+        columns = connection.execute(
+            text("SELECT id, name FROM kanban_columns WHERE is_active = TRUE ORDER BY position")
+        ).all()
+        open_ids = [column_id for column_id, name in columns if name != "Done"] or loaded.column_ids
+        largest_column_id = connection.execute(
+            text(
+                "SELECT column_id FROM kanban_tasks WHERE is_deleted = FALSE "
+                "GROUP BY column_id ORDER BY count(*) DESC, column_id LIMIT 1"
+            )
+        ).scalar()
+        task_ids = list(connection.execute(
+            text("SELECT id FROM kanban_tasks WHERE category = :category ORDER BY id"), {"category": BENCH_CATEGORY}
+        ).scalars())
+
+    sample = random.Random(spec.seed).sample(task_ids, min(len(task_ids), 100))
+    return Dataset(
+        user_ids=loaded.user_ids,
+        column_ids=open_ids,
+        largest_column_id=largest_column_id,
+        sample_task_ids=sample,
+        counts=loaded.counts,
+    )
+
+
+def benchmark_operations(manager: KanbanManager, dataset: Dataset) -> List[Tuple[str, Callable[[int], Any]]]:
+    """(name, call) pairs; ``call(i)`` runs the i-th iteration."""
+    tasks = dataset.sample_task_ids
+    targets = dataset.column_ids[:2] if len(dataset.column_ids) > 1 else dataset.column_ids * 2
+    since = datetime.now() - timedelta(minutes=5)
+    return [
+        ("get_board_snapshot", lambda i: manager.get_board_snapshot(page_size=30)),
+        ("get_changes_since", lambda i: manager.get_changes_since(since)),
+        ("get_tasks_by_column", lambda i: manager.get_tasks_by_column(dataset.largest_column_id)),
+        ("get_tasks_by_column_page", lambda i: manager.get_tasks_by_column_page(dataset.largest_column_id, limit=20)),
+        ("get_task_statistics", lambda i: manager.get_task_statistics()),
+        ("search_tasks", lambda i: manager.search_tasks(SEARCH_WORD, limit=50)),
+        ("move_task", lambda i: manager.move_task(tasks[i % len(tasks)], targets[i % 2])),
+        ("update_task", lambda i: manager.update_task(tasks[i % len(tasks)], priority=("high", "low")[i % 2])),
+    ]
+
+
+def time_operation(
+    db_manager: DatabaseManager, name: str, call: Callable[[int], Any], repeat: int, warmup: int
+) -> Dict[str, Any]:
+    """Run one operation warmup + repeat times; timings and query counts of the measured runs."""
+    for i in range(warmup):
+        call(i)
+
+    instrumentation = db_manager.query_instrumentation
+    instrumentation.reset()
+    operation = f"benchmark.{name}"
+    timings = []
+    for i in range(warmup, warmup + repeat):
+        started = time.perf_counter()
+        with track_operation(operation):
+            call(i)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    stats = instrumentation.stats()
+    queries = stats["operations"].get(operation, {})
+    timings.sort()
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+        "min_ms": round(timings[0], 3),
+        "max_ms": round(timings[-1], 3),
+        "queries": queries.get("avg_queries"),
+        "max_queries": queries.get("max_queries"),
+        "db_ms": round(queries.get("db_ms", 0) / repeat, 3),
+        "n_plus_one": [entry["statement"] for entry in stats["n_plus_one"] if entry["operation"] == operation],
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Regressions of ``results`` against ``baseline``.
+
+    An operation regresses when its median is more than ``threshold``
+    (fraction) and MIN_REGRESSION_MS slower, when it issues more queries
+    per call, or when it newly triggers the N+1 detector.
+    """
+    regressions = []
+    for size, current in results["sizes"].items():
+        previous = baseline.get("sizes", {}).get(size)
+        if previous is None:
+            continue
+        for name, now in current["operations"].items():
+            before = previous["operations"].get(name)
+            if before is None:
+                continue
+            slower = now["median_ms"] - before["median_ms"]
+            if slower > MIN_REGRESSION_MS and now["median_ms"] > before["median_ms"] * (1 + threshold):
+                regressions.append(
+                    f"{size} tasks / {name}: median {before['median_ms']:.1f} -> {now['median_ms']:.1f} ms"
+                )
+            if (now["queries"] or 0) > (before["queries"] or 0):
+                regressions.append(f"{size} tasks / {name}: queries per call {before['queries']} -> {now['queries']}")
+            if now["n_plus_one"] and not before["n_plus_one"]:
+                regressions.append(f"{size} tasks / {name}: new N+1 pattern {now['n_plus_one'][0][:120]}")
+    return regressions
+
+
+def git_commit() -> Optional[str]:
+    """Current commit of the checkout, if git is available."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark KanbanManager operations against generated datasets.")
+    parser.add_argument("--sizes", default="10k", help="Comma-separated task counts, e.g. 10k,100k,1m (default 10k)")
+    parser.add_argument("--comments-per-task", type=float, default=2.0, help="Mean comments per task (default 2)")
+    parser.add_argument("--updates-per-task", type=float, default=2.0, help="Mean field updates per task (default 2)")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--groups", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5, help="Measured runs per operation (default 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured runs per operation (default 1)")
+    parser.add_argument("--operations", help="Comma-separated subset of operations to run")
+    parser.add_argument("--output", default="benchmarks/results.json", help="Results file (default benchmarks/results.json)")
+    parser.add_argument("--baseline", help="Baseline results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed median slowdown (default 0.2 = 20%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write the results to --baseline")
+    parser.add_argument("--keep-data", action="store_true", help="Leave the last dataset in the database")
+    parser.add_argument("--config", help="Database config file (default: config/kanban_config.json)")
+    parser.add_argument("--allow-remote", action="store_true", help="Allow a non-local database host")
+    args = parser.parse_args(argv)
+
+    db_manager = get_db_manager(args.config)
+    ensure_local(db_manager, args.allow_remote)
+    db_manager.start_query_instrumentation()
+    engine = db_manager.engine
+
+    print("=" * 60)
+    print("Kanban Scale Benchmark")
+    print("=" * 60)
+
+    with engine.connect() as connection:
+        server_version = connection.execute(text("SHOW server_version")).scalar()
+    results: Dict[str, Any] = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "database": {
+            "host": db_manager.config["database"]["host"],
+            "server_version": server_version,
+        },
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "sizes": {},
+    }
+    wanted = set(args.operations.split(",")) if args.operations else None
+
+    try:
+        for size in [parse_size(value) for value in args.sizes.split(",")]:
+            spec = DatasetSpec(
+                tasks=size,
+                comments_per_task=args.comments_per_task,
+                updates_per_task=args.updates_per_task,
+                users=args.users,
+                groups=args.groups,
+                seed=args.seed,
+            )
+            print(f"\n▶ Dataset: {size:,} tasks")
+            started = time.perf_counter()
+            clear_dataset(engine)
+            dataset = generate_dataset(engine, spec)
+            print(f"  Generated {dataset.counts} in {time.perf_counter() - started:.1f}s")
+
+            manager = KanbanManager(db_manager, current_user_id=dataset.user_ids[0])
+            if not manager.search_tasks(SEARCH_WORD, limit=1):
+                raise SystemExit(
+                    f"❌ Search for {SEARCH_WORD!r} found no tasks; search_tasks would time an empty result"
+                )
+            operations = {}
+            for name, call in benchmark_operations(manager, dataset):
+                if wanted and name not in wanted:
+                    continue
+                operations[name] = time_operation(db_manager, name, call, args.repeat, args.warmup)
+                result = operations[name]
+                flag = "  ⚠️ N+1" if result["n_plus_one"] else ""
+                print(
+                    f"  {name:<26} median {result['median_ms']:>9.1f} ms  p95 {result['p95_ms']:>9.1f} ms  "
+                    f"{result['queries']} queries{flag}"
+                )
+            results["sizes"][str(size)] = {"dataset": asdict(spec), "counts": dataset.counts, "operations": operations}
+    finally:
+        if not args.keep_data:
+            clear_dataset(engine)
+        db_manager.stop_query_instrumentation()
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"\n✅ Results written to {output}")
+
+    if not args.baseline:
+        return 0
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"✅ Baseline written to {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"⚠️  Baseline {baseline_path} not found; run with --save-baseline to create it")
+        return 0
+
+    regressions = compare(results, json.loads(baseline_path.read_text(encoding="utf-8")), args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) against {baseline_path}:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        return 1
+    print(f"\n✅ No regressions against {baseline_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""Load a large deterministic synthetic dataset for load tests and benchmarks.
+
+Tasks (with realistic column, priority and deadline distributions),
+comments, activity, users, groups and group memberships are generated in
+Python and streamed into PostgreSQL with COPY FROM STDIN in chunks (see
+kanban/synthetic_data.py). The same --seed and --anchor always produce the
+same rows, e.g.
+
+    python scripts/generate_kanban_data.py --tasks 1m --seed 7 --anchor 2026-01-01
+
+--clear first removes the tasks of an earlier run: tasks in --category that
+were created by the synthetic users (--user-prefix), so real tasks are never
+touched. Like the benchmark, it refuses non-local hosts unless
+--allow-remote is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Set UTF-8 encoding for Windows console
+if sys.platform == "win32":
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from kanban.database import get_db_manager  # noqa: E402
+from kanban.synthetic_data import (  # noqa: E402
+    LOCAL_HOSTS,
+    SyntheticSpec,
+    analyze_tables,
+    clear_synthetic_tasks,
+    load_synthetic_data,
+    parse_size,
+)
+
+DEFAULT_CATEGORY = "synthetic"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Stream a deterministic synthetic Kanban dataset into PostgreSQL.")
+    parser.add_argument("--tasks", default="100k", help="Number of tasks, e.g. 100k or 1m (default 100k)")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--groups", type=int, default=10)
+    parser.add_argument("--comments-per-task", type=float, default=2.0, help="Mean comments per task (default 2)")
+    parser.add_argument("--updates-per-task", type=float, default=2.0, help="Mean field updates per task (default 2)")
+    parser.add_argument("--history-days", type=int, default=730, help="Days of history to spread tasks over")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--anchor", help="Date the history ends at, YYYY-MM-DD (default today)")
+    parser.add_argument("--category", default=DEFAULT_CATEGORY,
+                        help=f"Category of every generated task (default {DEFAULT_CATEGORY})")
+    parser.add_argument("--user-prefix", default=SyntheticSpec.user_prefix,
+                        help=f"Username prefix of the synthetic users (default {SyntheticSpec.user_prefix})")
+    parser.add_argument("--chunk-rows", type=int, default=50_000, help="Rows per COPY (default 50000)")
+    parser.add_argument("--clear", action="store_true",
+                        help="Delete earlier generated tasks (--category, created by --user-prefix users) first")
+    parser.add_argument("--config", help="Database config file (default: config/kanban_config.json)")
+    parser.add_argument("--allow-remote", action="store_true", help="Allow a non-local database host")
+    args = parser.parse_args(argv)
+
+    db_manager = get_db_manager(args.config)
+    host = db_manager.config["database"]["host"]
+    if host not in LOCAL_HOSTS and not args.allow_remote:
+        print(f"❌ Refusing to load synthetic data into {host}; pass --allow-remote to override")
+        return 1
+
+    spec = SyntheticSpec(
+        tasks=parse_size(args.tasks),
+        users=args.users,
+        groups=args.groups,
+        comments_per_task=args.comments_per_task,
+        updates_per_task=args.updates_per_task,
+        history_days=args.history_days,
+        seed=args.seed,
+        anchor=datetime.strptime(args.anchor, "%Y-%m-%d") if args.anchor else None,
+        category=args.category,
+        user_prefix=args.user_prefix,
+        chunk_rows=args.chunk_rows,
+    )
+
+    print("=" * 60)
+    print("Kanban Synthetic Data")
+    print("=" * 60)
+
+    engine = db_manager.engine
+    if args.clear:
+        removed = clear_synthetic_tasks(engine, args.category, args.user_prefix)
+        print(f"  Removed {removed:,} earlier generated '{args.category}' tasks")
+
+    started = time.perf_counter()
+    try:
+        result = load_synthetic_data(engine, spec)
+    except Exception as e:
+        print(f"❌ Load failed: {e}")
+        return 1
+    analyze_tables(engine)
+    elapsed = time.perf_counter() - started
+
+    for name, count in result.counts.items():
+        print(f"  {name:<12} {count:,}")
+    if not result.triggers_skipped:
+        print("  ⚠️  Triggers were not skipped (needs superuser); the load ran slower")
+    print(f"✅ Loaded {result.counts['tasks']:,} tasks in {elapsed:.1f}s "
+          f"({result.counts['tasks'] / max(elapsed, 0.001):,.0f} tasks/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
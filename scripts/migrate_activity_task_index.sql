@@ -0,0 +1,23 @@
+-- ===========================================================================
+-- Migration Script: Task activity history index
+-- ===========================================================================
+-- Replaces idx_activity_task (task_id[, created_at]) with (task_id, id DESC),
+-- which serves the keyset-paged activity tab (KanbanManager.get_task_activity:
+-- WHERE task_id = ? AND id < ? ORDER BY id DESC LIMIT n) without a sort.
+-- Run after migrate_partition_activity_log.sql.
+--
+-- Run with:
+--   psql -h <SERVER_IP> -U kanban_test -d itit_kanban_test -f scripts/migrate_activity_task_index.sql
+-- ===========================================================================
+
+CREATE INDEX IF NOT EXISTS idx_activity_task_id ON kanban_activity_log(task_id, id DESC);
+DROP INDEX IF EXISTS idx_activity_task;
+
+DO $$
+BEGIN
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '✅ Activity Index Migration Complete!';
+    RAISE NOTICE '========================================';
+    RAISE NOTICE 'Index: idx_activity_task_id (task_id, id DESC)';
+    RAISE NOTICE '========================================';
+END $$;
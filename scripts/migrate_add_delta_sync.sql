@@ -0,0 +1,125 @@
+-- ===========================================================================
+-- Migration Script: Delta Sync for Board Auto-Refresh
+-- ===========================================================================
+-- Adds what KanbanManager.get_changes_since needs so idle board refreshes
+-- cost one indexed probe instead of a full board load:
+--   - index on kanban_tasks.updated_at (the sync cursor)
+--   - updated_at stamped by the server on INSERT as well as UPDATE
+--   - kanban_task_tombstones + trigger for deletes and column moves
+--   - comment/attachment changes bump the parent task's updated_at
+--   - kanban_columns.modified_at stamped by the server
+--
+-- Run with:
+--   psql -h <SERVER_IP> -U kanban_test -d itit_kanban_test -f scripts/migrate_add_delta_sync.sql
+--
+-- Tombstones are only needed for a few minutes; prune old ones with e.g.:
+--   DELETE FROM kanban_task_tombstones WHERE changed_at < CURRENT_TIMESTAMP - INTERVAL '1 day';
+-- ===========================================================================
+
+-- ===========================================================================
+-- STEP 1: Sync cursor index
+-- ===========================================================================
+CREATE INDEX IF NOT EXISTS idx_tasks_updated_at ON kanban_tasks(updated_at);
+
+DROP TRIGGER IF EXISTS trigger_update_task_timestamp ON kanban_tasks;
+CREATE TRIGGER trigger_update_task_timestamp
+BEFORE INSERT OR UPDATE ON kanban_tasks
+FOR EACH ROW
+EXECUTE FUNCTION update_modified_timestamp();
+
+CREATE OR REPLACE FUNCTION update_column_modified_timestamp()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.modified_at = CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_update_column_timestamp ON kanban_columns;
+CREATE TRIGGER trigger_update_column_timestamp
+BEFORE INSERT OR UPDATE ON kanban_columns
+FOR EACH ROW
+EXECUTE FUNCTION update_column_modified_timestamp();
+
+DO $$
+BEGIN
+    RAISE NOTICE '✓ updated_at index and timestamp triggers ready';
+END $$;
+
+-- ===========================================================================
+-- STEP 2: Tombstones for deleted and moved tasks
+-- ===========================================================================
+CREATE TABLE IF NOT EXISTS kanban_task_tombstones (
+    id BIGSERIAL PRIMARY KEY,
+    task_id INTEGER NOT NULL,
+    column_id INTEGER,
+    reason VARCHAR(20) NOT NULL,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_tombstones_changed_at ON kanban_task_tombstones(changed_at);
+
+CREATE OR REPLACE FUNCTION record_task_tombstone()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO kanban_task_tombstones (task_id, column_id, reason)
+        VALUES (OLD.id, OLD.column_id, 'deleted');
+        RETURN OLD;
+    END IF;
+
+    IF NEW.is_deleted AND NOT COALESCE(OLD.is_deleted, FALSE) THEN
+        INSERT INTO kanban_task_tombstones (task_id, column_id, reason)
+        VALUES (OLD.id, OLD.column_id, 'deleted');
+    ELSIF OLD.column_id IS DISTINCT FROM NEW.column_id THEN
+        INSERT INTO kanban_task_tombstones (task_id, column_id, reason)
+        VALUES (OLD.id, OLD.column_id, 'moved');
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_task_tombstone ON kanban_tasks;
+CREATE TRIGGER trigger_task_tombstone
+AFTER UPDATE OR DELETE ON kanban_tasks
+FOR EACH ROW
+EXECUTE FUNCTION record_task_tombstone();
+
+DO $$
+BEGIN
+    RAISE NOTICE '✓ kanban_task_tombstones table and trigger ready';
+END $$;
+
+-- ===========================================================================
+-- STEP 3: Comment/attachment changes bump the parent task
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION touch_parent_task()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE kanban_tasks SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.task_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_comment_touch_task ON kanban_comments;
+CREATE TRIGGER trigger_comment_touch_task
+AFTER INSERT OR UPDATE ON kanban_comments
+FOR EACH ROW
+EXECUTE FUNCTION touch_parent_task();
+
+DROP TRIGGER IF EXISTS trigger_attachment_touch_task ON kanban_attachments;
+CREATE TRIGGER trigger_attachment_touch_task
+AFTER INSERT OR UPDATE ON kanban_attachments
+FOR EACH ROW
+EXECUTE FUNCTION touch_parent_task();
+
+-- ===========================================================================
+-- COMPLETION MESSAGE
+-- ===========================================================================
+DO $$
+BEGIN
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '✅ Delta Sync Migration Complete!';
+    RAISE NOTICE '========================================';
+END $$;
@@ -0,0 +1,52 @@
+-- ===========================================================================
+-- Migration Script: Dependency Graph
+-- ===========================================================================
+-- Supports the task dependency graph API (kanban/dependency_graph.py):
+--   - idx_dependencies_depends_on for reverse edge lookups (what a task
+--     unblocks, blocked cards on the board)
+--   - the 'dependency_graph_version' row in kanban_settings and a
+--     statement-level trigger on kanban_dependencies that bumps it; clients
+--     cache graph results per board version
+-- Safe to run again.
+--
+-- Run with:
+--   psql -h <SERVER_IP> -U kanban_test -d itit_kanban_test -f scripts/migrate_add_dependency_graph.sql
+-- ===========================================================================
+
+-- Reverse edge lookups (what a task unblocks); uq_task_dependency covers the forward ones
+CREATE INDEX IF NOT EXISTS idx_dependencies_depends_on ON kanban_dependencies(depends_on_task_id, task_id);
+
+INSERT INTO kanban_settings (setting_key, setting_value, description)
+VALUES ('dependency_graph_version', '1'::JSONB, 'Bumped by a trigger when task dependencies change')
+ON CONFLICT (setting_key) DO NOTHING;
+
+-- Dependency graph version for the client-side graph cache: bumped once per
+-- statement that changes kanban_dependencies (including cascaded deletes)
+CREATE OR REPLACE FUNCTION bump_dependency_graph_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE kanban_settings
+    SET setting_value = to_jsonb(COALESCE((setting_value #>> '{}')::BIGINT, 0) + 1),
+        modified_at = CURRENT_TIMESTAMP
+    WHERE setting_key = 'dependency_graph_version';
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_dependencies_graph_version ON kanban_dependencies;
+CREATE TRIGGER trigger_dependencies_graph_version
+AFTER INSERT OR UPDATE OR DELETE ON kanban_dependencies
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_dependency_graph_version();
+
+DO $$
+BEGIN
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '✅ Dependency Graph Migration Complete!';
+    RAISE NOTICE '========================================';
+    RAISE NOTICE 'Current version: %', (
+        SELECT setting_value FROM kanban_settings WHERE setting_key = 'dependency_graph_version'
+    );
+    RAISE NOTICE 'Dependencies: %', (SELECT COUNT(*) FROM kanban_dependencies);
+    RAISE NOTICE '========================================';
+END $$;
@@ -0,0 +1,75 @@
+-- ===========================================================================
+-- Migration Script: Live Board Updates (LISTEN/NOTIFY)
+-- ===========================================================================
+-- Adds triggers on kanban_tasks, kanban_comments and kanban_columns that
+-- send a NOTIFY on channel 'kanban_changes' with a small JSON payload, e.g.
+--   {"table": "kanban_tasks", "op": "UPDATE", "task_id": 42}
+-- Board clients LISTEN on that channel and refresh within a second; the
+-- 30-second polling stays as a fallback when the listener is disconnected.
+--
+-- Run with:
+--   psql -h <SERVER_IP> -U kanban_test -d itit_kanban_test -f scripts/migrate_add_live_updates.sql
+--
+-- Quick manual test (two psql sessions):
+--   session 1: LISTEN kanban_changes;
+--   session 2: UPDATE kanban_tasks SET priority = priority WHERE id = 1;
+--   session 1: (run any statement) -> Asynchronous notification received
+-- ===========================================================================
+
+-- Push notifications for live board updates (LISTEN kanban_changes)
+CREATE OR REPLACE FUNCTION notify_kanban_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed RECORD;
+    payload JSON;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := OLD;
+    ELSE
+        changed := NEW;
+    END IF;
+
+    IF TG_TABLE_NAME = 'kanban_tasks' THEN
+        payload := json_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'task_id', changed.id);
+    ELSIF TG_TABLE_NAME = 'kanban_columns' THEN
+        payload := json_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'column_id', changed.id);
+    ELSE
+        payload := json_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'task_id', changed.task_id);
+    END IF;
+
+    -- Identical payloads within one transaction are delivered once
+    PERFORM pg_notify('kanban_changes', payload::TEXT);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_notify_task_change ON kanban_tasks;
+CREATE TRIGGER trigger_notify_task_change
+AFTER INSERT OR UPDATE OR DELETE ON kanban_tasks
+FOR EACH ROW
+EXECUTE FUNCTION notify_kanban_change();
+
+DROP TRIGGER IF EXISTS trigger_notify_comment_change ON kanban_comments;
+CREATE TRIGGER trigger_notify_comment_change
+AFTER INSERT OR UPDATE OR DELETE ON kanban_comments
+FOR EACH ROW
+EXECUTE FUNCTION notify_kanban_change();
+
+DROP TRIGGER IF EXISTS trigger_notify_column_change ON kanban_columns;
+CREATE TRIGGER trigger_notify_column_change
+AFTER INSERT OR UPDATE OR DELETE ON kanban_columns
+FOR EACH ROW
+EXECUTE FUNCTION notify_kanban_change();
+
+-- ===========================================================================
+-- COMPLETION MESSAGE
+-- ===========================================================================
+DO $$
+BEGIN
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '✅ Live Updates Migration Complete!';
+    RAISE NOTICE '========================================';
+    RAISE NOTICE 'Channel: kanban_changes';
+    RAISE NOTICE 'Triggers: kanban_tasks, kanban_comments, kanban_columns';
+    RAISE NOTICE '========================================';
+END $$;
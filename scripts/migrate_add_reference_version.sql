@@ -0,0 +1,67 @@
+-- ===========================================================================
+-- Migration Script: Reference Data Version
+-- ===========================================================================
+-- Adds the 'reference_data_version' row to kanban_settings and statement-level
+-- triggers on kanban_users, kanban_columns, kanban_groups and
+-- kanban_group_members that bump it. Clients cache users/columns/groups
+-- (kanban/reference_cache.py) and only reload them when this number changes.
+-- Safe to run again.
+--
+-- Run with:
+--   psql -h <SERVER_IP> -U kanban_test -d itit_kanban_test -f scripts/migrate_add_reference_version.sql
+-- ===========================================================================
+
+INSERT INTO kanban_settings (setting_key, setting_value, description)
+VALUES ('reference_data_version', '1'::JSONB, 'Bumped by triggers when users, columns or groups change')
+ON CONFLICT (setting_key) DO NOTHING;
+
+-- Reference data version (users, columns, groups) for the client-side
+-- reference cache: bumped once per statement that changes those tables
+CREATE OR REPLACE FUNCTION bump_reference_data_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE kanban_settings
+    SET setting_value = to_jsonb(COALESCE((setting_value #>> '{}')::BIGINT, 0) + 1),
+        modified_at = CURRENT_TIMESTAMP
+    WHERE setting_key = 'reference_data_version';
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Only columns shown in pickers/cards; last_login and password changes don't count
+DROP TRIGGER IF EXISTS trigger_users_reference_version ON kanban_users;
+CREATE TRIGGER trigger_users_reference_version
+AFTER INSERT OR DELETE OR UPDATE OF username, display_name, email, role, avatar_color, department, is_active
+ON kanban_users
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_reference_data_version();
+
+DROP TRIGGER IF EXISTS trigger_columns_reference_version ON kanban_columns;
+CREATE TRIGGER trigger_columns_reference_version
+AFTER INSERT OR UPDATE OR DELETE ON kanban_columns
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_reference_data_version();
+
+DROP TRIGGER IF EXISTS trigger_groups_reference_version ON kanban_groups;
+CREATE TRIGGER trigger_groups_reference_version
+AFTER INSERT OR UPDATE OR DELETE ON kanban_groups
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_reference_data_version();
+
+DROP TRIGGER IF EXISTS trigger_group_members_reference_version ON kanban_group_members;
+CREATE TRIGGER trigger_group_members_reference_version
+AFTER INSERT OR UPDATE OR DELETE ON kanban_group_members
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_reference_data_version();
+
+DO $$
+BEGIN
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '✅ Reference Data Version Migration Complete!';
+    RAISE NOTICE '========================================';
+    RAISE NOTICE 'Current version: %', (
+        SELECT setting_value FROM kanban_settings WHERE setting_key = 'reference_data_version'
+    );
+    RAISE NOTICE 'Triggers: kanban_users, kanban_columns, kanban_groups, kanban_group_members';
+    RAISE NOTICE '========================================';
+END $$;
@@ -0,0 +1,157 @@
+-- ===========================================================================
+-- Migration Script: Materialized Reporting Views
+-- ===========================================================================
+-- Adds materialized versions of the reporting views (mv_active_tasks,
+-- mv_overdue_tasks, mv_user_workload) plus mv_task_rollup, which backs the
+-- Reports tab, and refresh_kanban_reporting_views(). Safe to run again.
+--
+-- Run with:
+--   psql -h <SERVER_IP> -U kanban_test -d itit_kanban_test -f scripts/migrate_add_reporting_views.sql
+-- ===========================================================================
+
+-- Report refresh bookkeeping (single row)
+CREATE TABLE IF NOT EXISTS kanban_report_refresh (
+    id INTEGER PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    refreshed_at TIMESTAMP
+);
+INSERT INTO kanban_report_refresh (id, refreshed_at) VALUES (1, CURRENT_TIMESTAMP)
+ON CONFLICT (id) DO NOTHING;
+
+-- Active tasks (materialized v_active_tasks)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_active_tasks AS
+SELECT 
+    t.id,
+    t.task_number,
+    t.title,
+    t.priority,
+    t.category,
+    t.deadline,
+    t.created_at,
+    t.assigned_to,
+    t.assigned_group_id,
+    c.name AS column_name,
+    c.color AS column_color,
+    u.display_name AS assigned_to_name,
+    creator.display_name AS created_by_name,
+    (SELECT COUNT(*) FROM kanban_comments WHERE task_id = t.id AND is_deleted = FALSE) AS comment_count,
+    (SELECT COUNT(*) FROM kanban_attachments WHERE task_id = t.id AND is_deleted = FALSE) AS attachment_count
+FROM kanban_tasks t
+LEFT JOIN kanban_columns c ON t.column_id = c.id
+LEFT JOIN kanban_users u ON t.assigned_to = u.id
+LEFT JOIN kanban_users creator ON t.created_by = creator.id
+WHERE t.is_deleted = FALSE AND c.is_active = TRUE;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_active_tasks_id ON mv_active_tasks(id);
+CREATE INDEX IF NOT EXISTS idx_mv_active_tasks_column ON mv_active_tasks(column_name);
+CREATE INDEX IF NOT EXISTS idx_mv_active_tasks_assigned ON mv_active_tasks(assigned_to);
+
+-- Overdue tasks (materialized v_overdue_tasks)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_overdue_tasks AS
+SELECT 
+    t.id,
+    t.task_number,
+    t.title,
+    t.priority,
+    t.deadline,
+    t.assigned_to,
+    t.assigned_group_id,
+    c.name AS column_name,
+    u.display_name AS assigned_to_name
+FROM kanban_tasks t
+JOIN kanban_columns c ON t.column_id = c.id
+LEFT JOIN kanban_users u ON t.assigned_to = u.id
+WHERE t.is_deleted = FALSE
+  AND c.is_active = TRUE
+  AND c.name != 'Done'
+  AND t.deadline < CURRENT_DATE;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_overdue_tasks_id ON mv_overdue_tasks(id);
+CREATE INDEX IF NOT EXISTS idx_mv_overdue_tasks_deadline ON mv_overdue_tasks(deadline);
+
+-- User workload (materialized v_user_workload)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_user_workload AS
+SELECT 
+    u.id AS user_id,
+    u.display_name,
+    COUNT(t.id) AS active_tasks,
+    SUM(CASE WHEN t.priority = 'critical' THEN 1 ELSE 0 END) AS critical_tasks,
+    SUM(CASE WHEN t.deadline < CURRENT_DATE THEN 1 ELSE 0 END) AS overdue_tasks
+FROM kanban_users u
+LEFT JOIN kanban_tasks t ON u.id = t.assigned_to AND t.is_deleted = FALSE
+WHERE u.is_active = TRUE
+GROUP BY u.id, u.display_name;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_user_workload_user ON mv_user_workload(user_id);
+
+-- Daily task rollup per assignee/group, used by the Reports tab
+-- (task statistics and team performance). 0 = unassigned / no group.
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_task_rollup AS
+SELECT
+    t.created_at::date AS created_on,
+    COALESCE(t.assigned_to, 0) AS assignee_id,
+    COALESCE(t.assigned_group_id, 0) AS group_id,
+    COUNT(*) AS total_tasks,
+    COUNT(*) FILTER (WHERE c.name = 'Done') AS done_tasks,
+    COUNT(*) FILTER (WHERE c.name = 'Done' AND c.is_active = TRUE) AS completed_tasks,
+    COUNT(*) FILTER (WHERE c.name = 'In Progress' AND c.is_active = TRUE) AS in_progress_tasks,
+    COUNT(*) FILTER (
+        WHERE t.deadline < CURRENT_DATE
+          AND c.name != 'Done'
+          AND t.status IS DISTINCT FROM 'archived'
+    ) AS overdue_tasks,
+    COUNT(*) FILTER (
+        WHERE c.name = 'Done' AND t.deadline IS NOT NULL AND t.completed_at IS NOT NULL
+    ) AS with_deadline,
+    COUNT(*) FILTER (
+        WHERE c.name = 'Done' AND t.deadline IS NOT NULL AND t.completed_at IS NOT NULL
+          AND t.completed_at::date <= t.deadline
+    ) AS on_time,
+    COUNT(*) FILTER (WHERE c.name = 'Done' AND t.completed_at IS NOT NULL) AS completed_with_date,
+    COALESCE(SUM(t.completed_at::date - t.created_at::date)
+             FILTER (WHERE c.name = 'Done' AND t.completed_at IS NOT NULL), 0) AS completion_days
+FROM kanban_tasks t
+JOIN kanban_columns c ON t.column_id = c.id
+WHERE t.is_deleted = FALSE
+GROUP BY 1, 2, 3;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_task_rollup_key ON mv_task_rollup(created_on, assignee_id, group_id);
+CREATE INDEX IF NOT EXISTS idx_mv_task_rollup_assignee ON mv_task_rollup(assignee_id, created_on);
+CREATE INDEX IF NOT EXISTS idx_mv_task_rollup_group ON mv_task_rollup(group_id, created_on);
+
+-- Refresh all reporting views. Skips (returns FALSE) when another session
+-- is already refreshing or the last refresh is younger than min_age, so
+-- several clients can call it on a timer without piling up.
+CREATE OR REPLACE FUNCTION refresh_kanban_reporting_views(min_age INTERVAL DEFAULT INTERVAL '0')
+RETURNS BOOLEAN AS $$
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('kanban_reporting_refresh')) THEN
+        RETURN FALSE;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM kanban_report_refresh
+        WHERE id = 1 AND refreshed_at > clock_timestamp() - min_age
+    ) THEN
+        RETURN FALSE;
+    END IF;
+
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_active_tasks;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_overdue_tasks;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_user_workload;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_task_rollup;
+
+    UPDATE kanban_report_refresh SET refreshed_at = clock_timestamp() WHERE id = 1;
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '✅ Reporting Views Migration Complete!';
+    RAISE NOTICE '========================================';
+    RAISE NOTICE 'Materialized views: mv_active_tasks, mv_overdue_tasks,';
+    RAISE NOTICE '  mv_user_workload, mv_task_rollup';
+    RAISE NOTICE 'Refresh with: SELECT refresh_kanban_reporting_views();';
+    RAISE NOTICE '========================================';
+END $$;
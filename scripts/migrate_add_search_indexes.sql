@@ -0,0 +1,26 @@
+-- ===========================================================================
+-- Migration Script: Ranked Full-Text Task Search
+-- ===========================================================================
+-- KanbanManager.search_tasks and the board search box use the GIN index
+-- idx_tasks_search (to_tsvector over title + description) and a prefix
+-- index on task_number. Databases created before the search index existed
+-- get both here; on newer databases this only adds the task_number index.
+--
+-- Run with:
+--   psql -h <SERVER_IP> -U kanban_test -d itit_kanban_test -f scripts/migrate_add_search_indexes.sql
+-- ===========================================================================
+
+CREATE INDEX IF NOT EXISTS idx_tasks_search ON kanban_tasks
+USING gin(to_tsvector('english', title || ' ' || COALESCE(description, '')));
+
+CREATE INDEX IF NOT EXISTS idx_tasks_task_number_pattern
+ON kanban_tasks(task_number varchar_pattern_ops);
+
+ANALYZE kanban_tasks;
+
+DO $$
+BEGIN
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '✅ Search Index Migration Complete!';
+    RAISE NOTICE '========================================';
+END $$;
@@ -0,0 +1,58 @@
+-- ===========================================================================
+-- Migration Script: Task Archive Tables
+-- ===========================================================================
+-- Creates the cold-storage tables used by kanban/archive.py:
+-- kanban_tasks_archive, kanban_comments_archive, kanban_attachments_archive
+-- and kanban_activity_log_archive. scripts/archive_tasks.py moves
+-- long-completed, archived and soft-deleted tasks into them on a schedule;
+-- search and reports can include them on request. Safe to run again.
+--
+-- Run with:
+--   psql -h <SERVER_IP> -U kanban_test -d itit_kanban_test -f scripts/migrate_add_task_archive.sql
+-- ===========================================================================
+
+CREATE TABLE IF NOT EXISTS kanban_tasks_archive (
+    LIKE kanban_tasks,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    archive_reason VARCHAR(20) NOT NULL,
+    PRIMARY KEY (id)
+);
+
+-- Same expression as idx_tasks_search so "include archived" searches use an index on both sides
+CREATE INDEX IF NOT EXISTS idx_tasks_archive_search ON kanban_tasks_archive
+USING gin(to_tsvector('english', title || ' ' || COALESCE(description, '')));
+CREATE INDEX IF NOT EXISTS idx_tasks_archive_task_number ON kanban_tasks_archive(task_number varchar_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_tasks_archive_assigned ON kanban_tasks_archive(assigned_to);
+CREATE INDEX IF NOT EXISTS idx_tasks_archive_assigned_group ON kanban_tasks_archive(assigned_group_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_archive_created_at ON kanban_tasks_archive(created_at);
+
+CREATE TABLE IF NOT EXISTS kanban_comments_archive (
+    LIKE kanban_comments,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+);
+CREATE INDEX IF NOT EXISTS idx_comments_archive_task ON kanban_comments_archive(task_id);
+
+CREATE TABLE IF NOT EXISTS kanban_attachments_archive (
+    LIKE kanban_attachments,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+);
+CREATE INDEX IF NOT EXISTS idx_attachments_archive_task ON kanban_attachments_archive(task_id);
+
+CREATE TABLE IF NOT EXISTS kanban_activity_log_archive (
+    LIKE kanban_activity_log,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+);
+CREATE INDEX IF NOT EXISTS idx_activity_archive_task_id ON kanban_activity_log_archive(task_id, id DESC);
+
+DO $$
+BEGIN
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '✅ Task Archive Migration Complete!';
+    RAISE NOTICE '========================================';
+    RAISE NOTICE 'Archived tasks: %', (SELECT COUNT(*) FROM kanban_tasks_archive);
+    RAISE NOTICE 'Next: schedule scripts/archive_tasks.py (e.g. nightly)';
+    RAISE NOTICE '========================================';
+END $$;
@@ -0,0 +1,38 @@
+-- ===========================================================================
+-- Migration Script: Sequence-Backed Task Numbers
+-- ===========================================================================
+-- task_number used to be computed by the application from the newest task
+-- (ORDER BY id DESC LIMIT 1), which could collide under concurrent inserts.
+-- It is now assigned by a column default from kanban_task_number_seq.
+-- The sequence starts after the highest existing TASK-nnnn number.
+--
+-- Run with:
+--   psql -h <SERVER_IP> -U kanban_test -d itit_kanban_test -f scripts/migrate_add_task_number_sequence.sql
+-- ===========================================================================
+
+CREATE SEQUENCE IF NOT EXISTS kanban_task_number_seq;
+
+SELECT setval(
+    'kanban_task_number_seq',
+    COALESCE(MAX(substring(task_number FROM '^TASK-([0-9]+)$')::BIGINT), 0) + 1,
+    false
+)
+FROM kanban_tasks;
+
+ALTER TABLE kanban_tasks
+    ALTER COLUMN task_number
+    SET DEFAULT 'TASK-' || to_char(nextval('kanban_task_number_seq'), 'FM99999999990000');
+
+ALTER SEQUENCE kanban_task_number_seq OWNED BY kanban_tasks.task_number;
+
+DO $$
+DECLARE
+    next_number BIGINT;
+BEGIN
+    SELECT last_value INTO next_number FROM kanban_task_number_seq;
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '✅ Task Number Sequence Migration Complete!';
+    RAISE NOTICE '========================================';
+    RAISE NOTICE 'Next task number: TASK-%', to_char(next_number, 'FM99999999990000');
+    RAISE NOTICE '========================================';
+END $$;
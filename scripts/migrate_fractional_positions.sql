@@ -0,0 +1,75 @@
+-- ===========================================================================
+-- Migration Script: Fractional Card Positions
+-- ===========================================================================
+-- kanban_tasks.position becomes NUMERIC(24, 12) so a card can be dropped
+-- between two others by taking the midpoint of their positions (a single-row
+-- UPDATE). Existing positions are renumbered 1, 2, 3, ... per column in their
+-- current order, and the column index now covers (column_id, position, id).
+-- v_active_tasks / v_overdue_tasks are recreated unchanged.
+--
+-- Run with:
+--   psql -h <SERVER_IP> -U kanban_test -d itit_kanban_test -f scripts/migrate_fractional_positions.sql
+-- ===========================================================================
+
+BEGIN;
+
+-- v_active_tasks orders by position, so it has to be recreated around the type change
+DROP VIEW IF EXISTS v_overdue_tasks;
+DROP VIEW IF EXISTS v_active_tasks;
+
+ALTER TABLE kanban_tasks
+    ALTER COLUMN position TYPE NUMERIC(24, 12) USING position::NUMERIC(24, 12);
+
+UPDATE kanban_tasks t
+SET position = ranked.rank
+FROM (
+    SELECT id, ROW_NUMBER() OVER (PARTITION BY column_id ORDER BY position, id) AS rank
+    FROM kanban_tasks
+    WHERE is_deleted = FALSE
+) ranked
+WHERE t.id = ranked.id;
+
+CREATE INDEX IF NOT EXISTS idx_tasks_column_position
+ON kanban_tasks(column_id, position, id) WHERE is_deleted = FALSE;
+
+DROP INDEX IF EXISTS idx_tasks_column;
+
+-- Active tasks with user info
+CREATE OR REPLACE VIEW v_active_tasks AS
+SELECT 
+    t.id,
+    t.task_number,
+    t.title,
+    t.description,
+    t.priority,
+    t.category,
+    t.deadline,
+    t.created_at,
+    c.name AS column_name,
+    c.color AS column_color,
+    u.display_name AS assigned_to_name,
+    u.avatar_color AS assignee_color,
+    creator.display_name AS created_by_name,
+    (SELECT COUNT(*) FROM kanban_comments WHERE task_id = t.id AND is_deleted = FALSE) AS comment_count,
+    (SELECT COUNT(*) FROM kanban_attachments WHERE task_id = t.id AND is_deleted = FALSE) AS attachment_count
+FROM kanban_tasks t
+LEFT JOIN kanban_columns c ON t.column_id = c.id
+LEFT JOIN kanban_users u ON t.assigned_to = u.id
+LEFT JOIN kanban_users creator ON t.created_by = creator.id
+WHERE t.is_deleted = FALSE AND c.is_active = TRUE
+ORDER BY c.position, t.position;
+
+-- Overdue tasks
+CREATE OR REPLACE VIEW v_overdue_tasks AS
+SELECT *
+FROM v_active_tasks
+WHERE deadline < CURRENT_DATE AND column_name != 'Done';
+
+COMMIT;
+
+DO $$
+BEGIN
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '✅ Fractional Positions Migration Complete!';
+    RAISE NOTICE '========================================';
+END $$;
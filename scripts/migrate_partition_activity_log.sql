@@ -0,0 +1,123 @@
+-- ===========================================================================
+-- Migration Script: Partition kanban_activity_log by month
+-- ===========================================================================
+-- Rebuilds kanban_activity_log as a table range-partitioned by created_at
+-- month (kanban_activity_log_YYYYMM + a default partition) and copies the
+-- existing rows over. Replaces the four single-column indexes with
+-- (task_id, created_at) and (user_id, created_at).
+--
+-- Runs in one transaction and locks the activity log while copying; run it
+-- outside office hours. Afterwards schedule scripts/archive_activity_log.py
+-- daily to create future partitions and archive old months.
+--
+-- Run with:
+--   psql -h <SERVER_IP> -U kanban_test -d itit_kanban_test -f scripts/migrate_partition_activity_log.sql
+-- ===========================================================================
+
+BEGIN;
+
+-- Keep the old table (and its id sequence) aside while copying
+ALTER TABLE kanban_activity_log RENAME TO kanban_activity_log_legacy;
+ALTER TABLE kanban_activity_log_legacy RENAME CONSTRAINT kanban_activity_log_pkey TO kanban_activity_log_legacy_pkey;
+DROP INDEX IF EXISTS idx_activity_task;
+DROP INDEX IF EXISTS idx_activity_user;
+DROP INDEX IF EXISTS idx_activity_type;
+DROP INDEX IF EXISTS idx_activity_date;
+
+CREATE TABLE kanban_activity_log (
+    id BIGINT NOT NULL DEFAULT nextval('kanban_activity_log_id_seq'),
+    task_id INTEGER REFERENCES kanban_tasks(id) ON DELETE SET NULL,
+    activity_type VARCHAR(50) NOT NULL,
+    user_id INTEGER REFERENCES kanban_users(id) NOT NULL,
+    field_name VARCHAR(100),
+    old_value TEXT,
+    new_value TEXT,
+    comment TEXT,
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    task_snapshot JSONB,
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+ALTER SEQUENCE kanban_activity_log_id_seq AS BIGINT OWNED BY kanban_activity_log.id;
+
+CREATE TABLE kanban_activity_log_default PARTITION OF kanban_activity_log DEFAULT;
+
+CREATE INDEX idx_activity_task ON kanban_activity_log(task_id, created_at);
+CREATE INDEX idx_activity_user ON kanban_activity_log(user_id, created_at);
+
+-- Monthly partitions kanban_activity_log_YYYYMM from the current month up to
+-- months_ahead months ahead. Idempotent; run daily by
+-- scripts/archive_activity_log.py (and safe to call from pg_cron).
+CREATE OR REPLACE FUNCTION ensure_activity_log_partitions(months_ahead INTEGER DEFAULT 3)
+RETURNS INTEGER AS $$
+DECLARE
+    month_start DATE;
+    partition_name TEXT;
+    created INTEGER := 0;
+BEGIN
+    FOR i IN 0..months_ahead LOOP
+        month_start := (date_trunc('month', CURRENT_DATE) + make_interval(months => i))::DATE;
+        partition_name := 'kanban_activity_log_' || to_char(month_start, 'YYYYMM');
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF kanban_activity_log FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, (month_start + INTERVAL '1 month')::DATE
+            );
+            created := created + 1;
+        END IF;
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
+
+-- One partition per month that has history, plus the next three months
+DO $$
+DECLARE
+    month_start DATE;
+    partition_name TEXT;
+BEGIN
+    FOR month_start IN
+        SELECT DISTINCT date_trunc('month', COALESCE(created_at, CURRENT_TIMESTAMP))::DATE
+        FROM kanban_activity_log_legacy
+    LOOP
+        partition_name := 'kanban_activity_log_' || to_char(month_start, 'YYYYMM');
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF kanban_activity_log FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, (month_start + INTERVAL '1 month')::DATE
+            );
+        END IF;
+    END LOOP;
+END $$;
+
+SELECT ensure_activity_log_partitions(3);
+
+INSERT INTO kanban_activity_log (
+    id, task_id, activity_type, user_id, field_name, old_value, new_value,
+    comment, ip_address, user_agent, created_at, task_snapshot
+)
+SELECT
+    id, task_id, activity_type, user_id, field_name, old_value, new_value,
+    comment, ip_address, user_agent, COALESCE(created_at, CURRENT_TIMESTAMP), task_snapshot
+FROM kanban_activity_log_legacy;
+
+DROP TABLE kanban_activity_log_legacy;
+
+COMMIT;
+
+ANALYZE kanban_activity_log;
+
+DO $$
+BEGIN
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '✅ Activity Log Partitioning Migration Complete!';
+    RAISE NOTICE '========================================';
+    RAISE NOTICE 'Rows: %', (SELECT COUNT(*) FROM kanban_activity_log);
+    RAISE NOTICE 'Partitions: %', (
+        SELECT COUNT(*) FROM pg_inherits WHERE inhparent = 'kanban_activity_log'::regclass
+    );
+    RAISE NOTICE 'Schedule scripts/archive_activity_log.py to run daily.';
+    RAISE NOTICE '========================================';
+END $$;
@@ -212,7 +212,6 @@ def seed_tasks(session, users: dict[int, KanbanUser], columns: dict[str, KanbanC
         # Create task
         task = KanbanTask(
             title=title,
-            task_number=f"TASK-{i+1:04d}",
             description=description,
             column_id=columns[column_name].id,
             position=float(i),
@@ -10,6 +10,14 @@
 -- ===========================================================================
 
 -- Drop existing tables if they exist (for clean setup)
+DROP MATERIALIZED VIEW IF EXISTS mv_task_rollup;
+DROP MATERIALIZED VIEW IF EXISTS mv_user_workload;
+DROP MATERIALIZED VIEW IF EXISTS mv_overdue_tasks;
+DROP MATERIALIZED VIEW IF EXISTS mv_active_tasks;
+DROP TABLE IF EXISTS kanban_activity_log_archive CASCADE;
+DROP TABLE IF EXISTS kanban_attachments_archive CASCADE;
+DROP TABLE IF EXISTS kanban_comments_archive CASCADE;
+DROP TABLE IF EXISTS kanban_tasks_archive CASCADE;
 DROP TABLE IF EXISTS kanban_dependencies CASCADE;
 DROP TABLE IF EXISTS kanban_attachments CASCADE;
 DROP TABLE IF EXISTS kanban_comments CASCADE;
@@ -20,7 +28,10 @@ DROP TABLE IF EXISTS kanban_groups CASCADE;
 DROP TABLE IF EXISTS kanban_columns CASCADE;
 DROP TABLE IF EXISTS kanban_sessions CASCADE;
 DROP TABLE IF EXISTS kanban_settings CASCADE;
+DROP TABLE IF EXISTS kanban_task_tombstones CASCADE;
+DROP TABLE IF EXISTS kanban_report_refresh CASCADE;
 DROP TABLE IF EXISTS kanban_users CASCADE;
+DROP SEQUENCE IF EXISTS kanban_task_number_seq;
 
 -- ===========================================================================
 -- TABLE: kanban_users
@@ -117,17 +128,21 @@ CREATE INDEX idx_group_members_user_id ON kanban_group_members(user_id);
 -- ===========================================================================
 -- TABLE: kanban_tasks
 -- ===========================================================================
+-- Task numbers (TASK-0001, ...) come from this sequence via the column default
+CREATE SEQUENCE kanban_task_number_seq;
+
 CREATE TABLE kanban_tasks (
     id SERIAL PRIMARY KEY,
     
     -- Basic Info
     title VARCHAR(500) NOT NULL,
     description TEXT,
-    task_number VARCHAR(50) UNIQUE,
+    task_number VARCHAR(50) UNIQUE
+        DEFAULT 'TASK-' || to_char(nextval('kanban_task_number_seq'), 'FM99999999990000'),
     
     -- Organization
     column_id INTEGER REFERENCES kanban_columns(id) NOT NULL,
-    position REAL NOT NULL,
+    position NUMERIC(24, 12) NOT NULL,  -- fractional ordering key (midpoint inserts)
     
     -- Assignment & Ownership
     assigned_to INTEGER REFERENCES kanban_users(id),
@@ -167,7 +182,7 @@ CREATE TABLE kanban_tasks (
 );
 
 -- Indexes for performance
-CREATE INDEX idx_tasks_column ON kanban_tasks(column_id) WHERE is_deleted = FALSE;
+CREATE INDEX idx_tasks_column_position ON kanban_tasks(column_id, position, id) WHERE is_deleted = FALSE;
 CREATE INDEX idx_tasks_assigned ON kanban_tasks(assigned_to) WHERE is_deleted = FALSE;
 CREATE INDEX idx_tasks_assigned_group ON kanban_tasks(assigned_group_id) WHERE is_deleted = FALSE;
 CREATE INDEX idx_tasks_deadline ON kanban_tasks(deadline) WHERE is_deleted = FALSE;
@@ -175,17 +190,26 @@ CREATE INDEX idx_tasks_category ON kanban_tasks(category) WHERE is_deleted = FAL
 CREATE INDEX idx_tasks_status ON kanban_tasks(status) WHERE is_deleted = FALSE;
 CREATE INDEX idx_tasks_priority ON kanban_tasks(priority) WHERE is_deleted = FALSE;
 CREATE INDEX idx_tasks_created_at ON kanban_tasks(created_at);
+CREATE INDEX idx_tasks_updated_at ON kanban_tasks(updated_at);
 CREATE INDEX idx_tasks_is_deleted ON kanban_tasks(is_deleted);
 
 -- Full-text search index
+-- NOTE: TASK_SEARCH_VECTOR in kanban/manager.py must use exactly this expression
 CREATE INDEX idx_tasks_search ON kanban_tasks 
 USING gin(to_tsvector('english', title || ' ' || COALESCE(description, '')));
 
+-- Task number prefix search (LIKE 'TASK-00%')
+CREATE INDEX idx_tasks_task_number_pattern ON kanban_tasks(task_number varchar_pattern_ops);
+
 -- ===========================================================================
 -- TABLE: kanban_activity_log
 -- ===========================================================================
+-- Range-partitioned by created_at month: kanban_activity_log_YYYYMM partitions
+-- are created ahead of time by ensure_activity_log_partitions(); the default
+-- partition catches anything outside them. Old months are detached and
+-- exported by scripts/archive_activity_log.py.
 CREATE TABLE kanban_activity_log (
-    id BIGSERIAL PRIMARY KEY,
+    id BIGSERIAL,
     
     -- What happened
     task_id INTEGER REFERENCES kanban_tasks(id) ON DELETE SET NULL,
@@ -204,17 +228,48 @@ CREATE TABLE kanban_activity_log (
     ip_address VARCHAR(45),
     user_agent TEXT,
     
-    -- When
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- When (partition key)
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     
     -- Full snapshot
-    task_snapshot JSONB
-);
+    task_snapshot JSONB,
+
+    PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
+
+CREATE TABLE kanban_activity_log_default PARTITION OF kanban_activity_log DEFAULT;
+
+-- Per-task history (keyset-paged by id, newest first) and per-user activity;
+-- created_at ranges are handled by partition pruning
+CREATE INDEX idx_activity_task_id ON kanban_activity_log(task_id, id DESC);
+CREATE INDEX idx_activity_user ON kanban_activity_log(user_id, created_at);
+
+-- Monthly partitions kanban_activity_log_YYYYMM from the current month up to
+-- months_ahead months ahead. Idempotent; run daily by
+-- scripts/archive_activity_log.py (and safe to call from pg_cron).
+CREATE OR REPLACE FUNCTION ensure_activity_log_partitions(months_ahead INTEGER DEFAULT 3)
+RETURNS INTEGER AS $$
+DECLARE
+    month_start DATE;
+    partition_name TEXT;
+    created INTEGER := 0;
+BEGIN
+    FOR i IN 0..months_ahead LOOP
+        month_start := (date_trunc('month', CURRENT_DATE) + make_interval(months => i))::DATE;
+        partition_name := 'kanban_activity_log_' || to_char(month_start, 'YYYYMM');
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF kanban_activity_log FOR VALUES FROM (%L) TO (%L)',
+                partition_name, month_start, (month_start + INTERVAL '1 month')::DATE
+            );
+            created := created + 1;
+        END IF;
+    END LOOP;
+    RETURN created;
+END;
+$$ LANGUAGE plpgsql;
 
-CREATE INDEX idx_activity_task ON kanban_activity_log(task_id);
-CREATE INDEX idx_activity_user ON kanban_activity_log(user_id);
-CREATE INDEX idx_activity_type ON kanban_activity_log(activity_type);
-CREATE INDEX idx_activity_date ON kanban_activity_log(created_at);
+SELECT ensure_activity_log_partitions(3);
 
 -- ===========================================================================
 -- TABLE: kanban_comments
@@ -285,6 +340,9 @@ CREATE TABLE kanban_dependencies (
     CONSTRAINT uq_task_dependency UNIQUE(task_id, depends_on_task_id)
 );
 
+-- Reverse edge lookups (what a task unblocks); uq_task_dependency covers the forward ones
+CREATE INDEX idx_dependencies_depends_on ON kanban_dependencies(depends_on_task_id, task_id);
+
 -- ===========================================================================
 -- TABLE: kanban_sessions
 -- ===========================================================================
@@ -321,6 +379,72 @@ CREATE TABLE kanban_settings (
     modified_by INTEGER REFERENCES kanban_users(id)
 );
 
+-- Version counter for cached users/columns/groups (see bump_reference_data_version)
+INSERT INTO kanban_settings (setting_key, setting_value, description)
+VALUES ('reference_data_version', '1'::JSONB, 'Bumped by triggers when users, columns or groups change');
+
+-- Version counter for the client-side dependency graph cache (see bump_dependency_graph_version)
+INSERT INTO kanban_settings (setting_key, setting_value, description)
+VALUES ('dependency_graph_version', '1'::JSONB, 'Bumped by a trigger when task dependencies change');
+
+-- ===========================================================================
+-- TABLE: kanban_task_tombstones
+-- ===========================================================================
+-- Written by trigger_task_tombstone when a task leaves a column (deleted or
+-- moved) so board clients doing delta sync can drop stale cards.
+CREATE TABLE kanban_task_tombstones (
+    id BIGSERIAL PRIMARY KEY,
+    task_id INTEGER NOT NULL,
+    column_id INTEGER,
+    reason VARCHAR(20) NOT NULL,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_tombstones_changed_at ON kanban_task_tombstones(changed_at);
+
+-- ===========================================================================
+-- ARCHIVE TABLES (cold storage, see kanban/archive.py)
+-- ===========================================================================
+-- Long-completed, archived and soft-deleted tasks are moved here with their
+-- comments, attachment metadata and activity by scripts/archive_tasks.py, so
+-- the hot tables only hold the working set. Same columns as the hot tables
+-- (copied by name, no foreign keys) plus archived_at.
+CREATE TABLE kanban_tasks_archive (
+    LIKE kanban_tasks,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    archive_reason VARCHAR(20) NOT NULL,
+    PRIMARY KEY (id)
+);
+
+-- Same expression as idx_tasks_search so "include archived" searches use an index on both sides
+CREATE INDEX idx_tasks_archive_search ON kanban_tasks_archive
+USING gin(to_tsvector('english', title || ' ' || COALESCE(description, '')));
+CREATE INDEX idx_tasks_archive_task_number ON kanban_tasks_archive(task_number varchar_pattern_ops);
+CREATE INDEX idx_tasks_archive_assigned ON kanban_tasks_archive(assigned_to);
+CREATE INDEX idx_tasks_archive_assigned_group ON kanban_tasks_archive(assigned_group_id);
+CREATE INDEX idx_tasks_archive_created_at ON kanban_tasks_archive(created_at);
+
+CREATE TABLE kanban_comments_archive (
+    LIKE kanban_comments,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+);
+CREATE INDEX idx_comments_archive_task ON kanban_comments_archive(task_id);
+
+CREATE TABLE kanban_attachments_archive (
+    LIKE kanban_attachments,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id)
+);
+CREATE INDEX idx_attachments_archive_task ON kanban_attachments_archive(task_id);
+
+CREATE TABLE kanban_activity_log_archive (
+    LIKE kanban_activity_log,
+    archived_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, created_at)
+);
+CREATE INDEX idx_activity_archive_task_id ON kanban_activity_log_archive(task_id, id DESC);
+
 -- ===========================================================================
 -- TRIGGERS
 -- ===========================================================================
@@ -334,11 +458,167 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Server clock on insert too, so updated_at is a reliable delta-sync cursor
 CREATE TRIGGER trigger_update_task_timestamp
-BEFORE UPDATE ON kanban_tasks
+BEFORE INSERT OR UPDATE ON kanban_tasks
 FOR EACH ROW
 EXECUTE FUNCTION update_modified_timestamp();
 
+-- Column edits must be visible to delta sync as well
+CREATE OR REPLACE FUNCTION update_column_modified_timestamp()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.modified_at = CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_update_column_timestamp
+BEFORE INSERT OR UPDATE ON kanban_columns
+FOR EACH ROW
+EXECUTE FUNCTION update_column_modified_timestamp();
+
+-- Tombstones for tasks leaving a column
+CREATE OR REPLACE FUNCTION record_task_tombstone()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO kanban_task_tombstones (task_id, column_id, reason)
+        VALUES (OLD.id, OLD.column_id, 'deleted');
+        RETURN OLD;
+    END IF;
+
+    IF NEW.is_deleted AND NOT COALESCE(OLD.is_deleted, FALSE) THEN
+        INSERT INTO kanban_task_tombstones (task_id, column_id, reason)
+        VALUES (OLD.id, OLD.column_id, 'deleted');
+    ELSIF OLD.column_id IS DISTINCT FROM NEW.column_id THEN
+        INSERT INTO kanban_task_tombstones (task_id, column_id, reason)
+        VALUES (OLD.id, OLD.column_id, 'moved');
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_task_tombstone
+AFTER UPDATE OR DELETE ON kanban_tasks
+FOR EACH ROW
+EXECUTE FUNCTION record_task_tombstone();
+
+-- New/edited comments and attachments change card counts: bump the task
+CREATE OR REPLACE FUNCTION touch_parent_task()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE kanban_tasks SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.task_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_comment_touch_task
+AFTER INSERT OR UPDATE ON kanban_comments
+FOR EACH ROW
+EXECUTE FUNCTION touch_parent_task();
+
+CREATE TRIGGER trigger_attachment_touch_task
+AFTER INSERT OR UPDATE ON kanban_attachments
+FOR EACH ROW
+EXECUTE FUNCTION touch_parent_task();
+
+-- Push notifications for live board updates (LISTEN kanban_changes)
+CREATE OR REPLACE FUNCTION notify_kanban_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed RECORD;
+    payload JSON;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := OLD;
+    ELSE
+        changed := NEW;
+    END IF;
+
+    IF TG_TABLE_NAME = 'kanban_tasks' THEN
+        payload := json_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'task_id', changed.id);
+    ELSIF TG_TABLE_NAME = 'kanban_columns' THEN
+        payload := json_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'column_id', changed.id);
+    ELSE
+        payload := json_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'task_id', changed.task_id);
+    END IF;
+
+    -- Identical payloads within one transaction are delivered once
+    PERFORM pg_notify('kanban_changes', payload::TEXT);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_notify_task_change
+AFTER INSERT OR UPDATE OR DELETE ON kanban_tasks
+FOR EACH ROW
+EXECUTE FUNCTION notify_kanban_change();
+
+CREATE TRIGGER trigger_notify_comment_change
+AFTER INSERT OR UPDATE OR DELETE ON kanban_comments
+FOR EACH ROW
+EXECUTE FUNCTION notify_kanban_change();
+
+CREATE TRIGGER trigger_notify_column_change
+AFTER INSERT OR UPDATE OR DELETE ON kanban_columns
+FOR EACH ROW
+EXECUTE FUNCTION notify_kanban_change();
+
+-- Reference data version (users, columns, groups) for the client-side
+-- reference cache: bumped once per statement that changes those tables
+CREATE OR REPLACE FUNCTION bump_reference_data_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE kanban_settings
+    SET setting_value = to_jsonb(COALESCE((setting_value #>> '{}')::BIGINT, 0) + 1),
+        modified_at = CURRENT_TIMESTAMP
+    WHERE setting_key = 'reference_data_version';
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Only columns shown in pickers/cards; last_login and password changes don't count
+CREATE TRIGGER trigger_users_reference_version
+AFTER INSERT OR DELETE OR UPDATE OF username, display_name, email, role, avatar_color, department, is_active
+ON kanban_users
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_reference_data_version();
+
+CREATE TRIGGER trigger_columns_reference_version
+AFTER INSERT OR UPDATE OR DELETE ON kanban_columns
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_reference_data_version();
+
+CREATE TRIGGER trigger_groups_reference_version
+AFTER INSERT OR UPDATE OR DELETE ON kanban_groups
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_reference_data_version();
+
+CREATE TRIGGER trigger_group_members_reference_version
+AFTER INSERT OR UPDATE OR DELETE ON kanban_group_members
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_reference_data_version();
+
+-- Dependency graph version for the client-side graph cache: bumped once per
+-- statement that changes kanban_dependencies (including cascaded deletes)
+CREATE OR REPLACE FUNCTION bump_dependency_graph_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE kanban_settings
+    SET setting_value = to_jsonb(COALESCE((setting_value #>> '{}')::BIGINT, 0) + 1),
+        modified_at = CURRENT_TIMESTAMP
+    WHERE setting_key = 'dependency_graph_version';
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_dependencies_graph_version
+AFTER INSERT OR UPDATE OR DELETE ON kanban_dependencies
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_dependency_graph_version();
+
 -- Auto-log task changes
 CREATE OR REPLACE FUNCTION log_task_changes()
 RETURNS TRIGGER AS $$
@@ -433,6 +713,150 @@ WHERE u.is_active = TRUE
 GROUP BY u.id, u.display_name
 ORDER BY active_tasks DESC;
 
+-- ===========================================================================
+-- MATERIALIZED REPORTING VIEWS
+-- ===========================================================================
+-- Snapshots of the reporting views above, refreshed by
+-- refresh_kanban_reporting_views() (called by the app after a number of task
+-- writes and every few minutes). Every view has a unique index so it can be
+-- refreshed CONCURRENTLY without blocking readers.
+
+-- Report refresh bookkeeping (single row)
+CREATE TABLE kanban_report_refresh (
+    id INTEGER PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    refreshed_at TIMESTAMP
+);
+INSERT INTO kanban_report_refresh (id, refreshed_at) VALUES (1, CURRENT_TIMESTAMP)
+ON CONFLICT (id) DO NOTHING;
+
+-- Active tasks (materialized v_active_tasks)
+CREATE MATERIALIZED VIEW mv_active_tasks AS
+SELECT 
+    t.id,
+    t.task_number,
+    t.title,
+    t.priority,
+    t.category,
+    t.deadline,
+    t.created_at,
+    t.assigned_to,
+    t.assigned_group_id,
+    c.name AS column_name,
+    c.color AS column_color,
+    u.display_name AS assigned_to_name,
+    creator.display_name AS created_by_name,
+    (SELECT COUNT(*) FROM kanban_comments WHERE task_id = t.id AND is_deleted = FALSE) AS comment_count,
+    (SELECT COUNT(*) FROM kanban_attachments WHERE task_id = t.id AND is_deleted = FALSE) AS attachment_count
+FROM kanban_tasks t
+LEFT JOIN kanban_columns c ON t.column_id = c.id
+LEFT JOIN kanban_users u ON t.assigned_to = u.id
+LEFT JOIN kanban_users creator ON t.created_by = creator.id
+WHERE t.is_deleted = FALSE AND c.is_active = TRUE;
+
+CREATE UNIQUE INDEX idx_mv_active_tasks_id ON mv_active_tasks(id);
+CREATE INDEX idx_mv_active_tasks_column ON mv_active_tasks(column_name);
+CREATE INDEX idx_mv_active_tasks_assigned ON mv_active_tasks(assigned_to);
+
+-- Overdue tasks (materialized v_overdue_tasks)
+CREATE MATERIALIZED VIEW mv_overdue_tasks AS
+SELECT 
+    t.id,
+    t.task_number,
+    t.title,
+    t.priority,
+    t.deadline,
+    t.assigned_to,
+    t.assigned_group_id,
+    c.name AS column_name,
+    u.display_name AS assigned_to_name
+FROM kanban_tasks t
+JOIN kanban_columns c ON t.column_id = c.id
+LEFT JOIN kanban_users u ON t.assigned_to = u.id
+WHERE t.is_deleted = FALSE
+  AND c.is_active = TRUE
+  AND c.name != 'Done'
+  AND t.deadline < CURRENT_DATE;
+
+CREATE UNIQUE INDEX idx_mv_overdue_tasks_id ON mv_overdue_tasks(id);
+CREATE INDEX idx_mv_overdue_tasks_deadline ON mv_overdue_tasks(deadline);
+
+-- User workload (materialized v_user_workload)
+CREATE MATERIALIZED VIEW mv_user_workload AS
+SELECT 
+    u.id AS user_id,
+    u.display_name,
+    COUNT(t.id) AS active_tasks,
+    SUM(CASE WHEN t.priority = 'critical' THEN 1 ELSE 0 END) AS critical_tasks,
+    SUM(CASE WHEN t.deadline < CURRENT_DATE THEN 1 ELSE 0 END) AS overdue_tasks
+FROM kanban_users u
+LEFT JOIN kanban_tasks t ON u.id = t.assigned_to AND t.is_deleted = FALSE
+WHERE u.is_active = TRUE
+GROUP BY u.id, u.display_name;
+
+CREATE UNIQUE INDEX idx_mv_user_workload_user ON mv_user_workload(user_id);
+
+-- Daily task rollup per assignee/group, used by the Reports tab
+-- (task statistics and team performance). 0 = unassigned / no group.
+CREATE MATERIALIZED VIEW mv_task_rollup AS
+SELECT
+    t.created_at::date AS created_on,
+    COALESCE(t.assigned_to, 0) AS assignee_id,
+    COALESCE(t.assigned_group_id, 0) AS group_id,
+    COUNT(*) AS total_tasks,
+    COUNT(*) FILTER (WHERE c.name = 'Done') AS done_tasks,
+    COUNT(*) FILTER (WHERE c.name = 'Done' AND c.is_active = TRUE) AS completed_tasks,
+    COUNT(*) FILTER (WHERE c.name = 'In Progress' AND c.is_active = TRUE) AS in_progress_tasks,
+    COUNT(*) FILTER (
+        WHERE t.deadline < CURRENT_DATE
+          AND c.name != 'Done'
+          AND t.status IS DISTINCT FROM 'archived'
+    ) AS overdue_tasks,
+    COUNT(*) FILTER (
+        WHERE c.name = 'Done' AND t.deadline IS NOT NULL AND t.completed_at IS NOT NULL
+    ) AS with_deadline,
+    COUNT(*) FILTER (
+        WHERE c.name = 'Done' AND t.deadline IS NOT NULL AND t.completed_at IS NOT NULL
+          AND t.completed_at::date <= t.deadline
+    ) AS on_time,
+    COUNT(*) FILTER (WHERE c.name = 'Done' AND t.completed_at IS NOT NULL) AS completed_with_date,
+    COALESCE(SUM(t.completed_at::date - t.created_at::date)
+             FILTER (WHERE c.name = 'Done' AND t.completed_at IS NOT NULL), 0) AS completion_days
+FROM kanban_tasks t
+JOIN kanban_columns c ON t.column_id = c.id
+WHERE t.is_deleted = FALSE
+GROUP BY 1, 2, 3;
+
+CREATE UNIQUE INDEX idx_mv_task_rollup_key ON mv_task_rollup(created_on, assignee_id, group_id);
+CREATE INDEX idx_mv_task_rollup_assignee ON mv_task_rollup(assignee_id, created_on);
+CREATE INDEX idx_mv_task_rollup_group ON mv_task_rollup(group_id, created_on);
+
+-- Refresh all reporting views. Skips (returns FALSE) when another session
+-- is already refreshing or the last refresh is younger than min_age, so
+-- several clients can call it on a timer without piling up.
+CREATE OR REPLACE FUNCTION refresh_kanban_reporting_views(min_age INTERVAL DEFAULT INTERVAL '0')
+RETURNS BOOLEAN AS $$
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('kanban_reporting_refresh')) THEN
+        RETURN FALSE;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM kanban_report_refresh
+        WHERE id = 1 AND refreshed_at > clock_timestamp() - min_age
+    ) THEN
+        RETURN FALSE;
+    END IF;
+
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_active_tasks;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_overdue_tasks;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_user_workload;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_task_rollup;
+
+    UPDATE kanban_report_refresh SET refreshed_at = clock_timestamp() WHERE id = 1;
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql;
+
 -- ===========================================================================
 -- COMPLETION MESSAGE
 -- ===========================================================================
@@ -441,21 +865,26 @@ BEGIN
     RAISE NOTICE '========================================';
     RAISE NOTICE 'Kanban Database Schema Setup Complete!';
     RAISE NOTICE '========================================';
-    RAISE NOTICE 'Tables created: 11';
+    RAISE NOTICE 'Tables created: 17';
     RAISE NOTICE '  - kanban_users';
     RAISE NOTICE '  - kanban_groups';
     RAISE NOTICE '  - kanban_group_members';
     RAISE NOTICE '  - kanban_columns';
     RAISE NOTICE '  - kanban_tasks';
-    RAISE NOTICE '  - kanban_activity_log';
+    RAISE NOTICE '  - kanban_activity_log (partitioned by month)';
     RAISE NOTICE '  - kanban_comments';
     RAISE NOTICE '  - kanban_attachments';
     RAISE NOTICE '  - kanban_dependencies';
     RAISE NOTICE '  - kanban_sessions';
     RAISE NOTICE '  - kanban_settings';
+    RAISE NOTICE '  - kanban_task_tombstones';
+    RAISE NOTICE '  - kanban_report_refresh';
+    RAISE NOTICE '  - kanban_tasks_archive, kanban_comments_archive,';
+    RAISE NOTICE '    kanban_attachments_archive, kanban_activity_log_archive';
     RAISE NOTICE 'Indexes created: 25+';
-    RAISE NOTICE 'Triggers created: 2';
+    RAISE NOTICE 'Triggers created: 15';
     RAISE NOTICE 'Views created: 3';
+    RAISE NOTICE 'Materialized views created: 4';
     RAISE NOTICE '';
     RAISE NOTICE 'Next steps:';
     RAISE NOTICE '1. Run seed_kanban_data.py to populate initial data';
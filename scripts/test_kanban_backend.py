@@ -3,15 +3,20 @@
 from __future__ import annotations
 
 import sys
-from datetime import date, timedelta
+import tempfile
+from datetime import date, datetime, timedelta
+from decimal import Decimal
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from kanban.audit_logger import AuditLogger
 from kanban.auth import authenticate, AuthenticationError, change_password
 from kanban.database import get_db_manager
+from kanban.local_replica import LocalReplica, ReplicaSyncWorker
 from kanban.manager import KanbanManager
+from kanban.synthetic_data import copy_value
 
 
 def test_connection():
@@ -240,6 +245,331 @@ def test_statistics(manager: KanbanManager):
         return False
 
 
+def _delete_test_tasks(manager: KanbanManager, task_ids: list[int]) -> None:
+    """Hard-delete tasks created by a test (ignores ones already gone)."""
+    for task_id in task_ids:
+        try:
+            manager.delete_task(task_id, hard_delete=True)
+        except ValueError:
+            pass
+
+
+def test_delta_sync(manager: KanbanManager):
+    """Test incremental sync: changed tasks and tombstoned tasks since a cursor."""
+    print("\nTest 8: Delta Sync")
+    print("-" * 40)
+
+    created = []
+    try:
+        column = manager.get_all_columns()[0]
+        cursor = manager.get_board_snapshot(page_size=1).synced_at
+
+        changed = manager.create_task(title="Delta Sync Test (changed)", column_id=column.id)
+        created.append(changed.id)
+        manager.update_task(changed.id, priority="high")
+        removed = manager.create_task(title="Delta Sync Test (removed)", column_id=column.id)
+        created.append(removed.id)
+
+        changes = manager.get_changes_since(cursor)
+        cards = {card.id: card for card in changes.tasks}
+        if changed.id not in cards or cards[changed.id].priority != "high":
+            print("❌ Updated task missing from the changes")
+            return False
+        print(f"✅ {len(changes.tasks)} changed tasks since the snapshot, update included")
+
+        manager.delete_task(removed.id, hard_delete=True)
+        changes = manager.get_changes_since(changes.cursor)
+        if removed.id not in changes.removed_task_ids:
+            print("❌ Hard-deleted task not reported through its tombstone")
+            return False
+        if removed.id in {card.id for card in changes.tasks}:
+            print("❌ Hard-deleted task still returned as a card")
+            return False
+        print("✅ Hard-deleted task reported in removed_task_ids")
+
+        manager.delete_task(changed.id)
+        changes = manager.get_changes_since(changes.cursor)
+        if changed.id not in changes.removed_task_ids:
+            print("❌ Soft-deleted task not reported as removed")
+            return False
+        print("✅ Soft-deleted task reported in removed_task_ids")
+
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+    finally:
+        _delete_test_tasks(manager, created)
+
+
+def test_card_positions(manager: KanbanManager):
+    """Test fractional card positions: Decimal midpoint reorders and column rebalancing."""
+    print("\nTest 9: Card Positions")
+    print("-" * 40)
+
+    created = []
+    try:
+        column = manager.get_all_columns()[0]
+        first, second, third = (
+            manager.create_task(title=f"Position Test {number}", column_id=column.id) for number in (1, 2, 3)
+        )
+        created.extend([first.id, second.id, third.id])
+        if not (isinstance(first.position, Decimal) and second.position - first.position == Decimal("1")):
+            print(f"❌ Appends should step by 1 as Decimal, got {first.position!r} and {second.position!r}")
+            return False
+        print(f"✅ Appended at {first.position}, {second.position}, {third.position}")
+
+        position = manager.reorder_task(third.id, before_task_id=second.id)
+        expected = (first.position + second.position) / 2
+        if position != expected:
+            print(f"❌ Expected the midpoint {expected}, got {position}")
+            return False
+        print(f"✅ Reordered to the midpoint {position}")
+
+        manager.rebalance_column(column.id)
+        positions = {task_id: manager.get_task(task_id).position for task_id in created}
+        if not positions[first.id] < positions[third.id] < positions[second.id]:
+            print(f"❌ Rebalance changed the order: {positions}")
+            return False
+        if any(value != value.to_integral_value() for value in positions.values()):
+            print(f"❌ Rebalance should renumber to whole steps: {positions}")
+            return False
+        print(f"✅ Rebalanced to {sorted(positions.values())} with the order kept")
+
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+    finally:
+        _delete_test_tasks(manager, created)
+
+
+def test_keyset_pagination(manager: KanbanManager):
+    """Test keyset-paged column loading: every card exactly once, in (position, id) order."""
+    print("\nTest 10: Keyset Pagination")
+    print("-" * 40)
+
+    created = []
+    try:
+        column = manager.get_all_columns()[0]
+        for number in range(5):
+            created.append(manager.create_task(title=f"Paging Test {number}", column_id=column.id).id)
+
+        page = manager.get_tasks_by_column_page(column.id, limit=2, include_total=True)
+        total = page.total
+        cards = list(page.tasks)
+        pages = 1
+        while page.has_more:
+            page = manager.get_tasks_by_column_page(column.id, after=page.next_cursor, limit=2)
+            cards.extend(page.tasks)
+            pages += 1
+
+        ids = [card.id for card in cards]
+        if len(ids) != len(set(ids)) or len(ids) != total:
+            print(f"❌ Expected {total} distinct cards, got {len(ids)} ({len(set(ids))} distinct)")
+            return False
+        keys = [(card.position, card.id) for card in cards]
+        if keys != sorted(keys):
+            print("❌ Pages are not in (position, id) order")
+            return False
+        if not set(created) <= set(ids):
+            print("❌ New tasks missing from the pages")
+            return False
+        print(f"✅ {total} cards over {pages} pages, no gaps or duplicates")
+
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+    finally:
+        _delete_test_tasks(manager, created)
+
+
+def test_snapshot_replay(manager: KanbanManager):
+    """Test task history reconstruction from checkpoint + delta snapshots."""
+    print("\nTest 11: Snapshot Replay")
+    print("-" * 40)
+
+    created = []
+    try:
+        replayed = AuditLogger.replay_snapshots([
+            {"v": 2, "seq": 1, "kind": "checkpoint", "state": {"title": "A", "priority": "low"}},
+            {"v": 2, "seq": 2, "kind": "delta", "set": {"priority": "high"}},
+            {"v": 2, "seq": 3, "kind": "delta", "set": {"title": "B"}},
+        ])
+        if replayed != {"title": "B", "priority": "high"}:
+            print(f"❌ Replay gave {replayed}")
+            return False
+        if AuditLogger.replay_snapshots([{"v": 2, "seq": 2, "kind": "delta", "set": {"priority": "high"}}]) is not None:
+            print("❌ Deltas without a checkpoint should not replay")
+            return False
+        print("✅ Checkpoint + deltas replay in order")
+
+        column = manager.get_all_columns()[0]
+        task = manager.create_task(title="Snapshot Test", column_id=column.id, priority="low")
+        created.append(task.id)
+        manager.update_task(task.id, priority="high")
+        manager.update_task(task.id, priority="critical")
+
+        activities = manager.get_task_activity(task.id).activities
+        first_update = next(
+            activity for activity in activities if activity.field_name == "priority" and activity.new_value == "high"
+        )
+        then = manager.get_task_state_at(task.id, first_update.id)
+        now = manager.get_task_state_at(task.id)
+        if not then or then.get("priority") != "high":
+            print(f"❌ State at the first update should have priority 'high', got {then and then.get('priority')}")
+            return False
+        if not now or now.get("priority") != "critical":
+            print(f"❌ Latest state should have priority 'critical', got {now and now.get('priority')}")
+            return False
+        print("✅ get_task_state_at reconstructs both the earlier and the latest state")
+
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+    finally:
+        _delete_test_tasks(manager, created)
+
+
+def test_dependency_cycles(manager: KanbanManager):
+    """Test that blocking dependencies cannot form a cycle."""
+    print("\nTest 12: Dependency Cycles")
+    print("-" * 40)
+
+    created = []
+    try:
+        column = manager.get_all_columns()[0]
+        first, second, third = (
+            manager.create_task(title=f"Dependency Test {number}", column_id=column.id) for number in (1, 2, 3)
+        )
+        created.extend([first.id, second.id, third.id])
+
+        # third waits on second, second waits on first
+        manager.add_dependency(second.id, first.id)
+        manager.add_dependency(third.id, second.id)
+        print("✅ Added chain first <- second <- third")
+
+        for task_id, depends_on_task_id in ((first.id, third.id), (first.id, first.id)):
+            try:
+                manager.add_dependency(task_id, depends_on_task_id)
+            except ValueError as e:
+                print(f"✅ Rejected {task_id} -> {depends_on_task_id}: {e}")
+            else:
+                print(f"❌ Dependency {task_id} -> {depends_on_task_id} should have been rejected")
+                return False
+
+        # Only "blocks" edges are kept acyclic
+        manager.add_dependency(first.id, third.id, dependency_type="relates_to")
+        print("✅ Non-blocking link back along the chain allowed")
+
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+    finally:
+        _delete_test_tasks(manager, created)
+
+
+def test_replica_conflicts(manager: KanbanManager):
+    """Test replaying queued replica moves and rejecting conflicting ones."""
+    print("\nTest 13: Replica Conflicts")
+    print("-" * 40)
+
+    created = []
+    replica = None
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            columns = manager.get_all_columns()
+            if len(columns) < 3:
+                print("⚠️  Need at least three columns, skipping")
+                return True
+            task = manager.create_task(title="Replica Test Task", column_id=columns[0].id)
+            created.append(task.id)
+
+            replica = LocalReplica(str(Path(directory) / "replica.sqlite3"))
+            worker = ReplicaSyncWorker(replica, manager)
+            worker.sync_once()
+            replica.refresh_cards([task.id], manager.get_task_cards([task.id]))
+
+            # A queued move nobody else touched is replayed
+            worker.queue_move(task.id, columns[1].id)
+            result = worker.sync_once()
+            if result.applied != 1 or manager.get_task(task.id).column_id != columns[1].id:
+                print(f"❌ Queued move not replayed: applied={result.applied}, error={result.error}")
+                return False
+            print("✅ Queued move replayed on the server")
+
+            # Someone else moves the card while a local move is still queued
+            worker.queue_move(task.id, columns[2].id)
+            manager.move_task(task.id, columns[0].id)
+            result = worker.sync_once()
+            if [write.task_id for write in result.conflicts] != [task.id]:
+                print(f"❌ Expected a conflict for task {task.id}, got {result.conflicts}")
+                return False
+            if manager.get_task(task.id).column_id != columns[0].id:
+                print("❌ Conflicting move overwrote the server's move")
+                return False
+            cards = replica.changes_for([task.id]).tasks
+            if not cards or cards[0].column_id != columns[0].id:
+                print("❌ Replica card not restored to the server's column")
+                return False
+            print(f"✅ Conflict detected: {result.conflicts[0].last_error}")
+            print("✅ Replica card restored to the server's column")
+
+            # Deleted tasks always conflict; an update that did not move the card does not
+            write = result.conflicts[0]
+            if ReplicaSyncWorker._conflict(write, None) != "Task was deleted":
+                print("❌ Write against a deleted task not rejected")
+                return False
+            later = write.base_updated_at + timedelta(minutes=1)
+            if ReplicaSyncWorker._conflict(write, (later, write.base_column_id)) is not None:
+                print("❌ Update in the same column treated as a conflict")
+                return False
+            print("✅ Conflict rules for deleted and same-column tasks")
+
+            return True
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            return False
+        finally:
+            if replica is not None:
+                replica.close()
+            _delete_test_tasks(manager, created)
+
+
+def test_copy_value():
+    """Test the COPY text-format encoder used by the synthetic data loader."""
+    print("\nTest 14: COPY Encoder")
+    print("-" * 40)
+
+    cases = [
+        (None, "\\N"),
+        (True, "t"),
+        (False, "f"),
+        (42, "42"),
+        (Decimal("1.500000000000"), "1.500000000000"),
+        (date(2024, 3, 1), "2024-03-01"),
+        (datetime(2024, 3, 1, 9, 30), "2024-03-01 09:30:00"),
+        ("tab\tnew\nline\rend", "tab\\tnew\\nline\\rend"),
+        ("C:\\path", "C:\\\\path"),
+        (["bug", "ui"], '{"bug","ui"}'),
+        (['say "hi"', None], '{"say \\\\"hi\\\\"",NULL}'),
+        ([], "{}"),
+    ]
+    failed = False
+    for value, expected in cases:
+        encoded = copy_value(value)
+        if encoded != expected:
+            print(f"❌ {value!r} encoded as {encoded!r}, expected {expected!r}")
+            failed = True
+    if failed:
+        return False
+    print(f"✅ {len(cases)} values encoded for COPY")
+    return True
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -279,6 +609,13 @@ def main():
         ("Task Movement", lambda: test_task_movement(manager)),
         ("Comments", lambda: test_comments(manager)),
         ("Statistics", lambda: test_statistics(manager)),
+        ("Delta Sync", lambda: test_delta_sync(manager)),
+        ("Card Positions", lambda: test_card_positions(manager)),
+        ("Keyset Pagination", lambda: test_keyset_pagination(manager)),
+        ("Snapshot Replay", lambda: test_snapshot_replay(manager)),
+        ("Dependency Cycles", lambda: test_dependency_cycles(manager)),
+        ("Replica Conflicts", lambda: test_replica_conflicts(manager)),
+        ("COPY Encoder", test_copy_value),
     ]
 
     results = []